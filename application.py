@@ -8,15 +8,59 @@ Application class to store properties of the application being created
 """
 
 
-import os, sys, random, re, logging, time
+import os, sys, re, logging, time, types
+from collections import OrderedDict
 import wx
 
-import common, config, misc, compat, clipboard
+import common, config, misc, compat, clipboard, tracing, search
 import bugdialog
 import new_properties as np
 
 
 
+# cache for preview code; see Application._get_preview_code()
+_PREVIEW_FILENAME = "_wxglade_preview.py"  # not written; just used as key for the code generator
+_PREVIEW_CACHE_SIZE = 20
+_preview_code_cache = OrderedDict()    # hash of generated source -> (code object, have_extracode)
+_preview_widget_cache = OrderedDict()  # hash of widget XML -> hash of generated source
+
+
+class NodeIndex(object):
+    "maps keys like class names to the set of nodes using them, for uniqueness checks in constant time"
+    def __init__(self):
+        self._nodes = {}  # key -> set of nodes
+        self._keys = {}   # node -> key
+
+    def __contains__(self, node):
+        return node in self._keys
+
+    def set(self, node, key):
+        "add or update node; key None to remove"
+        old = self._keys.get(node)
+        if old==key: return
+        if old is not None:
+            nodes = self._nodes[old]
+            nodes.discard(node)
+            if not nodes: del self._nodes[old]
+        if key is None:
+            del self._keys[node]
+            return
+        self._keys[node] = key
+        self._nodes.setdefault(key, set()).add(node)
+
+    def remove(self, node):
+        self.set(node, None)
+
+    def get(self, key):
+        "returns the nodes for key; the caller has to check whether they are still matching, e.g. after set_temp"
+        return self._nodes.get(key, ())
+
+
+class CodeGenerationError(ValueError):
+    "the project is not complete or the code writer reported a problem; the message is meant for the user"
+    pass
+
+
 class FileDirDialog(object):
     """Custom class which displays a FileDialog or a DirDialog, according to the value of the
     Application.multiple_files of its parent (instance of Application).
@@ -96,12 +140,29 @@ class EditRoot(np.PropertyOwner):
                 self.children.insert(index, child)
         if child.IS_TOPLEVEL_WINDOW:
             self.add_top_window(child.name)
+        self.toplevel_name_index.set(child, child.name)
 
     def remove_item(self, child, level=0, dummy=False):
         if child.IS_TOPLEVEL_WINDOW:
             self.remove_top_window(child.name)
         self.children.remove(child)
-
+        self.toplevel_name_index.remove(child)
+
+    def update_class_index(self, node, klass):
+        "called from ClassProperty when the class name of node has been set; klass is None when node is removed"
+        self.class_index.set(node, klass)
+        # module-qualified names like 'module.MyClass' are also indexed by their leaf name
+        leaf = klass.rsplit(".",1)[-1]  if klass and "." in klass else  None
+        self.class_leaf_index.set(node, leaf)
+
+    def update_node_indices(self, node):
+        "called from properties_changed, as e.g. un-do and re-do set the values of name and class directly"
+        if node in self.toplevel_name_index:
+            self.toplevel_name_index.set(node, node.name)
+        if "class" in node.properties:
+            self.update_class_index(node, node.properties["class"].value or None)
+
+    @tracing.traced("Application.write")
     def write(self, output, tabs=0):
         """Writes the xml equivalent of this tree to the given output file.
         This function writes unicode to the outfile."""
@@ -136,20 +197,49 @@ class EditRoot(np.PropertyOwner):
         output.extend( common.format_xml_tag( u'application', inner_xml, is_xml=True, **attrs ) )
 
     def find_widget_from_path(self, path):
+        # the path index is checked against the current path, so renamed or moved widgets are found again;
+        # e.g. the history resolves the same paths many times
+        w = self._path_index.get(path)
+        if w is not None:
+            try:
+                if w.get_path()==path: return w
+            except ValueError:
+                pass  # a slot that is not in its parent's children any more
+        w = self._find_widget_from_path(path)
+        if w is not None:
+            old = self._widget_paths.get(w)
+            if old is not None and self._path_index.get(old) is w: del self._path_index[old]
+            self._widget_paths.pop(self._path_index.get(path), None)  # e.g. a replaced slot
+            self._path_index[path] = w
+            self._widget_paths[w] = path
+        return w
+
+    def _find_widget_from_path(self, path):
         path = path.split("/")
-        index = 1  # skip 'app'
         w = self
-        for index in range(1, len(path)):
+        for index in range(1, len(path)):  # skip 'app'
             if path[index].startswith("SLOT "):
                 pos = int(path[index].split(" ")[1])
                 if pos<len(w.children) and w.children[pos].IS_SLOT:
                     w = w.children[pos]
                     continue
-            children = [c for c in w.get_all_children() if c.name==path[index]]
+            if w is self:
+                # the index is kept up to date by add_item, remove_item and update_node_indices
+                children = [c for c in self.toplevel_name_index.get(path[index]) if c.name==path[index]]
+                if config.debugging:
+                    scanned = [c for c in self.children if c is not None and c.name==path[index]]
+                    assert set(children)==set(scanned), "toplevel name index out of date for %s"%path[index]
+            else:
+                children = [c for c in w.get_all_children() if c.name==path[index]]
             if not children: return None
             w = children[0]
         return w
 
+    def forget_widget_path(self, widget):
+        "called when widget is removed"
+        path = self._widget_paths.pop(widget, None)
+        if path is not None and self._path_index.get(path) is widget: del self._path_index[path]
+
     def clear(self):
         # delete all children; call common.root.new() or .init() afterwards
         while self.children:
@@ -162,6 +252,9 @@ class EditRoot(np.PropertyOwner):
         return None
 
     # use following to track toplevel windows?
+    def defer_child_widgets(self, child, level):
+        return False
+
     def child_widget_created(self, child, level):
         pass
 
@@ -255,60 +348,72 @@ class Application(EditRoot):
         self.__filename = None  # raw value for the self.filename property; Name of the output XML file
 
         # initialise instance properties
-        self.is_template = np.Property(False)  # hidden property
+        self.add_property( "is_template", np.Property(False) )  # hidden property
         # name and derived class name, including validation
-        self.name  = np.TextPropertyA("app",   default_value="")
-        self.klass = np.TextPropertyA("MyApp", default_value="", name="class")
+        self.add_property( "name",  np.TextPropertyA("app",   default_value="") )
+        self.add_property( "klass", np.TextPropertyA("MyApp", default_value="", name="class") )
         self.properties["name"].validation_re = re.compile(r'^[a-zA-Z]+[\w0-9-]*$')
         self.properties["class"].validation_re = re.compile(r'^[a-zA-Z]+[\w:.0-9-]*$')
 
         # generate separate file for each class?
         labels   = [_("Single file"),                       _("Separate file for each class") ]
         tooltips = [_("Write all source code in one file"), _("Split source code in one file per class / widget") ]
-        self.multiple_files = np.RadioProperty( config.default_multiple_files,
-                                                values=[0,1], labels=labels, tooltips=tooltips )
+        self.add_property( "multiple_files", np.RadioProperty( config.default_multiple_files,
+                                                                values=[0,1], labels=labels, tooltips=tooltips ) )
 
         # code indentation: mode and count
-        self.indent_mode   = np.RadioProperty( 1, [0,1], ["Tabs","Spaces"], aliases=["tab","space"], columns=2 )
-        self.indent_amount = np.SpinProperty( config.default_indent_amount, val_range=(1, 100) )
+        self.add_property( "indent_mode",   np.RadioProperty( 1, [0,1], ["Tabs","Spaces"], aliases=["tab","space"],
+                                                               columns=2 ) )
+        self.add_property( "indent_amount", np.SpinProperty( config.default_indent_amount, val_range=(1, 100) ) )
         # C++ file extension
-        self.source_extension = np.TextProperty('cpp')
-        self.header_extension = np.TextProperty('h')
+        self.add_property( "source_extension", np.TextProperty('cpp') )
+        self.add_property( "header_extension", np.TextProperty('h') )
         # output path: file or directory, depening on 'multiple_files'
         output_path = config.default_output_path  if self.multiple_files else  config.default_output_file
-        self.output_path = OutputPathProperty(output_path, style=wx.FD_SAVE|wx.FD_OVERWRITE_PROMPT)
+        self.add_property( "output_path", OutputPathProperty(output_path, style=wx.FD_SAVE|wx.FD_OVERWRITE_PROMPT) )
         self._update_output_path('python')
 
-        self.overwrite = np.InvCheckBoxProperty(config.default_overwrite)
+        self.add_property( "overwrite", np.InvCheckBoxProperty(config.default_overwrite) )
         # YYY 
-        self.mark_blocks = np.CheckBoxProperty(True)
+        self.add_property( "mark_blocks", np.CheckBoxProperty(True) )
 
         # output language
         languages = sorted( common.code_writers.keys() )
         labels = [misc.capitalize(s) for s in languages]
-        self.language = np.RadioProperty('python', languages, labels, columns=3)
+        self.add_property( "language", np.RadioProperty('python', languages, labels, columns=3) )
 
         # gettext?
-        self.use_gettext = np.CheckBoxProperty(config.default_use_gettext)
+        self.add_property( "use_gettext", np.CheckBoxProperty(config.default_use_gettext) )
         # wx Version: string of major dot minor version number
         version = "%d.%d"%compat.version
         if not version in self.all_supported_versions:
             version = "2.8"  if version[0]=="2" else  "3.0"
-        self.for_version = np.RadioProperty( version, self.all_supported_versions, tooltips=self._VERSION_TOOLTIPS)
+        self.add_property( "for_version", np.RadioProperty( version, self.all_supported_versions,
+                                                            tooltips=self._VERSION_TOOLTIPS) )
 
         # encoding
         encodings = ["UTF-8", "ISO-8859-1", "ISO-8859-15", "CP1252"]  # just some common values
-        self.encoding = np.ComboBoxProperty(config.default_encoding, encodings)
+        self.add_property( "encoding", np.ComboBoxProperty(config.default_encoding, encodings) )
 
         # top window name for the generated app
-        self.top_window = prop = np.ListBoxProperty("", choices=[])
+        prop = self.add_property( "top_window", np.ListBoxProperty("", choices=[]) )
         prop.auto_activated = True
-        self.generate_code = np.ActionButtonProperty(self.generate_code)
+        self.add_property( "generate_code", np.ActionButtonProperty(self.generate_code) )
 
         self.widget = None  # always None, just to keep interface to Tree similar to other editors
         self.children = []  # the toplevel windows
         self.node = None
 
+        # project-wide indices for NameProperty and ClassProperty uniqueness checks
+        self.toplevel_name_index = NodeIndex()
+        self.class_index = NodeIndex()
+        self.class_leaf_index = NodeIndex()
+        # name, class, label and handler names of all widgets, for search.find()
+        self.search_index = search.SearchIndex()
+        # path -> widget and widget -> path, for find_widget_from_path
+        self._path_index = {}
+        self._widget_paths = {}
+
     def set_for_version(self, value):
         self.for_version = self.for_version_prop.get_string_value()
 
@@ -497,8 +602,9 @@ class Application(EditRoot):
         self._init()
         self.properties_changed(None)
 
-    def generate_code(self, preview=False, out_path=None, widget=None):
-        np.flush_current_property()
+    def _generate_code(self, preview=False, out_path=None, widget=None, dry_run=False, previous_contents=None):
+        """Generate code and return the code writer; used by generate_code() and wxglade.generate_code_in_memory().
+        Raises CodeGenerationError if the project is not complete or if the code writer reports a problem."""
         if out_path is None:
             out_path = os.path.expanduser(self.output_path.strip())
             if not out_path and self.multiple_files: out_path = "."
@@ -510,31 +616,44 @@ class Application(EditRoot):
             msg = "You must specify an output file before generating any code."
             if not self.filename:
                 msg += "\nFor relative file names, the project needs to be saved first."
-            return misc.error_message( msg )
+            raise CodeGenerationError(msg)
 
         name_p = self.properties["name"]
         class_p = self.properties["class"]
         if self.language != "XRC":
             if not preview and ( name_p.is_active() or class_p.is_active() ) and not self.top_window:
-                return misc.error_message( "Please select a top window for the application or deactivate "
+                raise CodeGenerationError( "Please select a top window for the application or deactivate "
                                            "the Name and Class properties for Application.\n"
-                                           "In that case, only code for the windows will be generated, not for the "
-                                           "application." )
+                                           "In that case, only code for the windows will be generated, not for "
+                                           "the application." )
 
         if preview:
             writer = common.code_writers["preview"]
         else:
             writer = common.code_writers[self.language]
 
-        error = writer.new_project(self, out_path, preview)
+        error = writer.new_project(self, out_path, preview, dry_run, previous_contents)
         if error:
             # prerequisites were checked and there is a problem
-            misc.error_message( _("Error generating code:\n%s")%error )
-            return
+            raise CodeGenerationError( _("Error generating code:\n%s")%error )
 
         try:
             writer.generate_code(self, widget)
             writer.finalize()
+        finally:
+            writer.clean_up(widget or self)
+        return writer
+
+    def generate_code(self, preview=False, out_path=None, widget=None, dry_run=False, previous_contents=None):
+        """Generate code for the application or, for preview, for a single widget.
+        With dry_run, no files are written; a list of tuples (filename, changed, diff) will be returned instead;
+        see codegen.BaseLangCodeWriter.get_dry_run_results()
+        With previous_contents, code is generated in memory; see codegen.BaseLangCodeWriter.new_project()"""
+        np.flush_current_property()
+        try:
+            writer = self._generate_code(preview, out_path, widget, dry_run, previous_contents)
+        except CodeGenerationError as inst:
+            return misc.error_message( str(inst) )
         except EnvironmentError as inst:
             bugdialog.ShowEnvironmentError(_('An IO related error has occurred:'), inst)
             return
@@ -550,9 +669,8 @@ class Application(EditRoot):
             if config.testing or config.debugging: raise
             bugdialog.Show(_('Generate Code'), inst)
             return
-        finally:
-            writer.clean_up(widget or self)
 
+        if dry_run: return writer.get_dry_run_results()
         if preview or not config.use_gui: return writer
         if config.preferences.show_completion:
             # Show informational dialog
@@ -566,78 +684,57 @@ class Application(EditRoot):
     def is_visible(self):
         return True
 
-    def _get_preview_filename(self):
-        import warnings
-        warnings.filterwarnings("ignore", "tempnam", RuntimeWarning, "application")
-        if compat.PYTHON2:
-            out_name = os.tempnam(None, 'wxg') + '.py'
-        else:
-            # create a temporary file at either the output path or the project path
-            error = None
-            if not self.filename:
-                error = "Save project first; a temporary file will be created in the same directory."
-            else:
-                dirname, basename = os.path.split(self.filename)
-                basename, extension = os.path.splitext(basename)
-                basename = basename.replace(".", "_")
-                if not os.path.exists(dirname):
-                    error = "Directory '%s' not found"%dirname
-                elif not os.path.isdir(dirname):
-                    error = "'%s' is not a directory"%dirname
-            if error:
-                misc.error_message(error)
-                return None
-            while True:
-                out_name = os.path.join(dirname, "_%s_%d.py"%(basename,random.randrange(10**8, 10**9)))
-                if not os.path.exists(out_name): break
-        return out_name
+    def _get_preview_code(self, widget, preview_classname):
+        """Return (code object, have_extracode) for the preview of widget; the code is generated into memory.
+        Code objects are cached, keyed by a hash of the generated source and by a hash of the widget's XML.
+        If neither the widget nor the generated code have changed, codegen and compilation are skipped."""
+        xml = []
+        widget.write(xml, 0)
+        xml.append( u"%s %s %s" % (self.filename, preview_classname, config.preferences.allow_custom_widgets) )
+        widget_key = common.md5( u"".join(xml).encode("utf-8") ).hexdigest()
+        if widget_key in _preview_widget_cache:
+            source_key = _preview_widget_cache[widget_key]
+            if source_key in _preview_code_cache:
+                return _preview_code_cache[source_key]
+
+        widget.properties["class"].set_temp(preview_classname)
+        writer = self.generate_code(True, _PREVIEW_FILENAME, widget, previous_contents={})
+        if writer is None: return None, False
+        source = b"".join( writer.generated_files[os.path.normpath(_PREVIEW_FILENAME)] )
+        source_key = common.md5(source).hexdigest()
+        _preview_widget_cache[widget_key] = source_key
+        if source_key not in _preview_code_cache:
+            _preview_code_cache[source_key] = ( compile(source, "<preview of %s>"%widget.name, "exec"),
+                                                writer.have_extracode )
+        while len(_preview_code_cache) > _PREVIEW_CACHE_SIZE:
+            _preview_code_cache.popitem(last=False)
+        while len(_preview_widget_cache) > _PREVIEW_CACHE_SIZE:
+            _preview_widget_cache.popitem(last=False)
+        return _preview_code_cache[source_key]
 
     def preview(self, widget, position=None):
         """Generate and instantiate preview widget.
         None will be returned in case of errors. The error details are written to the application log file."""
 
-        preview_filename = self._get_preview_filename()
-        if preview_filename is None: return
-
-        if wx.Platform == "__WXMAC__" and not compat.PYTHON2:
-            # workaround for Mac OS testing: sometimes the caches need to be invalidated
-            import importlib
-            importlib.invalidate_caches()
-
         # make a valid name for the class (this can be invalid for some sensible reasons...)
         preview_classname = widget.WX_CLASS.split('.')[-1].split(':')[-1]
-        # randomize the class name to make preview work when there are multiple classes with the same name (e.g. XRC)
-        preview_classname = '_%d_%s' % (random.randrange(10 ** 8, 10 ** 9), preview_classname)
-        widget.properties["class"].set_temp(preview_classname)
+        preview_classname = '_Preview_%s' % preview_classname
 
         frame = None
+        have_extracode = False
         try:
-            # create preview module
-            writer = self.generate_code(True, preview_filename, widget)
-            # import generated preview module dynamically
-            preview_path = os.path.dirname(preview_filename)
-            preview_module_name = os.path.basename(preview_filename)
-            preview_module_name = os.path.splitext(preview_module_name)[0]
-            if preview_path not in sys.path: sys.path.append(preview_path)
-            preview_module = __import__(preview_module_name, {}, {}, ['just_not_empty'])
-
-            if not preview_module:
-                misc.error_message( _('Can not import the preview module from file \n"%s".\n'
-                                      'The details are written to the log file.\n'
-                                      'If you think this is a wxGlade bug, please report it.') % self.output_path )
-                return None
-
-            try:
-                preview_class = getattr(preview_module, preview_classname) # .klass)
-            except AttributeError:
-                # module loaded previously -> do a re-load XXX this is required for Python 3; check alternatives
-                if sys.version_info.major<3:
-                    preview_module = reload(preview_module)
-                else:
-                    import importlib
-                    preview_module = importlib.reload(preview_module)
-                preview_class = getattr(preview_module, preview_classname)
-
+            # create preview module in memory, from cached code if possible
+            code, have_extracode = self._get_preview_code(widget, preview_classname)
+            if code is None: return None
+
+            if self.filename:
+                # allow imports of modules in the project directory, e.g. for custom widgets
+                preview_path = os.path.dirname(self.filename)
+                if preview_path not in sys.path: sys.path.append(preview_path)
+            preview_module = types.ModuleType("_wxglade_preview")
+            exec(code, preview_module.__dict__)
+
+            preview_class = getattr(preview_module, preview_classname, None)
             if not preview_class:
                 misc.error_message( _('No preview class "%s" found.\nThe details are written to the log file.\n'
                                       'If you think this is a wxGlade bug, please report it.') % widget.klass )
@@ -692,16 +789,14 @@ class Application(EditRoot):
             frame.Bind(wx.EVT_CHAR_HOOK, self.on_char_hook)
             # keep a reference to the Close method in case it's overwritten by some widget
             frame._close_method = preview_class.Close
-
-            # remove the temporary file
-            if not config.debugging:
-                name = os.path.join(preview_path, preview_module_name+".py")
-                if os.path.isfile(name): os.unlink(name)
         except Exception as inst:
             if config.debugging or config.testing: raise
             widget.preview_widget = None
             widget.properties["preview"].set_label(_('Show Preview'))
-            if writer.have_extracode:
+            if isinstance(inst, SyntaxError):
+                # raised by compile() after code generation; the writer info is up to date
+                have_extracode = common.code_writers["preview"].have_extracode
+            if have_extracode:
                 # could be caused by user code: just report
                 msg = ["Exception during preview, potentially due to invalid code in custom widget:","",
                        inst.__class__.__name__, inst.msg]
@@ -0,0 +1,80 @@
+"""\
+Process-wide cache of bitmaps loaded from files, e.g. for design window widgets, toolbar tools and window icons.
+
+The key is the absolute path, the modification time and the requested size; i.e. modified files will be loaded again.
+If the bitmaps in the cache have more than MAX_PIXELS pixels in total, the least recently used ones are removed.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import os
+from collections import OrderedDict
+import wx
+
+import compat
+
+
+MAX_PIXELS = 16 * 1024 * 1024  # e.g. 256 bitmaps of 256x256 pixels
+
+_cache = OrderedDict()  # key -> bitmap; least recently used first
+_pixels = 0
+
+
+def _get_mtime(path):
+    # returns None if the file does not exist; for files inside a ZIP archive, the time of the archive is used
+    if not os.path.exists(path) and '.zip' in path:
+        path = path.split('.zip', 1)[0] + '.zip'
+    try:
+        return os.path.getmtime(path)
+    except EnvironmentError:
+        return None
+
+
+def _get_pixels(bitmap):
+    if not bitmap.IsOk(): return 0
+    return bitmap.GetWidth() * bitmap.GetHeight()
+
+
+def _load(path):
+    return wx.Bitmap(path, wx.BITMAP_TYPE_ANY)
+
+
+def _scale(bitmap, size):
+    if not bitmap.IsOk() or tuple(bitmap.GetSize())==tuple(size): return bitmap
+    image = bitmap.ConvertToImage()
+    image.Rescale(size[0], size[1], wx.IMAGE_QUALITY_HIGH)
+    if compat.IS_CLASSIC: return wx.BitmapFromImage(image)
+    return wx.Bitmap(image)
+
+
+def get_bitmap(path, size=None, loader=_load):
+    """Returns the bitmap for the file; loader(path) is called if it's not in the cache.
+    If size is given, the bitmap is scaled to (width, height).
+    Callers must not modify the returned bitmap, as it is shared."""
+    global _pixels
+    path = os.path.abspath(path)
+    mtime = _get_mtime(path)
+    if mtime is None:
+        # don't cache missing files
+        bitmap = loader(path)
+        return _scale(bitmap, size) if size else bitmap
+
+    key = (path, mtime, size and tuple(size) or None)
+    bitmap = _cache.pop(key, None)
+    if bitmap is None:
+        bitmap = loader(path)
+        if size: bitmap = _scale(bitmap, size)
+        _pixels += _get_pixels(bitmap)
+    _cache[key] = bitmap  # now the most recently used one
+
+    # evict least recently used entries, but keep the one just requested
+    while _pixels > MAX_PIXELS and len(_cache) > 1:
+        old_key, old_bitmap = _cache.popitem(last=False)
+        _pixels -= _get_pixels(old_bitmap)
+    return bitmap
+
+
+def clear():
+    global _pixels
+    _cache.clear()
+    _pixels = 0
@@ -0,0 +1,188 @@
+"""\
+Bulk editing: apply the same property values to multiple widgets in one transaction.
+
+For each widget, the values are set and properties_changed is called once for all of them, i.e. with one pass over
+the dependent properties. The layout is done once per affected toplevel window and the modifications are recorded
+as one history item, so they can be un-done in one step.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import wx
+
+import common, misc
+import new_properties as np
+import edit_base, history
+
+
+# properties that need to be unique or that don't hold data to be copied
+_EXCLUDED_PROPERTIES = {"name", "class", "instance_class"}
+
+
+def get_all_widgets(node=None):
+    "returns all widgets of the project, in tree order"
+    ret = []
+    for child in (node or common.root).get_all_children() or []:
+        if child is None or child.IS_SLOT: continue
+        ret.append(child)
+        ret.extend( get_all_widgets(child) )
+    return ret
+
+
+def get_editable_properties(widget):
+    "returns the names of the properties that can be applied to other widgets"
+    ret = []
+    for name in widget.property_names:
+        prop = widget.properties.get(name)
+        if prop is None or not prop.HAS_DATA or prop.readonly or name in _EXCLUDED_PROPERTIES: continue
+        if isinstance(prop, np.ActionButtonProperty): continue
+        ret.append(name)
+    return ret
+
+
+def _apply(widgets, names, set_value):
+    """set_value(prop, name) sets the new value of a property and returns False if it was not modified;
+    returns the number of modified widgets"""
+    np.flush_current_property()
+    items = []
+    modified_widgets = 0
+    with edit_base.deferred_layout():
+        for widget in widgets:
+            changed = []
+            pending = []  # (HistoryPropertyItem, monitored dependent properties)
+            for name in names:
+                prop = widget.properties.get(name)
+                if prop is None or prop.readonly or prop.blocked: continue
+                item = history.HistoryPropertyItem(prop)
+                monitor = history.get_dependent_values(prop)
+                previous_value = history.copy_value(prop)
+                if not set_value(prop, name) or history.PropertyValue(prop)==item.old: continue
+                # like on_value_edited: handlers may check previous_value to detect user modifications
+                prop.previous_value = previous_value
+                changed.append(name)
+                pending.append( (item, monitor) )
+            if not changed: continue
+            # one pass for all properties and their dependencies
+            try:
+                widget.properties_changed(changed)
+            finally:
+                for name in changed:
+                    widget.properties[name].previous_value = None
+            for item, monitor in pending:
+                item.finalize(monitor)
+                if item.new!=item.old or item.dependent: items.append(item)
+            modified_widgets += 1
+
+    if items:
+        common.root.saved = False
+        if common.history: common.history.group_added(items)
+    return modified_widgets
+
+
+def set_properties(widgets, values):
+    """Set property values on multiple widgets; values is a dict property name -> value.
+    Properties that can be deactivated will be activated. Widgets without the property are skipped.
+    Returns the number of modified widgets."""
+    def set_value(prop, name):
+        value = values[name]
+        if value==prop.value and not prop.deactivated: return False
+        if not prop.owner.check_property_modification(name, prop.value, value): return False
+        prop.set(value, activate=prop.deactivated is not None)
+        return True
+    return _apply(widgets, list(values.keys()), set_value)
+
+
+def copy_properties(source, names, widgets):
+    "Copy the values and the activation state of the named properties from widget source to the widgets"
+    values = dict( (name, history.PropertyValue(source.properties[name])) for name in names )
+    def set_value(prop, name):
+        value = values[name]
+        if value==history.PropertyValue(prop): return False
+        if not prop.owner.check_property_modification(name, prop.value, value.value): return False
+        value.set(prop)
+        return True
+    return _apply([w for w in widgets if w is not source], names, set_value)
+
+
+class BulkEditDialog(wx.Dialog):
+    "Select properties of the source widget and the widgets to copy them to"
+    def __init__(self, source):
+        wx.Dialog.__init__(self, common.main, -1, _("Apply Properties to Multiple Widgets"),
+                           style=wx.DEFAULT_DIALOG_STYLE|wx.RESIZE_BORDER)
+        self.source = source
+        self.names = get_editable_properties(source)
+        self.widgets = [w for w in get_all_widgets() if w is not source]
+
+        szr = wx.BoxSizer(wx.HORIZONTAL)
+        # properties of the source widget; pre-select those that were modified last
+        left = wx.BoxSizer(wx.VERTICAL)
+        left.Add( wx.StaticText(self, -1, _("Properties of '%s'")%source.name), 0, wx.ALL, 4 )
+        self.properties = wx.CheckListBox(self, -1, choices=self.names, size=(200, 300))
+        recent = common.history and common.history._repeat_info or []
+        for i, name in enumerate(self.names):
+            if name in recent: self.properties.Check(i)
+        left.Add(self.properties, 1, wx.ALL|wx.EXPAND, 4)
+        szr.Add(left, 1, wx.EXPAND)
+
+        # target widgets
+        right = wx.BoxSizer(wx.VERTICAL)
+        right.Add( wx.StaticText(self, -1, _("Apply to")), 0, wx.ALL, 4 )
+        choices = [w.get_path() for w in self.widgets]
+        self.targets = wx.CheckListBox(self, -1, choices=choices, size=(350, 300))
+        right.Add(self.targets, 1, wx.ALL|wx.EXPAND, 4)
+        buttons = wx.BoxSizer(wx.HORIZONTAL)
+        for label, handler in ((_("Same Type"), self.on_select_same_type), (_("All"), self.on_select_all),
+                               (_("None"), self.on_select_none)):
+            button = wx.Button(self, -1, label)
+            button.Bind(wx.EVT_BUTTON, handler)
+            buttons.Add(button, 0, wx.ALL, 4)
+        right.Add(buttons, 0)
+        szr.Add(right, 2, wx.EXPAND)
+
+        main_szr = wx.BoxSizer(wx.VERTICAL)
+        main_szr.Add(szr, 1, wx.EXPAND|wx.ALL, 4)
+        btnbox = wx.StdDialogButtonSizer()
+        btnOK = wx.Button(self, wx.ID_OK)
+        btnOK.SetDefault()
+        btnbox.AddButton(btnOK)
+        btnbox.AddButton( wx.Button(self, wx.ID_CANCEL) )
+        btnbox.Realize()
+        main_szr.Add(btnbox, 0, wx.ALL|wx.ALIGN_CENTER, 8)
+        self.SetSizer(main_szr)
+        main_szr.Fit(self)
+        self.on_select_same_type(None)
+
+    def _check_targets(self, check):
+        for i, widget in enumerate(self.widgets):
+            self.targets.Check(i, check(widget))
+
+    def on_select_same_type(self, event):
+        self._check_targets(lambda widget: widget.WX_CLASS==self.source.WX_CLASS)
+
+    def on_select_all(self, event):
+        self._check_targets(lambda widget: True)
+
+    def on_select_none(self, event):
+        self._check_targets(lambda widget: False)
+
+    def get_selection(self):
+        "returns the selected property names and widgets"
+        names = [name for i, name in enumerate(self.names) if self.properties.IsChecked(i)]
+        widgets = [widget for i, widget in enumerate(self.widgets) if self.targets.IsChecked(i)]
+        return names, widgets
+
+
+def show_dialog(source=None):
+    "entry point from the Edit menu"
+    source = source or misc.focused_widget
+    if source is None or source.IS_ROOT or source.IS_SLOT:
+        return wx.Bell()
+    dialog = BulkEditDialog(source)
+    try:
+        if dialog.ShowModal() != wx.ID_OK: return
+        names, widgets = dialog.get_selection()
+    finally:
+        dialog.Destroy()
+    if not names or not widgets: return
+    count = copy_properties(source, names, widgets)
+    if common.main: common.main.user_message( _("Properties applied to %d widgets")%count )
@@ -69,6 +69,7 @@ class DropTarget(wx.DropTarget):
         self._create_data_objects(toplevel)
         self.SetDataObject(self.data_object)
         self._last_check = None  # will be set to x,y,result if a compatibility check was done
+        self._compatibility = {}  # target editor -> result of _check_compatibility; for the current drag only
         self.fmt = None  # the received format
 
     def _create_data_objects(self, toplevel=False):
@@ -111,7 +112,13 @@ class DropTarget(wx.DropTarget):
         widget = self.window.find_editor_by_pos(x,y)
         if widget is None:
             return (False, "No widget found")
+        # the dragged item and its format don't change during a drag, so the result for each target is cached
+        ret = self._compatibility.get(widget)
+        if ret is None:
+            ret = self._compatibility[widget] = self._check_widget_compatibility(widget)
+        return ret
 
+    def _check_widget_compatibility(self, widget):
         if _current_drag_source is None:
             # drag from outside
             fmt = self._get_received_format()
@@ -144,6 +151,7 @@ class DropTarget(wx.DropTarget):
 
     def OnData(self, x,y,default):
         compatible, message = self._check_compatibility(x,y)
+        self._compatibility.clear()  # the structure will be modified
         if not compatible: return wx.DragCancel
 
         # workaround for wxPython 4.1
@@ -230,8 +238,17 @@ class DropTarget(wx.DropTarget):
             pasted = dst_widget.clipboard_paste(xml_data)
             if common.history: common.history.widget_added(pasted)
 
+    def OnEnter(self, x,y, default):
+        # a new drag session: the windows of a design window may have been moved or resized since the last one
+        if hasattr(self.window, "invalidate_hit_index"): self.window.invalidate_hit_index()
+        self.fmt = None
+        self._compatibility.clear()
+        self._last_check = None
+        return self.OnDragOver(x,y, default)
+
     def OnLeave(self):
         self.fmt = None
+        self._compatibility.clear()
 
 
 def get_data_object(widget):
@@ -362,16 +379,17 @@ def _paste(parent, index, clipboard_data, rebuild_tree=True):
     "parse XML and insert widget"
     option, span, flag, border, xml_unicode = clipboard2widget( clipboard_data )
     if not xml_unicode: return None
-    import xml_parse
+    import xml_parse, edit_base
     try:
         wx.BeginBusyCursor()
         # widget representation is still unicode, but parser need UTF8
         xml_utf8 = xml_unicode.encode('utf8')
         parser = xml_parse.ClipboardXmlWidgetBuilder(parent, index, option, span, flag, border)
         with parent and parent.frozen() or misc.dummy_contextmanager():
-            parser.parse_string(xml_utf8)
-            if parent and hasattr(parent, "on_child_pasted"):
-                parent.on_child_pasted()  # trigger e.g. re-sizing of the children
+            with edit_base.deferred_layout():  # one layout pass, not one per pasted widget
+                parser.parse_string(xml_utf8)
+                if parent and hasattr(parent, "on_child_pasted"):
+                    parent.on_child_pasted()  # trigger e.g. re-sizing of the children
         freeze = parser._object_counter>80  # for more objects, we freeze the Tree during re-build
         if rebuild_tree: misc.rebuild_tree( parser.top_obj, freeze=freeze )
         return parser.top_obj  # Widget hierarchy pasted.
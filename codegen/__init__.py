@@ -6,10 +6,11 @@
 @license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import copy, logging, os, os.path, random, re, sys, time
+import copy, difflib, io, itertools, logging, os, os.path, random, re, sys, time
 
-import common, config, compat, misc
+import common, config, compat, misc, tracing
 import wcodegen
+from codegen import class_cache
 from collections import OrderedDict
 
 
@@ -41,6 +42,22 @@ def _replace_tag(lst, tag, content):
         ret = True
 
 
+def _split_lines(chunks):
+    "re-assemble an iterator of bytes chunks into lines"
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).splitlines(True)
+        pending = lines.pop() if lines and not lines[-1].endswith((b"\n", b"\r")) else b""
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+# cache of parsed source files: filename -> (cache key, nonce, state); see BaseSourceFileContent._get_cache_key()
+_source_cache = {}
+
+
 class BaseSourceFileContent(object):
     """Keeps info about an existing file that has to be updated, to replace only
     the lines inside a wxGlade block, an to keep the rest of the file as it was
@@ -49,7 +66,12 @@ class BaseSourceFileContent(object):
      rec_block_start:   Regexp to match the begin of a wxglade block
      rec_block_end:     Regexp to match the end of a wxGlade block
      rec_class_decl:    Regexp to match class declarations
-     rec_event_handler: Regexp to match event handlers"""
+     rec_event_handler: Regexp to match event handlers
+
+    The results of build_untouched_content() are cached in _source_cache as long as the files are not modified."""
+
+    # attributes set by build_untouched_content(); these will be stored in and restored from the cache
+    _cached_attributes = ("classes", "class_name", "content", "event_handlers", "new_classes_inserted", "spaces")
 
     def __init__(self, name, code_writer):
         self.OK = False
@@ -69,13 +91,51 @@ class BaseSourceFileContent(object):
         self.out_dir = code_writer.out_dir
         self.multiple_files = code_writer.multiple_files
 
+        key = self._get_cache_key()
+        if key is not None and self._restore_from_cache(key):
+            self.OK = True
+            return
         try:
-            self.build_untouched_content()
+            with tracing.span("SourceFileContent.parse"):
+                self.build_untouched_content()
             self.OK = True
         except UnicodeDecodeError:
             # file could not be read and OK will remain False
             # this will be checked in writer.init_files and returned via writer.new_project to application.generate_code
-            pass
+            return
+        if key is not None:
+            state = dict( (name, copy.deepcopy(getattr(self, name))) for name in self._cached_attributes )
+            _source_cache[self.name] = (key, self.nonce, state)
+
+    def _get_filenames(self):
+        "Return the names of the files that are parsed by build_untouched_content(); may be overwritten"
+        return [self.name]
+
+    def _get_cache_key(self):
+        """Return a key to check whether a cached parsing result is still valid: size and modification time of the
+        files plus the settings that have an influence on the result; None if the files can't be accessed"""
+        if self.code_writer.in_memory: return None
+        key = [self.__class__, self.code_writer.app_encoding, self.multiple_files, self.out_dir]
+        for filename in self._get_filenames():
+            try:
+                stat = os.stat(filename)
+            except EnvironmentError:
+                return None
+            key.append( (filename, stat.st_size, getattr(stat, "st_mtime_ns", stat.st_mtime)) )
+        return tuple(key)
+
+    def _restore_from_cache(self, key):
+        "Restore the results of a previous build_untouched_content() call; returns False if there's no valid entry"
+        cached = _source_cache.get(self.name)
+        if cached is None or cached[0] != key: return False
+        dummy, nonce, state = cached
+        for name in self._cached_attributes:
+            value = copy.deepcopy(state[name])
+            if isinstance(value, list) and nonce != self.nonce:
+                # the content has tags with the nonce of the code writer that parsed the file
+                value = [line.replace(nonce, self.nonce) if nonce in line else line for line in value]
+            setattr(self, name, value)
+        return True
 
     def replace(self, tag, content):
         return _replace_tag(self.content, tag, content)
@@ -104,10 +164,17 @@ class BaseSourceFileContent(object):
 
     def _load_file(self, filename):
         "Load a file and return the content. The read source file will be decoded to unicode automatically."
+        encoding = self.code_writer.app_encoding
+        if self.code_writer.in_memory:
+            # the content was passed in as string or bytes; see BaseLangCodeWriter.new_project()
+            content = self.code_writer.previous_contents[filename]
+            if isinstance(content, bytes):
+                content = content.decode(encoding or "utf-8")
+            return io.StringIO(content, newline=None).readlines()
+
         # Separated for debugging purposes
         lines = common._read_file(filename)
 
-        encoding = self.code_writer.app_encoding
         if encoding:
             # UnicodeDecodeError will be handled in application.generate_code
             lines = [line.decode(encoding) for line in lines]
@@ -219,6 +286,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
 
     see: _get_code_statement(), _generic_code(), generate_code_extraproperties()"""
     ClassLines = ClassLines
+    class_cache_supported = False  # True if the ClassLines of a class depend on the class subtree only; see class_cache
 
     classattr_always = [] # List of classes to store always as class attributes; see store_as_attr()
     class_separator = '' # Separator between class and attribute or between different name space elements;
@@ -312,6 +380,11 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         self._mark_blocks = True # YYY config.mark_blocks
         self._textdomain = 'app'
         self._use_gettext = config.default_use_gettext
+        self.dry_run = False  # if True, files will not be written, but stored in generated_files
+        self.generated_files = OrderedDict()  # for dry_run: file name -> list of bytes
+        self.output_files = []  # names of all files passed to save_file, e.g. for verification
+        self.in_memory = False  # if True, the file system is not accessed at all; implies dry_run
+        self.previous_contents = {}  # for in_memory: file name -> previous content of existing files
 
     ####################################################################################################################
     # the cache is mainly used to inject values for CustomWidget
@@ -328,12 +401,21 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         return self._cache.get("", {}).get(key, default)
 
     ####################################################################################################################
-    def new_project(self, app, out_path=None, preview=False):
-        "Initialise generic and language independent code generator settings; see init_lang(), init_files()"
+    def new_project(self, app, out_path=None, preview=False, dry_run=False, previous_contents=None):
+        """Initialise generic and language independent code generator settings; see init_lang(), init_files()
+        With dry_run, no files will be written; see get_dry_run_results()
+
+        If previous_contents is not None, code is generated in memory without any file system access;
+        previous_contents maps file names to the content of existing files, e.g. for keeping user code;
+        see get_generated_files()"""
 
         # set (most of) instance variables back to default values
         self._init_vars()
         self._init_cache()
+        self.dry_run = dry_run
+        if previous_contents is not None:
+            self.dry_run = self.in_memory = True
+            self.previous_contents = previous_contents
 
         # application name
         self.app_name = app.name
@@ -394,11 +476,11 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         # You may overwrite this function in the derived class
         if self.multiple_files:
             self.previous_source = None
-            if not os.path.isdir(out_path):
+            if not self.in_memory and not os.path.isdir(out_path):
                 return _("Output path is not a directory")
             self.out_dir = out_path
         else:
-            if os.path.isdir(out_path):
+            if not self.in_memory and os.path.isdir(out_path):
                 return _("Output path is a directory")
             if not self._overwrite and self._file_exists(out_path):
                 # the file exists, we must keep all the lines not inside a
@@ -424,7 +506,9 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
     def check_values(self):
         "Check the validity of output directory/file name"
         out_dir = self.out_dir
-        if not self.multiple_files:
+        if self.in_memory:
+            out_dir = None
+        elif not self.multiple_files:
             if os.path.isdir(out_dir):
                 return "Output path is directory, not file"
             out_dir = os.path.dirname(out_dir)
@@ -432,7 +516,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         if out_dir:
             if not os.path.isdir(out_dir):
                 return "Output directory does not exist"
-            if not os.access(out_dir, os.W_OK):
+            if not self.dry_run and not os.access(out_dir, os.W_OK):
                 return "Output directory is not writable"
 
         # It's not possible to generate code from a template directly
@@ -459,13 +543,55 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         else:
             builder = None
 
-        # then the children
-        for child in obj.get_all_children():
-            self._generate_code(klass or parent_klass, obj, builder, child)
+        # then the children; for classes, the resulting code fragments may be taken from the persistent cache
+        cache_key = IS_CLASS and self._get_class_cache_key(obj)
+        if not cache_key or not self._restore_class_lines(obj, cache_key):
+            have_extracode = self.have_extracode
+            self.have_extracode = False
+            for child in obj.get_all_children():
+                self._generate_code(klass or parent_klass, obj, builder, child)
+            if cache_key:
+                self._store_class_lines(obj, cache_key)
+            self.have_extracode = self.have_extracode or have_extracode
 
         if IS_CLASS:
             self.finalize_class(obj)
 
+    def _get_class_widgets(self, code_obj):
+        "returns the widgets below code_obj in tree order"
+        ret = []
+        for child in code_obj.get_all_children():
+            ret.append(child)
+            ret.extend( self._get_class_widgets(child) )
+        return ret
+
+    def _get_class_cache_key(self, code_obj):
+        "returns the key for the persistent cache of the code fragments of the class or None if not applicable"
+        if not self.class_cache_supported or self.preview or not config.codegen_cache_dir: return None
+        # code for nested classes is generated separately, so it would be missing with cached fragments
+        for widget in self._get_class_widgets(code_obj):
+            if not widget.IS_SLOT and widget.check_prop_truth("class"): return None
+        output = []
+        code_obj.write(output, 0)
+        settings = (config.version, self.language, self.for_version, self.multiple_files, self._overwrite,
+                    self._mark_blocks, self._use_gettext, self._textdomain, self.indent_symbol, self.indent_amount,
+                    self.app_encoding, code_obj.IS_TOPLEVEL)
+        return class_cache.get_key("".join(output), settings)
+
+    def _restore_class_lines(self, code_obj, key):
+        "fill the ClassLines of code_obj from the persistent cache; returns False if not found"
+        cache = class_cache.get_cache()
+        value = cache.get(key)
+        if value is None: return False
+        class_cache.deserialize( self.classes[code_obj], value["class_lines"], self._get_class_widgets(code_obj) )
+        if value["have_extracode"]: self.have_extracode = True
+        return True
+
+    def _store_class_lines(self, code_obj, key):
+        class_lines = class_cache.serialize( self.classes[code_obj], self._get_class_widgets(code_obj) )
+        if class_lines is None: return
+        class_cache.get_cache().put( key, {"class_lines": class_lines, "have_extracode": self.have_extracode} )
+
     def generate_code(self, root, widget=None):
         "entry point for recursive code generation via _generate_code()"
         # root must be application.Application instance for now
@@ -602,6 +728,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         ret = self.classes[code_obj] = self.ClassLines()
         return ret
 
+    @tracing.traced("codegen.finalize_class")
     def finalize_class(self, code_obj):
         "Finalize and write the code for the class that was started with add_class(code_obj)."
         klass = code_obj.klass
@@ -756,6 +883,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
             return True
         return False
 
+    @tracing.traced("codegen.add_object")
     def add_object(self, parent_klass, parent, parent_builder, obj):
         """Adds the code to build 'obj' to the class body in parent_klass. (Not called for toplevel elements.)"""
 
@@ -1044,6 +1172,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         s = s.replace('@', r'\@')
         return '"%s"' % s
 
+    @tracing.traced("codegen.save_file")
     def save_file(self, filename, content, mainfile=False, content_only=False):
         """Store the content in a file.
 
@@ -1051,10 +1180,11 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         common.save_file() is used for storing content, i.e. the file will only be written in case of changes.
 
         filename:     File name
-        content:      File content as list of strings
+        content:      File content as list of strings, as string or as generator of lines (streamed)
         mainfile:     Mainfiles gets a shebang and 0755 permissions.
         content_only: Write only content to the file"""
 
+        self.output_files.append(filename)
         tmp = []
 
         # write additional information to file header
@@ -1079,17 +1209,31 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
             # add a empty line
             tmp.append( "\n" )
 
-        # add original file content
-        tmp += content
-
         # encode unicode to binary; filter out empty line
         def encode(line):
             if isinstance(line, compat.unicode):
                 return line.encode(self.app_encoding)
             return line
 
-        # UnicodeEncodeError will be handled in application.generate_code
-        tmp = [encode(line) for line in tmp if line]
+        if isinstance(content, (list, compat.basestring)):
+            # add original file content; a string is joined and split once, not streamed char by char
+            if isinstance(content, list):
+                tmp += content
+            else:
+                tmp.append(content)
+            # UnicodeEncodeError will be handled in application.generate_code
+            tmp = [encode(line) for line in tmp if line]
+            # content may be a string or have items with multiple lines; split into lines for the checksum comparison
+            tmp = b"".join(tmp).splitlines(True)
+        else:
+            # content is a generator, e.g. of the XRC writer; it will be streamed to the file by common.save_file
+            tmp = _split_lines( encode(line) for line in itertools.chain(tmp, content) if line )
+            if self.dry_run: tmp = list(tmp)
+
+        if self.dry_run:
+            # just keep the content; it will be compared to the existing file in get_dry_run_results()
+            self.generated_files[filename] = tmp
+            return
 
         # check for necessary sub directories e.g. for Perl or Python modules
         dirname = os.path.dirname(filename)
@@ -1118,6 +1262,33 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
 
         logging.info('Generated %s', filename)
 
+    def get_dry_run_results(self):
+        """Compare the files generated in dry run mode to the existing files.
+        Like common.save_file(), the 'generated by' line and trailing whitespace are ignored.
+
+        returns a list of tuples (filename, changed, diff) with diff being a list of unified diff lines"""
+        ret = []
+        for filename, content in self.generated_files.items():
+            if os.path.isfile(filename):
+                old_content = list( common._read_file(filename) )
+            else:
+                old_content = []
+            changed = not old_content or common._smart_checksum(old_content) != common._smart_checksum(content)
+            diff = []
+            if changed:
+                old_lines = [line.decode(self.app_encoding, "replace") for line in old_content]
+                new_lines = [line.decode(self.app_encoding, "replace") for line in content]
+                diff = list( difflib.unified_diff(old_lines, new_lines, filename, filename) )
+            ret.append( (filename, changed, diff) )
+        return ret
+
+    def get_generated_files(self):
+        "Return the files generated in dry run or in memory mode as OrderedDict: file name -> content (unicode)"
+        ret = OrderedDict()
+        for filename, content in self.generated_files.items():
+            ret[filename] = b"".join(content).decode(self.app_encoding)
+        return ret
+
     def store_as_attr(self, obj):
         """Returns True if 'obj' should be added as an attribute of its parent's class,
         False if it should be created as a local variable.
@@ -1203,6 +1374,8 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
 
     def _file_exists(self, filename):
         "Check if the file exists; separated for debugging purposes"
+        if self.in_memory:
+            return filename in self.previous_contents
         return os.path.isfile(filename)
 
     def add_object_format_name(self, name):
@@ -0,0 +1,136 @@
+"""\
+Persistent, content-addressed cache of the code fragments (ClassLines) of generated classes.
+
+The key is a hash over the XML of the class subtree and the code generator settings.
+Each entry is stored as a JSON file in a directory that can be shared between processes and machines;
+entries are written to temporary files and renamed, so concurrent writers don't produce partial entries.
+If the total size exceeds config.codegen_cache_size, the least recently used entries are removed.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import hashlib, json, logging, os, os.path, random
+
+import compat, config
+
+
+_EVICT_CHECK_INTERVAL = 50  # check the total size after this number of new entries
+
+
+class ClassCache(object):
+    "ClassLines fragments stored as <directory>/<key[:2]>/<key>.json"
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size  # in bytes
+        self._stores = 0
+
+    def _get_filename(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        "returns the stored dict or None"
+        filename = self._get_filename(key)
+        try:
+            with open(filename, "r") as infile:
+                ret = json.load(infile)
+            os.utime(filename, None)  # for eviction of least recently used entries
+        except (EnvironmentError, ValueError):
+            return None
+        return ret
+
+    def put(self, key, value):
+        filename = self._get_filename(key)
+        tmp_name = "%s.%d.%d~" % (filename, os.getpid(), random.randint(0, 1000000))
+        try:
+            directory = os.path.dirname(filename)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(tmp_name, "w") as outfile:
+                json.dump(value, outfile)
+            if os.path.exists(filename):
+                os.remove(tmp_name)  # stored by another process in the meantime
+            else:
+                os.rename(tmp_name, filename)
+        except EnvironmentError as details:
+            logging.warning( _('Storing code in cache directory "%s" failed: %s'), self.directory, details )
+            if os.path.exists(tmp_name): os.remove(tmp_name)
+            return
+        self._stores += 1
+        if self._stores % _EVICT_CHECK_INTERVAL == 1:
+            self.evict()
+
+    def evict(self):
+        "remove the least recently used entries if the total size exceeds max_size"
+        entries = []
+        total = 0
+        for dirpath, dirnames, filenames in os.walk(self.directory):
+            for name in filenames:
+                if not name.endswith(".json"): continue
+                filename = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(filename)
+                except EnvironmentError:
+                    continue
+                entries.append( (stat.st_mtime, stat.st_size, filename) )
+                total += stat.st_size
+        if total <= self.max_size: return
+        entries.sort()
+        for mtime, size, filename in entries:
+            try:
+                os.remove(filename)
+            except EnvironmentError:
+                continue  # removed by another process
+            total -= size
+            if total <= self.max_size * 0.8: break
+
+
+_caches = {}
+
+def get_cache():
+    "returns the ClassCache for config.codegen_cache_dir or None if caching is not enabled"
+    directory = config.codegen_cache_dir
+    if not directory: return None
+    cache = _caches.get(directory)
+    if cache is None:
+        cache = _caches[directory] = ClassCache(directory, config.codegen_cache_size * 1024 * 1024)
+    return cache
+
+
+def get_key(xml, settings):
+    "hash over the XML of the class subtree and the code generator settings"
+    key = hashlib.sha256()
+    key.update( xml.encode("utf-8") )
+    key.update( repr(settings).encode("utf-8") )
+    return key.hexdigest()
+
+
+def serialize(class_lines, widgets):
+    """Returns the attributes of class_lines as dict for JSON or None if it can't be serialized.
+    widgets: list of widgets of the class subtree; references in event_handlers are stored as index into this list"""
+    indices = dict( (id(widget), i) for i, widget in enumerate(widgets) )
+    ret = {}
+    for name, value in class_lines.__dict__.items():
+        if name == "event_handlers":
+            handlers = []
+            for handler in value:
+                obj = handler[0]
+                if obj is not None and not isinstance(obj, compat.basestring):
+                    if not id(obj) in indices: return None
+                    obj = {"widget": indices[id(obj)]}
+                handlers.append( [obj] + list(handler[1:]) )
+            value = handlers
+        elif isinstance(value, set):
+            value = sorted(value)
+        ret[name] = value
+    return ret
+
+
+def deserialize(class_lines, value, widgets):
+    "set the attributes of the empty class_lines from value as returned by serialize()"
+    for name, item in value.items():
+        if name == "event_handlers":
+            item = [tuple( [widgets[h[0]["widget"]] if isinstance(h[0], dict) else h[0]] + h[1:] ) for h in item]
+        elif isinstance(getattr(class_lines, name, None), set):
+            item = set(item)
+        setattr(class_lines, name, item)
@@ -12,7 +12,7 @@ import os.path, re, logging
 
 from codegen import BaseLangCodeWriter, BaseSourceFileContent, _replace_tag
 from codegen import ClassLines as BaseClassLines
-import config, wcodegen
+import config, tracing, wcodegen
 
 
 class SourceFileContent(BaseSourceFileContent):
@@ -105,6 +105,12 @@ class SourceFileContent(BaseSourceFileContent):
         # call inherited constructor
         BaseSourceFileContent.__init__(self, name, code_writer)
 
+    _cached_attributes = BaseSourceFileContent._cached_attributes + ("header_content", "event_table_decl",
+                                                                      "event_table_def")
+
+    def _get_filenames(self):
+        return [self.name + "." + self.header_extension, self.name + "." + self.source_extension]
+
     def replace_header(self, tag, content):
         return _replace_tag(self.header_content, tag, content)
 
@@ -131,7 +137,9 @@ class SourceFileContent(BaseSourceFileContent):
                 end_index = line.find('*/')
                 if end_index > comment_index:
                     inside_comment = False
-            if not is_header:
+            # cheap pre-checks to avoid running the regular expressions on each line
+            tagged = "wxGlade" in line  # block start and end, event handler markers
+            if not is_header or not "class" in line:
                 result = None
             else:
                 result = self.rec_class_decl.match(line)
@@ -145,7 +153,7 @@ class SourceFileContent(BaseSourceFileContent):
                 self.classes.add( self.class_name )  # add the found class to the list of classes of this module
                 out_lines.append(line)
             elif not inside_block:
-                result = self.rec_block_start.match(line)
+                result = tagged and self.rec_block_start.match(line)
                 if not inside_comment and result:
                     # replace the lines inside a wxGlade block with a tag that will be used later by add_class
                     spaces = result.group('spaces')
@@ -202,7 +210,7 @@ class SourceFileContent(BaseSourceFileContent):
                         out_lines.append(line)
             else:
                 # ignore all the lines inside a wxGlade block
-                if self.rec_block_end.match(line):
+                if tagged and self.rec_block_end.match(line):
                     inside_block = False
         if is_header and not self.new_classes_inserted:
             # if we are here, the previous ``version'' of the file did not contain any class, so we must add the
@@ -514,6 +522,7 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
         ret = self.classes[code_obj] = self.ClassLines()  # ClassLines will collect the code lines incl. children
         return ret
 
+    @tracing.traced("codegen.finalize_class")
     def finalize_class(self, code_obj):
         # write the collected code for the class and its children
         base = code_obj.WX_CLASS
@@ -903,6 +912,7 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
             self.output_header.extend(header_buffer)
             self.output_file.extend(source_buffer)
 
+    @tracing.traced("codegen.add_object")
     def add_object(self, parent_klass, parent, parent_builder, obj):
         # get the widget builder instance
         builder = self._get_object_builder(parent_klass, obj)
@@ -75,7 +75,7 @@ class SourceFileContent(BaseSourceFileContent):
         out_lines = []
         check_old_methods = []  # list of indices with set_properties or do_layout
         for line in tmp_in:
-            result = self.rec_pod.match(line)
+            result = line.lstrip().startswith("=") and self.rec_pod.match(line)
             if result:
                 inside_pod = True
             if inside_pod:
@@ -84,7 +84,9 @@ class SourceFileContent(BaseSourceFileContent):
                     inside_pod = False
                 continue
 
-            result = self.rec_class_decl.match(line)
+            # cheap pre-checks to avoid running the regular expressions on each line
+            tagged = "wxGlade" in line  # block start and end, event handlers
+            result = "package" in line and self.rec_class_decl.match(line)
             if result:
                 if not self.class_name:
                     # this is the first class declared in the file: insert the new ones before this
@@ -95,7 +97,7 @@ class SourceFileContent(BaseSourceFileContent):
                 self.classes.add( self.class_name )  # add the found class to the list of classes of this module
                 out_lines.append(line)
             elif not inside_block:
-                result = self.rec_block_start.match(line)
+                result = tagged and self.rec_block_start.match(line)
                 if result:
                     # replace the lines inside a wxGlade block with a tag that will be used later by add_class
                     spaces = result.group('spaces')
@@ -115,7 +117,7 @@ class SourceFileContent(BaseSourceFileContent):
                             check_old_methods.append( len(out_lines) )
                         out_lines.append( '<%swxGlade replace %s %s>' % (self.nonce, which_class, which_block) )
                 else:
-                    result = self.rec_event_handler.match(line)
+                    result = tagged and self.rec_event_handler.match(line)
                     if result:
                         which_handler = result.group('handler')
                         which_class = self.format_classname(result.group('class'))
@@ -126,7 +128,7 @@ class SourceFileContent(BaseSourceFileContent):
                     out_lines.append(line)
             else:
                 # ignore all the lines inside a wxGlade block
-                if self.rec_block_end.match(line):
+                if tagged and self.rec_block_end.match(line):
                     inside_block = False
         if not self.new_classes_inserted:
             # if we are here, the previous ``version'' of the file did not contain any class, so we must add the
@@ -163,6 +165,7 @@ class PerlCodeWriter(BaseLangCodeWriter, wcodegen.PerlMixin):
         }
 
     class_separator = '::'
+    class_cache_supported = True
     classattr_always = ['wxBoxSizer', 'wxStaticBoxSizer', 'wxGridSizer', 'wxFlexGridSizer']
 
 
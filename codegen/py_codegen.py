@@ -78,7 +78,9 @@ class SourceFileContent(BaseSourceFileContent):
                 if quote_index < end_index and end_index != -1:
                     inside_triple_quote = False
 
-            result = self.rec_class_decl.match(line)
+            # cheap pre-checks to avoid running the regular expressions on each line
+            tagged = "wxGlade" in line  # block start and end, event handlers
+            result = line.startswith("class") and self.rec_class_decl.match(line)
             if not inside_triple_quote and not inside_block and result:
                 if not self.class_name:
                     # this is the first class declared in the file: insert the new ones before this
@@ -89,7 +91,7 @@ class SourceFileContent(BaseSourceFileContent):
                 self.classes.add( self.class_name )  # add the found class to the list of classes of this module
                 out_lines.append(line)
             elif not inside_block:
-                result = self.rec_block_start.match(line)
+                result = tagged and self.rec_block_start.match(line)
                 if not inside_triple_quote and result:
                     # replace the lines inside a wxGlade block with a tag that  will be used later by add_class
                     spaces = result.group('spaces')
@@ -109,7 +111,7 @@ class SourceFileContent(BaseSourceFileContent):
                             check_old_methods.append( len(out_lines) )
                         out_lines.append('<%swxGlade replace %s %s>' % (self.nonce, which_class, which_block))
                 else:
-                    result = self.rec_event_handler.match(line)
+                    result = tagged and self.rec_event_handler.match(line)
                     if not inside_triple_quote and result:
                         which_handler = result.group('handler')
                         which_class = self.format_classname(result.group('class'))
@@ -120,7 +122,7 @@ class SourceFileContent(BaseSourceFileContent):
                     out_lines.append(line)
             else:
                 # ignore all the lines inside a wxGlade block
-                if self.rec_block_end.match(line):
+                if tagged and self.rec_block_end.match(line):
                     inside_block = False
         if not self.new_classes_inserted:
             # if we are here, the previous ``version'' of the file did not  contain any class,
@@ -176,6 +178,7 @@ class PythonCodeWriter(BaseLangCodeWriter, wcodegen.PythonMixin):
         _code_statements['tooltip_3'     ] = "%(objname)s.SetToolTip(%(tooltip)s)\n"
 
     class_separator = '.'
+    class_cache_supported = True
 
     indent_level_func_body = 2
 
@@ -0,0 +1,229 @@
+"""\
+Verification of generated code:
+Python code is byte-compiled, Perl and C++ code is checked with 'perl -c' and 'g++ -fsyntax-only' if these tools are
+available, XRC files are parsed.
+The checks run in parallel; successful results are cached by content hash in config.verify_cache_file.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import hashlib, logging, os, os.path, shutil, subprocess, sys, tempfile
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+import xml.dom.minidom
+
+import config
+
+
+_CACHE_SIZE = 10000
+_cache = None  # OrderedDict of hashes of successfully verified contents; see _load_cache()
+_tools = {}    # tool name -> command line prefix or None if not available; see _get_tool()
+
+
+def _find_program(name):
+    "returns the full path of an executable or None"
+    if hasattr(shutil, "which"):
+        return shutil.which(name)
+    for path in os.environ.get("PATH", "").split(os.pathsep):
+        candidate = os.path.join(path, name)
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return None
+
+
+def _run(cmd):
+    "run cmd; returns None on success or the output otherwise"
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = proc.communicate()[0]
+    if proc.returncode == 0:
+        return None
+    return output.decode("utf-8", "replace").strip() or "exit status %d"%proc.returncode
+
+
+def _get_tool(name):
+    "returns the command line prefix for checking Perl or C++ code, or None if the tools are not available"
+    if name in _tools:
+        return _tools[name]
+    cmd = None
+    if name == "perl":
+        perl = _find_program("perl")
+        # without wxPerl, 'perl -c' would fail for every file
+        if perl and _run([perl, "-MWx", "-e", "1"]) is None:
+            cmd = [perl, "-c"]
+    elif name == "g++":
+        gpp = _find_program("g++")
+        wx_config = _find_program("wx-config")
+        if gpp and wx_config:
+            proc = subprocess.Popen([wx_config, "--cxxflags"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            cxxflags = proc.communicate()[0].decode("utf-8", "replace").split()
+            if proc.returncode == 0:
+                cmd = [gpp, "-fsyntax-only", "-x", "c++"] + cxxflags
+    _tools[name] = cmd
+    return cmd
+
+
+def _check_python(filename, contents):
+    try:
+        compile(contents[0], filename, "exec")
+    except SyntaxError as inst:
+        return "line %s: %s"%(inst.lineno, inst.msg)
+    except (TypeError, ValueError) as inst:
+        return str(inst)
+    return None
+
+
+def _check_xrc(filename, contents):
+    try:
+        xml.dom.minidom.parseString(contents[0])
+    except Exception as inst:
+        return str(inst)
+    return None
+
+
+def _check_perl(filename, contents):
+    # multiple files: the main file has e.g. 'use MyAppFrame;'
+    return _run( _get_tool("perl") + ["-I", os.path.dirname(filename) or ".", filename] )
+
+
+def _check_cpp(filename, contents):
+    return _run( _get_tool("g++") + ["-I", os.path.dirname(filename) or ".", filename] )
+
+
+# file extension -> (tool or None, checker function)
+_checkers = {".py": (None, _check_python), ".xrc": (None, _check_xrc),
+             ".pl": ("perl", _check_perl), ".pm": ("perl", _check_perl),
+             ".cpp": ("g++", _check_cpp), ".h": ("g++", _check_cpp)}
+
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        _cache = OrderedDict()
+        if config.verify_cache_file and os.path.isfile(config.verify_cache_file):
+            try:
+                with open(config.verify_cache_file, "r") as infile:
+                    for line in infile:
+                        _cache[line.strip()] = True
+            except EnvironmentError as details:
+                logging.warning( _('Reading the verification cache "%s" failed: %s'),
+                                 config.verify_cache_file, details )
+    return _cache
+
+
+def _save_cache():
+    if not config.verify_cache_file: return
+    while len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    try:
+        with open(config.verify_cache_file, "w") as outfile:
+            for key in _cache:
+                outfile.write(key + "\n")
+    except EnvironmentError as details:
+        logging.warning( _('Writing the verification cache "%s" failed: %s'), config.verify_cache_file, details )
+
+
+def _read(filename, contents):
+    if contents is not None and filename in contents:
+        return b"".join(contents[filename])
+    with open(filename, "rb") as infile:
+        return infile.read()
+
+
+def _get_jobs(filenames, contents):
+    "returns a list of tuples (filename, tool, checker, contents)"
+    jobs = []
+    for filename in filenames:
+        base, ext = os.path.splitext(filename)
+        if not ext in _checkers: continue
+        if ext == ".h" and base + ".cpp" in filenames: continue  # checked together with the .cpp file
+        tool, checker = _checkers[ext]
+        file_contents = [_read(filename, contents)]
+        if ext == ".cpp" and ( os.path.isfile(base + ".h") or (contents and base + ".h" in contents) ):
+            file_contents.append( _read(base + ".h", contents) )
+        jobs.append( (filename, tool, checker, file_contents) )
+    return jobs
+
+
+def _get_key(tool, ext, file_contents):
+    "hash over the contents and the check command"
+    key = hashlib.sha1()
+    key.update( repr([ext, tool and _get_tool(tool), sys.version_info[:2]]).encode("utf-8") )
+    for content in file_contents:
+        key.update(content)
+    return key.hexdigest()
+
+
+def _get_common_dir(filenames):
+    "returns the common directory of the files as absolute path"
+    dirnames = [os.path.dirname(os.path.abspath(filename)) for filename in filenames]
+    if hasattr(os.path, "commonpath"):
+        return os.path.commonpath(dirnames)
+    # Python 2: compare path components, not characters
+    common = os.path.commonprefix( [dirname.split(os.sep) for dirname in dirnames] )
+    return os.sep.join(common) or os.sep
+
+
+def verify_files(filenames, contents=None):
+    """Verify generated files in parallel.
+
+    filenames: list of file names
+    contents:  optional dict file name -> list of lines (bytes), e.g. from a dry run;
+               these files will be written to a temporary directory, if an external tool is required
+
+    returns a list of tuples (filename, status, message) with status being "OK", "failed" or "skipped"""
+    cache = _load_cache()
+    jobs = _get_jobs(filenames, contents)
+
+    # look for the tools before starting the threads
+    tools = set( _get_tool(tool) and tool for filename, tool, checker, file_contents in jobs if tool )
+    tools.discard(None)
+
+    tmp_dir = None
+    if contents and tools:
+        # external tools need files: write all of them to a temporary directory, keeping the relative paths
+        tmp_dir = tempfile.mkdtemp(prefix="wxglade_verify_")
+        base = _get_common_dir(contents)
+        tmp_names = {}
+        for filename, lines in contents.items():
+            tmp_names[filename] = tmp_name = os.path.join( tmp_dir, os.path.relpath(os.path.abspath(filename), base) )
+            if not os.path.isdir(os.path.dirname(tmp_name)):
+                os.makedirs(os.path.dirname(tmp_name))
+            with open(tmp_name, "wb") as outfile:
+                outfile.write(b"".join(lines))
+
+    def verify(job):
+        filename, tool, checker, file_contents = job
+        if tool and not _get_tool(tool):
+            return (filename, "skipped", "%s not available"%tool)
+        key = _get_key(tool, os.path.splitext(filename)[1], file_contents)
+        if key in cache:
+            return (filename, "OK", None)
+        name = filename
+        if tool and tmp_dir and filename in tmp_names: name = tmp_names[filename]
+        message = checker(name, file_contents)
+        if message is not None:
+            if tmp_dir: message = message.replace(tmp_dir + os.sep, "")
+            return (filename, "failed", message)
+        return (filename, "OK", key)
+
+    try:
+        pool = ThreadPool( max(1, min(len(jobs), 16)) )
+        try:
+            results = pool.map(verify, jobs)
+        finally:
+            pool.close()
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    ret = []
+    new_keys = False
+    for filename, status, message in results:
+        if status == "OK":
+            if message is not None:
+                cache[message] = new_keys = True
+            message = None
+        ret.append( (filename, status, message) )
+    if new_keys:
+        _save_cache()
+    return ret
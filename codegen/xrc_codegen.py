@@ -14,7 +14,7 @@ To be done: write XRC directly instead of using BaseLangCodeWriter as base.
 from xml.sax.saxutils import escape, quoteattr
 from codegen import BaseLangCodeWriter
 from collections import OrderedDict
-import common, wcodegen
+import common, tracing, wcodegen
 import new_properties as np
 import logging
 
@@ -316,19 +316,23 @@ class XRCCodeWriter(BaseLangCodeWriter, wcodegen.XRCMixin):
         self._overwrite = True
 
         self.output_file_name = app.output_path
-        self.out_file = []
-        self.out_file.append('\n<resource version="2.3.0.1">\n')
         self.curr_tab = 1
         self.xrc_objects = OrderedDict()
 
+    def _iter_xrc_lines(self):
+        "yield the XML code; each toplevel object is formatted and released before the next one"
+        yield '\n<resource version="2.3.0.1">\n'
+        xrc_objects = self.xrc_objects
+        while xrc_objects:
+            lines = []
+            xrc_objects.popitem(last=False)[1].write(lines, 1)
+            for line in lines:
+                yield line
+        yield '</resource>\n'
+
     def finalize(self):
-        # write the code for every toplevel object
-        for obj in self.xrc_objects.values():
-            obj.write(self.out_file, 1)
-        self.out_file.append('</resource>\n')
-        # store the contents to file
-        self.save_file( self.output_file_name, self.out_file )
-        self.out_file = None
+        # store the code for every toplevel object to file; the content is streamed, i.e. not collected in memory
+        self.save_file( self.output_file_name, self._iter_xrc_lines() )
 
     def generate_code(self, root, widget=None):
         "entry point for recursive code generation via _generate_code()"
@@ -345,82 +349,60 @@ class XRCCodeWriter(BaseLangCodeWriter, wcodegen.XRCMixin):
         if obj.IS_SLOT or obj.WX_CLASS=="spacer":
             if obj.WX_CLASS:  # "slot" has no code generator, but "sizerslot" or "spacer" needs to be added
                 self.add_object(obj)
-                self.add_sizeritem(obj.parent_class_object, obj.parent, obj)
             return
 
-        parent = obj.parent
-        parent_class_object = obj.parent_class_object  # used for adding to this object's sizer
-
         obj.IS_CLASS = IS_CLASS = obj.check_prop_truth("class")
 
-        # first the item
+        # first the item; it will be added directly to its sizer or parent window
         if IS_CLASS:
             self.add_class(obj)
         if not obj.IS_TOPLEVEL:
-            added = self.add_object(obj)  # added can be False if the widget is not supported
-        else:
-            added = False
+            self.add_object(obj)
 
         # then the children
         for child in obj.get_all_children():
             assert obj.children.count(child)<=1
             self._generate_code(None, None, None, child)  # XRCCodeWriter does not use the other args
 
-        # check whether the object belongs to some sizer; if applicable, add it to the sizer at the top of the stack
-        if added and parent.IS_SIZER:
-            if obj.WX_CLASS not in ("spacer",):  # spacer and slot are adding itself to the sizer
-                self.add_sizeritem(parent_class_object, parent, obj)
+    def _get_xrc(self, obj):
+        "return the XrcObject for obj; create it if required"
+        xrc_obj = getattr(obj, "xrc", None)
+        if xrc_obj is None:
+            xrc_obj = obj.xrc = self.obj_builders.get( obj.WX_CLASS, DefaultXrcObject )(obj)
+        return xrc_obj
 
+    @tracing.traced("codegen.add_object")
     def add_object(self, sub_obj):
-        "Adds the object sub_obj to the XRC tree. The first argument is unused."
-        # what we need in XRC is not top_obj, but sub_obj's true parent we don't need the sizer, but the window
-
+        """Adds the object sub_obj to the XRC tree: to the XrcObject of the sizer, if it's a sizer item, or to the
+        XrcObject of the parent window otherwise. Objects are added in tree order, so they are never moved later."""
+        parent = sub_obj.parent
+        if parent.IS_SIZER:
+            sizer_xrc = self._get_xrc(parent)
+            if sub_obj.WX_CLASS == 'spacer':
+                sizer_xrc.children.append( SpacerXrcObject(sub_obj) )
+                return True
+            if sub_obj.WX_CLASS == 'sizerslot':
+                if not parent._IS_GRIDBAG:
+                    sizer_xrc.children.append( SpacerXrcObject(None) )
+                return True
+
+        if getattr(sub_obj, "xrc", None) is not None and sub_obj in self.xrc_objects:
+            # already created by add_class; remove it, as this isn't a true toplevel object
+            del self.xrc_objects[sub_obj]
+        xrc_obj = self._get_xrc(sub_obj)
+
+        if parent.IS_SIZER:
+            parent.xrc.children.append( SizerItemXrcObject(xrc_obj, sub_obj) )
+            return True
+
+        # what we need in XRC is not the sizer, but the window
         top_obj = sub_obj.parent_window
-        builder = self.obj_builders.get( sub_obj.WX_CLASS, DefaultXrcObject )
-        try:
-            # check whether we already created the xrc_obj
-            xrc_obj = sub_obj.xrc
-        except AttributeError:
-            xrc_obj = builder(sub_obj)  # builder functions must return a subclass of XrcObject
-            sub_obj.xrc = xrc_obj
-        else:
-            # if we found it, remove it from the self.xrc_objects dictionary
-            # (if it was there, i.e. the object is not a sizer), because this isn't a true toplevel object
-            if sub_obj in self.xrc_objects:
-                del self.xrc_objects[sub_obj]
-        if not getattr(top_obj, "xrc"):
+        if getattr(top_obj, "xrc", None) is None:
             # create XrcObject and store it in the self.xrc_objects dict
-            top_xrc = self.obj_builders.get( top_obj.WX_CLASS, DefaultXrcObject )(top_obj)
-            top_obj.xrc = top_xrc
-            self.xrc_objects[top_obj] = top_xrc
+            self.xrc_objects[top_obj] = self._get_xrc(top_obj)
         top_obj.xrc.children.append(xrc_obj)
         return True
 
-    def add_sizeritem(self, unused, sizer, obj):
-        "Adds a sizeritem to the XRC tree. The first argument is unused."
-        # what we need in XRC is not toplevel, but sub_obj's true parent
-        toplevel = obj.parent_window
-
-        top_xrc = toplevel.xrc
-        obj_xrc = obj.xrc
-        try:
-            sizer_xrc = sizer.xrc
-        except AttributeError:
-            # if the sizer has not an XrcObject yet, create it now
-            sizer_xrc = self.obj_builders.get( sizer.WX_CLASS, DefaultXrcObject )(sizer)
-            sizer.xrc = sizer_xrc
-        # we now have to move the children from 'toplevel' to 'sizer'
-        index = top_xrc.children.index(obj_xrc)
-        if obj.WX_CLASS == 'spacer':
-            sizer.xrc.children.append( SpacerXrcObject(obj) )
-        elif obj.WX_CLASS == 'sizerslot':
-            if not sizer._IS_GRIDBAG:
-                sizer.xrc.children.append( SpacerXrcObject(None) )
-        else:
-            sizeritem_xrc = SizerItemXrcObject( obj_xrc, obj )
-            sizer.xrc.children.append(sizeritem_xrc)
-        del top_xrc.children[index]
-
     def add_class(self, code_obj):
         """Add class behaves very differently for XRC output than for other languages (i.e. python):
         since custom classes are not supported in XRC, this has effect only for true toplevel widgets, i.e. frames and
@@ -18,7 +18,7 @@ except:
     from hashlib import md5
 from collections import OrderedDict
 
-import logging, os, os.path, sys, tempfile
+import logging, os, os.path, shutil, sys, tempfile
 from xml.sax.saxutils import escape, quoteattr
 
 import config, compat, plugins, misc
@@ -87,6 +87,10 @@ def init_codegen():
     return all_widgets
 
 
+# modules in codegen/ that are imported as part of the package codegen, not as code writers
+_CODEGEN_HELPER_MODULES = {"verify", "class_cache"}
+
+
 def load_code_writers():
     "Fills the common.code_writers dictionary: to do so, loads the modules found in the 'codegen/' subdir"
     if config.use_gui:
@@ -95,8 +99,8 @@ def load_code_writers():
     sys.path.insert(0, codegen_path)
     for module in os.listdir(codegen_path):
         name, ext = os.path.splitext(module)
-        # skip __init__
-        if name == "__init__":
+        # skip __init__ and the modules that are not code writers
+        if name == "__init__" or name in _CODEGEN_HELPER_MODULES:
             continue
         # allow regular files only
         if not os.path.isfile(os.path.join(codegen_path, module)):
@@ -357,6 +361,10 @@ def save_file(filename, content, which='wxg'):
     else:
         raise NotImplementedError( 'Unknown value "%s" for parameter "which"!' % which )
 
+    if not isinstance(content, list):
+        # an iterator of lines; stream it to a temporary file instead of keeping it in memory
+        return _save_file_stream(filename, content, do_backup)
+
     if os.path.isfile(filename):
         # read existing file to check content
         chksum_oldcontent = _smart_checksum( _read_file(filename) )
@@ -401,6 +409,57 @@ def save_file(filename, content, which='wxg'):
             outfile.close()
 
 
+def _replace_file(src, dst):
+    "rename src to dst, replacing dst atomically if possible"
+    if hasattr(os, "replace"):
+        os.replace(src, dst)
+        return
+    # Python 2: os.rename replaces atomically on POSIX, but fails on Windows if dst exists
+    if sys.platform.startswith("win") and os.path.exists(dst):
+        os.remove(dst)
+    os.rename(src, dst)
+
+
+def _save_file_stream(filename, lines, do_backup):
+    """Write the lines (bytes) of generated code to a temporary file and calculate the checksum on the fly.
+    The existing file will only be replaced if the content has changed; its permissions are kept.
+    If filename is a symbolic link, the file it points to is replaced."""
+    path = os.path.realpath(filename)
+    if os.path.isfile(path):
+        with open(filename, 'rb') as infile:
+            win_line_ending = infile.readline().endswith(b"\r\n")
+    else:
+        win_line_ending = sys.platform.startswith("win")
+
+    # create necessary subdirectories on demand
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    tmp_name = path + ".wxglade~"
+    try:
+        with open(tmp_name, 'wb') as outfile:
+            def written():
+                for line in lines:
+                    outfile.write( line.replace(b"\n", b"\r\n") if win_line_ending else line )
+                    yield line
+            chksum_content = _smart_checksum( written() )
+
+        if os.path.isfile(path):
+            # nothing changed?
+            if _smart_checksum( _read_file(path) ) == chksum_content:
+                return
+            # create the backup file only with the first save
+            if do_backup and filename not in config.backed_up:
+                shutil.copy2(path, path + config.preferences.backup_suffix)
+                config.backed_up[filename] = True
+            shutil.copymode(path, tmp_name)
+        _replace_file(tmp_name, path)
+    finally:
+        if os.path.isfile(tmp_name):
+            os.remove(tmp_name)
+
+
 ########################################################################################################################
 # files and paths
 
@@ -723,6 +782,7 @@ def _set_file_paths(options):
         config.rc_file = os.path.join(config.appdata_path, 'wxgladerc')
     config.history_file = os.path.join(config.appdata_path, 'file_history.txt')
     config.log_file = os.path.join(config.appdata_path, 'wxglade.log')
+    config.verify_cache_file = os.path.join(config.appdata_path, 'verify_cache.txt')
 
 
 def init_preferences():
@@ -801,6 +861,7 @@ class Preferences(ConfigParser.ConfigParser):
         'autosave': True,
         'autosave_delay': 120,  # in seconds
         'show_completion': True,
+        'profile': False,
         'write_timestamp': True,
         'write_generated_from': False
         }
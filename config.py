@@ -71,6 +71,9 @@ wx_version = 'not_set'               # wxPython version string
 rc_file = ''                         # Path to the rc / ini file to store user preferences in it
 history_file = ''                    # Path to the history file, if used
 log_file = ''                        # Path to wxGlade log file
+verify_cache_file = ''               # Path to the cache of successfully verified generated files
+codegen_cache_dir = os.environ.get('WXGLADE_CODEGEN_CACHE', '')  # directory for code fragments of classes or ''
+codegen_cache_size = 200            # max. size of codegen_cache_dir in MB
 
 use_file_history =  True       # Flag to use a file history
 
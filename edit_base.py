@@ -1,10 +1,80 @@
 
+import contextlib
 import wx
 import new_properties as np
 import common, misc, compat, clipboard, config
 
 MANAGED_PROPERTIES  = ["span", "proportion", "border", "flag"]
 
+
+# while inside deferred_layout(): toplevel -> set of windows that requested a layout
+_deferred_layout = None
+# requests from layout_later(), to be processed together when the pending events have been processed
+_idle_layout = {}
+
+
+def _add_layout_request(pending, editor):
+    window = editor  if editor.IS_WINDOW else  editor.parent_window
+    pending.setdefault(editor.toplevel_parent, set()).add(window)
+
+
+def _do_layout(pending):
+    # one layout pass per toplevel
+    for toplevel, windows in pending.items():
+        if not toplevel.widget: continue
+        toplevel.invalidate_hit_index()
+        windows = [window for window in windows if window.widget and window is not toplevel]
+        for window in windows:
+            window.widget.Layout()
+        toplevel.widget.Layout()
+        toplevel.widget.SendSizeEvent()
+        if windows:
+            # the workarounds from EditBase.layout(), e.g. for gtk when pasting a widget with non-standard font
+            wx.SafeYield()
+            sent = set()
+            for window in windows:
+                for w in (window, window.parent_window):
+                    if w is None or w is toplevel or not w.widget or w in sent: continue
+                    sent.add(w)
+                    w.widget.SendSizeEvent()
+                    compat.wxWindow_SendSizeEventToParent(w.widget)
+        toplevel.widget.Refresh()
+
+
+@contextlib.contextmanager
+def deferred_layout():
+    "collect the layout requests, e.g. for bulk editing or pasting, and then do one layout pass per toplevel"
+    global _deferred_layout
+    if _deferred_layout is not None:
+        yield  # nested
+        return
+    _deferred_layout = pending = {}
+    try:
+        yield
+    finally:
+        _deferred_layout = None
+        _do_layout(pending)
+
+
+def defer_layout(editor):
+    "if inside deferred_layout(), record a layout request for the window of editor and return True"
+    if _deferred_layout is None: return False
+    _add_layout_request(_deferred_layout, editor)
+    return True
+
+
+def layout_later(editor):
+    "request a layout of the window of editor; all requests are coalesced and processed after the pending events"
+    if not _idle_layout:
+        wx.CallAfter(_process_idle_layout)
+    _add_layout_request(_idle_layout, editor)
+
+
+def _process_idle_layout():
+    pending = dict(_idle_layout)
+    _idle_layout.clear()
+    _do_layout(pending)
+
 if config.debugging:
     class _UniqueList(list):
         def append(self, obj):
@@ -44,7 +114,7 @@ class EditBase(np.PropertyOwner):
         self.item = None            # the TreeCtrl item
 
         # initialise instance properties
-        self.name = np.NameProperty(name)
+        self.add_property( "name", np.NameProperty(name) )
 
         # initialise structure
         self.parent = parent
@@ -70,6 +140,8 @@ class EditBase(np.PropertyOwner):
             self._NUMBERS = {}  # for finding new names
         elif self.IS_NAMED:
             self.toplevel_parent.track_contained_name( new_name=name )
+        if common.root is not None:
+            common.root.search_index.add(self)
 
     # manage names of contained elements ###############################################################################
     # actually, this might be too strict if contained elements are their own classes
@@ -197,14 +269,19 @@ class EditBase(np.PropertyOwner):
         return pos + self.children.index(child)
     
     def find_children(self, name=None, wx_class=None):
+        # for searching the whole project, use search.find()
         ret = []
+        self._find_children(name, wx_class, ret)
+        return ret
+
+    def _find_children(self, name, wx_class, ret):
+        # append to ret instead of building new lists on each level
         for child in self.get_all_children():
             if not child: continue
-            ret += child.find_children(name, wx_class)
+            child._find_children(name, wx_class, ret)
             if name is not None and child.name!=name: continue
             if wx_class is not None and child.WX_CLASS!=wx_class: continue
             ret.append(child)
-        return ret
 
     ####################################################################################################################
     @property
@@ -295,7 +372,11 @@ class EditBase(np.PropertyOwner):
             actions.add("label")
 
     def properties_changed(self, modified):
-        actions = np.PropertyOwner.properties_changed(self, modified)
+        actions = np.PropertyOwner.properties_changed(self, modified)  # empty for nested calls; see PropertyOwner
+        if common.root is not None:
+            if modified is None or "name" in modified or "class" in modified:
+                common.root.update_node_indices(self)
+            common.root.search_index.update(self, modified)
 
         if common.app_tree is not None and ("label" in actions or "image" in actions):
             common.app_tree.refresh(self, refresh_label=("label" in actions), refresh_image=("image" in actions))
@@ -311,8 +392,9 @@ class EditBase(np.PropertyOwner):
     def recursive_create_widgets(self, level):
         self.create_widget()
         self.finish_widget_creation(level)
-        for child in self.get_all_children():
-            child.recursive_create_widgets(level+1)
+        if not self.parent.defer_child_widgets(self, level):
+            for child in self.get_all_children():
+                child.recursive_create_widgets(level+1)
         self.child_widgets_created(level)  # if level==0, only one of the child widgets was created
         self.parent.child_widget_created(self, level)
 
@@ -320,6 +402,8 @@ class EditBase(np.PropertyOwner):
         # called once after all widgets incl. children were created or e.g. layout property modified
         # before 2020-08-10 the ClipboardXmlWidgetBuilder.endElement() had code with
         #  SafeYield, layout, Refresh, GetTopLevelParent().SendSizeEvent()
+        if defer_layout(self): return
+        self.toplevel_parent.invalidate_hit_index()
         self.widget.Layout()
         if self.IS_TOPLEVEL: return
         if self.IS_WINDOW: self.widget.SendSizeEvent()
@@ -347,6 +431,15 @@ class EditBase(np.PropertyOwner):
         if self.WX_CLASS in ("wxStatusBar",): return
         compat.SetToolTip(self.widget, self._get_tooltip_string())
 
+    def invalidate_hit_index(self):
+        # called on the toplevel after layout; implemented for toplevel windows, see find_editor_by_pos
+        pass
+
+    def defer_child_widgets(self, child, level):
+        # return True if the widgets of child's children should be created later, when child becomes visible
+        # implemented for notebook
+        return False
+
     # callbacks when children were created
     def child_widget_created(self, child, level):
         # called after child's children were also created; implemented for notebook, splitter, sizers
@@ -404,6 +497,11 @@ class EditBase(np.PropertyOwner):
         # bookkeeping
         if not self.IS_TOPLEVEL and self.IS_NAMED and self.name:
             self.toplevel_parent.track_contained_name( self.name )
+        if "class" in self.properties and common.root is not None:
+            common.root.update_class_index(self, None)
+        if common.root is not None:
+            common.root.search_index.remove(self)
+            common.root.forget_widget_path(self)
 
     def remove(self, focus=True, user=True):
         # entry point from GUI or script
@@ -596,7 +694,7 @@ class Slot(EditBase):
         self.parent.add_item(self, index)
 
         # display some help
-        self.info = np.DisplayProperty(self._get_tooltip())
+        self.add_property( "info", np.DisplayProperty(self._get_tooltip()) )
 
         # the following are just set to use the same Add call as with widgets
         self.proportion = 1
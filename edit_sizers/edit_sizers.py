@@ -18,7 +18,7 @@ import edit_base
 HAVE_WRAP_SIZER = hasattr(wx, "WrapSizer")  # only for 3.0
 
 def _frozen(method):
-    "freeze toplevel parent during update"
+    "freeze toplevel parent during update; the layout is done once at the end"
     def _frozen(sizer, *args, **kwargs):
         if config.use_freeze_thaw and sizer.window.widget:
             toplevel = sizer.window.widget.GetTopLevelParent()
@@ -27,7 +27,8 @@ def _frozen(method):
         else:
             toplevel = None
         try:
-            return method(sizer, *args, **kwargs)
+            with edit_base.deferred_layout():
+                return method(sizer, *args, **kwargs)
         finally:
             if toplevel:
                 toplevel.Refresh()
@@ -345,19 +346,20 @@ class SizerBase(edit_base.EditBase):
         self.toplevel = toplevel
 
         # initialise instance properties
-        self.orient       = OrientProperty(orient)                       # will be set from the class_orient property
-        self.class_orient = ClassOrientProperty(self.get_class_orient()) # will set the orient properties
-        self.attribute    = np.CheckBoxProperty(False, default_value=False)
-        self.fit          = np.ActionButtonProperty(self.fit_parent)
+        # orient will be set from class_orient
+        self.add_property( "orient",       OrientProperty(orient) )
+        self.add_property( "class_orient", ClassOrientProperty(self.get_class_orient()) )
+        self.add_property( "attribute",    np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "fit",          np.ActionButtonProperty(self.fit_parent) )
 
         if not self.toplevel:
             self.PROPERTIES = self.PROPERTIES + self.MANAGED_PROPERTIES + self.EXTRA_PROPERTIES
             # if within another sizer: the arguments to sizer.Add(self, proportion, flag, border)
             # same as for edit_windows.ManagedBase
-            self.span       = np.LayoutSpanProperty((1,1) )  # row,colspan for items in GridBagSizers
-            self.proportion = np.LayoutProportionProperty(1)
-            self.border     = np.SpinProperty(0, immediate=True)
-            self.flag       = np.ManagedFlags(wx.EXPAND)
+            self.add_property( "span",       np.LayoutSpanProperty((1,1) ) )  # row,colspan for items in GridBagSizers
+            self.add_property( "proportion", np.LayoutProportionProperty(1) )
+            self.add_property( "border",     np.SpinProperty(0, immediate=True) )
+            self.add_property( "flag",       np.ManagedFlags(wx.EXPAND) )
             self._has_layout = True
         else:
             self._has_layout = False
@@ -432,7 +434,7 @@ class SizerBase(edit_base.EditBase):
         edit_base.EditBase._properties_changed(self, modified, actions)
 
     def properties_changed(self, modified):
-        actions = edit_base.EditBase.properties_changed(self, modified)
+        actions = edit_base.EditBase.properties_changed(self, modified)  # empty for nested calls; see PropertyOwner
 
         if config.debugging:
             assert not {"recreate", "recreate2", "refresh", "sizeevent"}.intersection(actions)
@@ -582,7 +584,7 @@ class SizerBase(edit_base.EditBase):
             else:
                 self.widget.Fit(self.window.widget)
             # self.widget.SetSizeHints(self.window.widget)
-            self.window.widget.Layout()
+            if not edit_base.defer_layout(self): self.window.widget.Layout()
 
     def add_item(self, item, index=None):
         "Adds an item to self."
@@ -617,16 +619,12 @@ class SizerBase(edit_base.EditBase):
         if child.check_prop("size"):
             # size has been set in set_size, so we can just use GetSize here
             self.set_item_best_size(child, size=child.widget.GetSize())
-        if self.widget:
+        if self.widget and not edit_base.defer_layout(self):
             self.window.widget.Layout()
 
-    def _layout(self):
-        # for delayed callback; see next method
-        if self.widget: self.widget.Layout()
-
     def on_child_pasted(self):
         # otherwise EXPAND may not be obeyed
-        wx.CallLater(1, self._layout)
+        edit_base.layout_later(self)
 
     def destroying_child_widget(self, child, index):
         # previously in _free_slot
@@ -636,7 +634,7 @@ class SizerBase(edit_base.EditBase):
         self.widget.Detach(child.widget)
 
     def destroyed_child_widget(self):
-        self.widget.Layout()
+        if not edit_base.defer_layout(self): self.widget.Layout()
 
     def get_child_index(self, index):
         # return the index of the widget; in GridBagSizers, overlapped slots are skipped
@@ -655,6 +653,7 @@ class SizerBase(edit_base.EditBase):
             if w == -1: w = best_size[0]
             if h == -1: h = best_size[1]
             self.widget.SetItemMinSize(item, w, h)
+            if not edit_base.defer_layout(self): edit_base.layout_later(self)
 
     @_frozen
     def item_properties_modified(self, widget, modified=None):
@@ -663,6 +662,7 @@ class SizerBase(edit_base.EditBase):
 
         item = self.widget.GetItem(widget.widget)  # a SizerItem or GBSizerItem instance
         if not item: return
+        edit_base.defer_layout(self)  # the layout is done when leaving _frozen
 
         size_was_reduced = False  # will the new scaled/expanded size be smaller than the previous?
         if modified is None or ("proportion" in modified or "option" in modified) and not self._IS_GRIDBAG:
@@ -1036,7 +1036,7 @@ class EditStaticBoxSizer(BoxSizerBase):
 
     def __init__(self, name, parent, index, orient=wx.VERTICAL, label='', elements=3):
         BoxSizerBase.__init__(self, name, parent, index, orient, elements)
-        self.label = np.TextProperty(label)
+        self.add_property( "label", np.TextProperty(label) )
 
     def create_widget(self):
         BoxSizerBase.create_widget(self)
@@ -1197,10 +1197,10 @@ class GridSizerBase(SizerBase):
         else:
             # Grid and FlexGrid sizers allow columns/rows to be 0, i.e. as many as required
             val_range=(0,1000)
-        self.rows = np.SpinProperty(rows, val_range=val_range, immediate=True)
-        self.cols = np.SpinProperty(cols, val_range=val_range, immediate=True)
-        self.vgap = np.SpinProperty(vgap, immediate=True)
-        self.hgap = np.SpinProperty(hgap, immediate=True)
+        self.add_property( "rows", np.SpinProperty(rows, val_range=val_range, immediate=True) )
+        self.add_property( "cols", np.SpinProperty(cols, val_range=val_range, immediate=True) )
+        self.add_property( "vgap", np.SpinProperty(vgap, immediate=True) )
+        self.add_property( "hgap", np.SpinProperty(hgap, immediate=True) )
 
     def fit_parent(self, *args):
         "Tell the sizer to resize the window to match the sizer's minimal size"
@@ -1590,8 +1590,8 @@ class EditFlexGridSizer(GridSizerBase):
 
     def __init__(self, name, parent, index, rows=3, cols=3, vgap=0, hgap=0):
         GridSizerBase.__init__(self, name, parent, index, rows, cols, vgap, hgap)
-        self.growable_rows = _GrowablePropertyD([], default_value=[])
-        self.growable_cols = _GrowablePropertyD([], default_value=[])
+        self.add_property( "growable_rows", _GrowablePropertyD([], default_value=[]) )
+        self.add_property( "growable_cols", _GrowablePropertyD([], default_value=[]) )
         self.properties["growable_rows"].title = 'Select growable rows'
         self.properties["growable_cols"].title = 'Select growable cols'
 
@@ -123,26 +123,27 @@ class EditBase(EventsMixin, edit_base.EditBase):
         if "class" in self.PROPERTIES:
             if self.IS_TOPLEVEL:
                 # always a class
-                self.klass = klass_p = np.ClassProperty(klass, name="class")
+                klass_p = self.add_property( "klass", np.ClassProperty(klass, name="class") )
             else:
                 # optionally a class
-                self.klass = klass_p = np.ClassPropertyD(klass, name="class")
+                klass_p = self.add_property( "klass", np.ClassPropertyD(klass, name="class") )
                 if klass: klass_p.deactivated = False
 
         if "instance_class" in self.PROPERTIES:
-            self.instance_class = instance_class_p = np.InstanceClassPropertyD(instance_class, default_value=self.WX_CLASS)
+            instance_class_p = np.InstanceClassPropertyD(instance_class, default_value=self.WX_CLASS)
+            self.add_property( "instance_class", instance_class_p )
             if instance_class is not None and instance_class!=self.WX_CLASS:
                 instance_class_p.deactivated = False
 
         if "custom_base" in self.PROPERTIES:
             # for TopLevelBase, notebook, panel and splitter window
-            self.custom_base = custom_base_p = np.BaseClassesPropertyD(default_value=self.WX_CLASS)
+            custom_base_p = self.add_property( "custom_base", np.BaseClassesPropertyD(default_value=self.WX_CLASS) )
             if klass_p.deactivated: custom_base_p.set_blocked()
 
-        self.extracode       = np.CodeProperty()
-        self.extracode_pre   = np.CodeProperty()
-        self.extracode_post  = np.CodeProperty()
-        self.extraproperties = np.ExtraPropertiesProperty()
+        self.add_property( "extracode",       np.CodeProperty() )
+        self.add_property( "extracode_pre",   np.CodeProperty() )
+        self.add_property( "extracode_post",  np.CodeProperty() )
+        self.add_property( "extraproperties", np.ExtraPropertiesProperty() )
 
         EventsMixin.__init__(self)
 
@@ -335,8 +336,8 @@ class WindowBase(EditBase):
     def __init__(self, name, parent, index, klass, instance_class=None):
         EditBase.__init__(self, name, parent, index, klass, instance_class)
 
-        self.window_id = np.TextPropertyD( "wxID_ANY", name="id", default_value=None )
-        self.size      = np.SizePropertyD( "-1, -1", default_value="-1, -1" )
+        self.add_property( "window_id", np.TextPropertyD( "wxID_ANY", name="id", default_value=None ) )
+        self.add_property( "size",      np.SizePropertyD( "-1, -1", default_value="-1, -1" ) )
 
         self.sel_marker = None  # selection markers (a SelectionMarker instance)
 
@@ -345,8 +346,8 @@ class WindowBase(EditBase):
         # before that, the actual values will be stored in this dict from the actual values of the widget:
         self._original = {'font': None}
         # colors
-        self.background = np.ColorPropertyD(None)
-        self.foreground = np.ColorPropertyD(None)
+        self.add_property( "background", np.ColorPropertyD(None) )
+        self.add_property( "foreground", np.ColorPropertyD(None) )
         # font
         if "font" in self.PROPERTIES:
             if config.use_gui:
@@ -354,13 +355,13 @@ class WindowBase(EditBase):
                 font[1] = 'default'
             else:
                 font = (9, 'default', 'normal', 'normal', 0, 'Segoe UI')
-            self.font = np.FontPropertyD(tuple(font))
+            self.add_property( "font", np.FontPropertyD(tuple(font)) )
 
         # tooltip, focused, hiden
-        self.tooltip    = np.TextPropertyD(multiline="grow")
-        self.disabled   = np.CheckBoxProperty(False, default_value=False)
-        self.focused    = np.CheckBoxProperty(False, default_value=False)
-        self.hidden     = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "tooltip",    np.TextPropertyD(multiline="grow") )
+        self.add_property( "disabled",   np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "focused",    np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "hidden",     np.CheckBoxProperty(False, default_value=False) )
 
         self.toplevel_parent.parent.check_codegen(self)
 
@@ -567,7 +568,7 @@ class WindowBase(EditBase):
 
     def properties_changed(self, modified):
         actions = EditBase.properties_changed(self, modified)
-        # widget properties modified; trigger updates
+        # widget properties modified; trigger updates; for nested calls, actions is empty: the running call handles them
         if self.widget:
             if config.debugging: print("Actions", actions)
             if "recreate2" in actions:
@@ -618,7 +619,7 @@ class ManagedBase(WindowBase):
         # inside the sizer (proportion, borders, alignment...)
         self._has_layout = parent.IS_SIZER
         if self._has_layout:
-            self.max_size  = np.SizePropertyD( "-1, -1", default_value="-1, -1" )
+            self.add_property( "max_size",  np.SizePropertyD( "-1, -1", default_value="-1, -1" ) )
 
         # attributes to keep the values of the sizer properties
         if index is None:
@@ -626,10 +627,11 @@ class ManagedBase(WindowBase):
                 index = self.parent.children.index(self)
             else:
                 index = len(self.parent.children) - 1
-        self.span       = np.LayoutSpanProperty((1,1))         # cell spanning for GridBagSizer
-        self.proportion = np.LayoutProportionProperty(0)       # item growth in sizer main direction
-        self.border     = np.SpinProperty(0, immediate=True)   # border width
-        self.flag       = np.ManagedFlags(0)                   # alignment, border; expansion in other dir.
+        self.add_property( "span",       np.LayoutSpanProperty((1,1)) )        # cell spanning for GridBagSizer
+        self.add_property( "proportion", np.LayoutProportionProperty(0) )      # item growth in sizer main direction
+        self.add_property( "border",     np.SpinProperty(0, immediate=True) )  # border width
+        # alignment, border; expansion in other direction
+        self.add_property( "flag",       np.ManagedFlags(0) )
 
     def check_defaults(self):
         # apply default border if set in preferences; called explicitely from the interactive builder functions
@@ -754,7 +756,7 @@ class ManagedBase(WindowBase):
 
 class PreviewMixin(object):
     def __init__(self):
-        self.preview = np.ActionButtonProperty(self.on_preview)
+        self.add_property( "preview", np.ActionButtonProperty(self.on_preview) )
         self.preview.set_label( _('Show Preview') )
         self.preview_widget = None
         self._preview_position = None
@@ -803,6 +805,65 @@ class DesignButtonProperty(np.ActionButtonProperty):
         self.set_label(label)
 
 
+class HitIndex(object):
+    """The rectangles of the windows of a toplevel in a uniform grid, for finding the editor at a position.
+    Built on demand and dropped after each layout pass or when a drag enters the window."""
+    CELL = 64  # grid size in pixels
+
+    def __init__(self, toplevel):
+        self.entries = []  # (x0, y0, x1, y1, window) in toplevel coordinates; children after their parents
+        self._add_rects(toplevel.widget, 0, 0)
+        self.cells = {}    # (column, row) -> indices into entries
+        for i, (x0, y0, x1, y1, window) in enumerate(self.entries):
+            for column in range(x0//self.CELL, x1//self.CELL+1):
+                for row in range(y0//self.CELL, y1//self.CELL+1):
+                    self.cells.setdefault( (column, row), [] ).append(i)
+        self.editors = {}  # wx window -> editor
+        self._add_editors(toplevel)
+
+    def _add_rects(self, w, ox, oy):
+        # ox,oy: offset of w's parent; for notebooks, only the current page is visible
+        if w.HasMultiplePages():
+            page = w.GetPage(w.GetSelection())
+            x0,y0,width,height = w.GetRect()
+            self._add_rects(page, ox+x0, oy+y0)
+            return
+        if w.IsTopLevel():  # for a Frame, Rect is the screen position
+            x0,y0,width,height = w.GetClientRect()
+        else:
+            x0,y0,width,height = w.GetRect()
+        self.entries.append( (ox+x0, oy+y0, ox+x0+width, oy+y0+height, w) )
+        # the children are relative to this widget
+        ox += x0
+        oy += y0
+        for c in w.GetChildren():
+            x0,y0,width,height = c.GetRect()
+            self.entries.append( (ox+x0, oy+y0, ox+x0+width, oy+y0+height, c) )
+            if isinstance(c, wx.ScrolledWindow):
+                self._add_rects(c, ox+x0, oy+y0)
+            else:
+                self._add_rects(c, ox, oy)
+
+    def _add_editors(self, node):
+        if node.widget is None: return
+        self.editors.setdefault(node.widget, node)
+        button = getattr(node, "_btn", None)
+        if button is not None: self.editors.setdefault(button, node)
+        if hasattr(node.widget, "GetStaticBox"): self.editors.setdefault(node.widget.GetStaticBox(), node)
+        for child in node.children or []:
+            if child is not None: self._add_editors(child)
+
+    def find(self, x,y):
+        "returns the editor of the innermost window at x,y or None"
+        cell = self.cells.get( (x//self.CELL, y//self.CELL), () )
+        found = [self.entries[i][4] for i in cell if self.entries[i][0] <= x <= self.entries[i][2] and
+                                                     self.entries[i][1] <= y <= self.entries[i][3]]
+        while found:
+            editor = self.editors.get( found.pop(-1) )
+            if editor is not None: return editor
+        return None
+
+
 class TopLevelBase(WindowBase, PreviewMixin):
     "Base class for every non-managed window (i.e. Frames, Dialogs and TopLevelPanel)"
     PROPERTIES = WindowBase.PROPERTIES + ["design","preview"]
@@ -819,9 +880,10 @@ class TopLevelBase(WindowBase, PreviewMixin):
         WindowBase.__init__(self, name, parent, index, klass)
         self._oldname = name
         if "title" in self.PROPERTIES:
-            self.title = np.TextProperty(title if title is not None else name)
+            self.add_property( "title", np.TextProperty(title if title is not None else name) )
         PreviewMixin.__init__(self)
-        self.design = DesignButtonProperty(self.on_design_button)
+        self.add_property( "design", DesignButtonProperty(self.on_design_button) )
+        self._hit_index = None  # see find_editor_by_pos
 
     @property
     def window_sizer(self):
@@ -1054,57 +1116,15 @@ class TopLevelBase(WindowBase, PreviewMixin):
 
         WindowBase._properties_changed(self, modified, actions)
 
-    def _find_widget_by_pos(self, w, x,y, level=1):
-        "helper for find_widget_by_pos; w is the parent window/widget"
-        if w.HasMultiplePages():
-            page = w.GetPage(w.GetSelection())
-            x0,y0,width,height = w.GetRect()
-            return self._find_widget_by_pos(page, x-x0,y-y0, level+1)
-        ret = []
-        # check the widget itself; except for the toplevel, this is redundant
-        if w.IsTopLevel():  # for a Frame, Rect is the screen position
-            x0,y0,width,height = w.GetClientRect()
-        else:
-            x0,y0,width,height = w.GetRect() # c.GetClientRect()
-        if x0 <= x <= x0+width and y0 <= y <= y0+height:
-            ret.append(w)
-        # check the children; these are relative to this widget, so adjust x/y
-        x -= x0
-        y -= y0
-        for c in w.GetChildren():
-            x0,y0,width,height = c.GetRect() # c.GetClientRect()
-            if x0 <= x <= x0+width and y0 <= y <= y0+height:
-                ret.append(c)
-            if isinstance(c, wx.ScrolledWindow):
-                ret += self._find_widget_by_pos(c, x-x0,y-y0, level+1)
-            else:
-                ret += self._find_widget_by_pos(c, x,y, level+1)
-        return ret
+    def invalidate_hit_index(self):
+        self._hit_index = None
 
     def find_editor_by_pos(self, x,y):
         "find the Edit item at a given position"
         if self.widget is None: return None
-        found = self._find_widget_by_pos(self.widget, x,y)
-        while found:
-            w = self._find_editor( found.pop(-1), self )
-            if w: return w
-        return None
-
-    def _find_editor(self, widget, node):
-        # wx widget to editor
-        if node.widget is None:
-            return
-        if widget is node.widget: return node
-        button = getattr(node, "_btn", None)
-        if button is not None and widget is button: return node
-        if hasattr(node.widget, "GetStaticBox"):
-            if widget is node.widget.GetStaticBox(): return node
-        if node.children:
-            for child in node.children:
-                found = self._find_editor(widget, child)
-                if found is not None:
-                    return found
-        return None
+        if self._hit_index is None:
+            self._hit_index = HitIndex(self)
+        return self._hit_index.find(x,y)
 
 
 class EditStylesMixin(np.PropertyOwner):
@@ -1145,7 +1165,7 @@ class EditStylesMixin(np.PropertyOwner):
                 self.style_names = styles
         else:
             self.style_names = self.widget_writer.style_list
-        self.style = np.WidgetStyleProperty(style)  # this will read it's default value
+        self.add_property( "style", np.WidgetStyleProperty(style) )  # this will read it's default value
 
     @decorators.memoize
     def wxname2attr(self, name):
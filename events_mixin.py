@@ -110,7 +110,7 @@ class EventsMixin(object):
             events = []  # no default handler
 
         # create Property
-        self.events = EventsProperty(events) if events is not None else None
+        self.add_property( "events", EventsProperty(events) )
 
     def get_property_handler(self, name):
         if name == 'events':
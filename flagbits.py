@@ -0,0 +1,138 @@
+"""\
+Integer bitset representation of style and sizer flags.
+
+For a dict of style definitions (see config.widget_config), each flag name gets one bit, in alphabetical order.
+The rules 'rename_to', 'include', 'exclude', 'require', 'combination' and 'supported_by' are pre-computed as masks,
+such that flags can be processed with a few integer operations instead of set manipulations.
+The results are the same as for gui_mixins.StylesMixin.process_styles() and combine_styles().
+Chains of renamed flags are followed to the end; combined flags are reduced in alphabetical order.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import compat
+
+
+_cache = {}  # id(style_defs) -> (style_defs, FlagBits); see get_flag_bits()
+
+
+def get_flag_bits(style_defs):
+    "returns the FlagBits instance for the style definitions dict"
+    entry = _cache.get(id(style_defs))
+    if entry is None or entry[0] is not style_defs:
+        entry = _cache[id(style_defs)] = (style_defs, FlagBits(style_defs))
+    return entry[1]
+
+
+def get_renamed(style_defs, name):
+    "follows 'rename_to' until a flag is reached that is not renamed, e.g. for chains like A -> B -> C"
+    seen = set()
+    while name in style_defs and style_defs[name].get("rename_to") and not name in seen:
+        seen.add(name)
+        name = style_defs[name]["rename_to"]
+    return name
+
+
+def _get_names(value):
+    if not value: return ()
+    if isinstance(value, compat.basestring): return value.split("|")
+    return value
+
+
+class FlagBits(object):
+    "flag names <-> bits and masks for the rules of one set of style definitions"
+
+    def __init__(self, style_defs):
+        names = set(style_defs)
+        for defs in style_defs.values():
+            for attr in ("include", "exclude", "require", "combination"):
+                names.update( _get_names(defs.get(attr)) )
+            if defs.get("rename_to"): names.add( get_renamed(style_defs, defs["rename_to"]) )
+        # alphabetical order, such that iterating over the bits is in the order of process_styles()
+        self.names = sorted(names)
+        self.bits = dict( (name, 1<<i) for i, name in enumerate(self.names) )
+
+        count = len(self.names)
+        self.rename = [1<<i for i in range(count)]  # the bit after renaming
+        self.include = [0]*count
+        self.exclude = [0]*count
+        self.require = [0]*count
+        self.combination = [0]*count
+        self.supported_by = [None]*count
+        self.combinations = []  # (mask, bit) in the order of style_defs, as used by combine_styles()
+        for name, defs in style_defs.items():
+            i = self.names.index(name)
+            if defs.get("rename_to"): self.rename[i] = self.bits[get_renamed(style_defs, name)]
+            self.include[i] = self.encode( _get_names(defs.get("include")) )
+            self.exclude[i] = self.encode( _get_names(defs.get("exclude")) )
+            self.require[i] = self.encode( _get_names(defs.get("require")) )
+            if "supported_by" in defs: self.supported_by[i] = defs["supported_by"]
+            if "combination" in defs:
+                self.combination[i] = mask = self.encode( _get_names(defs["combination"]) )
+                self.combinations.append( (mask, self.rename[i]) )
+        self._unsupported = {}  # for_version -> mask
+
+    def encode(self, flags):
+        "returns the bits for an iterable of flag names; None if a name is not known"
+        ret = 0
+        for flag in flags:
+            bit = self.bits.get(flag)
+            if bit is None: return None
+            ret |= bit
+        return ret
+
+    def decode(self, bits):
+        "returns the flag names as set"
+        return set( self.names[i] for i in self._indices(bits) )
+
+    def _indices(self, bits):
+        # the indices of the set bits, lowest first
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def _get_unsupported(self, for_version):
+        if for_version is None: return 0
+        ret = self._unsupported.get(for_version)
+        if ret is None:
+            ret = 0
+            major = 'wx%d' % for_version[0]
+            detailed = 'wx%d%d' % for_version
+            for i, supported_by in enumerate(self.supported_by):
+                if supported_by is not None and not (major in supported_by or detailed in supported_by):
+                    ret |= 1<<i
+            self._unsupported[for_version] = ret
+        return ret
+
+    def process(self, bits, for_version):
+        "same as StylesMixin.process_styles(): 'rename_to', 'include', 'exclude', 'supported_by' and 'require'"
+        if not bits: return bits
+        renamed = 0
+        for i in self._indices(bits):
+            renamed |= self.rename[i]
+        bits = renamed
+
+        unsupported = self._get_unsupported(for_version)
+        add = remove = 0
+        for i in self._indices(bits):
+            bit = 1<<i
+            if bit & remove: continue
+            add |= self.include[i]
+            remove |= self.exclude[i] | (bit & unsupported)
+            require = self.require[i]
+            if require:
+                if require & remove: remove |= bit
+                add |= require & ~remove
+        return (bits | (add & ~remove)) & ~remove
+
+    def combine(self, bits):
+        "same as StylesMixin.combine_styles(): replace flags by combinations and remove flags part of others"
+        if not bits: return bits
+        for mask, bit in self.combinations:
+            if bits & mask == mask:
+                bits = (bits & ~mask) | bit
+        for i in self._indices(bits):
+            if bits & (1<<i):
+                bits &= ~self.combination[i]
+        return bits
@@ -9,7 +9,7 @@ Different Mixins
 import copy, decorators, logging, os
 import wx
 
-import config, compat, misc
+import config, compat, misc, flagbits, bitmap_cache
 
 
 class StylesMixin(object):
@@ -56,9 +56,18 @@ class StylesMixin(object):
         flags = set(flags.split('|'))
 
         # check for non-supported, renamed flags and ...
-        if self.style_defs:
-            flags = self.process_styles(flags)
-            flags = self.combine_styles(flags)
+        style_defs = self.style_defs
+        if style_defs:
+            flag_bits = flagbits.get_flag_bits(style_defs)
+            bits = flag_bits.encode(flags)
+            if bits is None:
+                # unknown flags
+                flags = self.process_styles(flags)
+                flags = self.combine_styles(flags)
+            else:
+                codegen = getattr(self, "codegen", None)
+                bits = flag_bits.process(bits, codegen and codegen.for_version)
+                flags = flag_bits.decode( flag_bits.combine(bits) )
 
         if hasattr(self, 'cn') and getattr(self, 'format_flags', True):
             flags = [self.cn(f) for f in flags if f]
@@ -114,12 +123,11 @@ class StylesMixin(object):
         if not flags:
             return flags
 
+        style_defs = self.style_defs
         for flag in flags.copy():
-            try:
-                flags.add(self.style_defs[flag]['rename_to'])
-                flags.remove(flag)
-            except (AttributeError, KeyError):
-                pass
+            if flag in style_defs and style_defs[flag].get('rename_to'):
+                flags.add( flagbits.get_renamed(style_defs, flag) )
+                flags.discard(flag)
 
         add = set()
         remove = set()
@@ -181,13 +189,12 @@ class StylesMixin(object):
             try:
                 if self.style_defs[style]['combination'] <= flags:
                     flags -= self.style_defs[style]['combination']
-                    style = self.style_defs[style].get('rename_to', style)
-                    flags.add(style)
+                    flags.add( flagbits.get_renamed(self.style_defs, style) )
             except KeyError:
                 pass
 
-        # combined flags: remove flags that are part of other flags already
-        for flag in flags.copy():
+        # combined flags: remove flags that are part of other flags already; in alphabetical order, like flagbits
+        for flag in sorted(flags):
             # ignore already eliminated flags
             if flag not in flags:
                 continue
@@ -333,7 +340,7 @@ class BitmapMixin(object):
                 #raise ValueError("file not found")
                 if prop: prop.set_check_result(bitmap, error="File not found: '%s'"%bitmap)
                 return compat.wx_EmptyBitmap(16, 16)
-            return wx.Bitmap(filename, wx.BITMAP_TYPE_ANY)
+            return bitmap_cache.get_bitmap(filename)
 
     def get_preview_obj_artprovider(self, bitmap, prop=None):
         """Create a wxBitmap or wx.EmptyBitmap from the given statement using wxArtProvider.
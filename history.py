@@ -5,7 +5,7 @@ copyright: 2017-2021 Dietmar Schwertberger
 license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import common, config, clipboard, misc
+import common, config, clipboard, misc, tracing
 import wx
 
 
@@ -124,6 +124,14 @@ class HistoryPropertyItem(HistoryItem):
         return "%s(%s, %r, %r, %r)"%(self.__class__.__name__, self.path, self.name, self.old, self.new)
 
 
+def get_dependent_values(prop):
+    "returns a list of (property, PropertyValue) for the properties in prop.owner.PROPERTY_DEPENDENCIES"
+    owner = prop.owner
+    return [(owner.properties[name], PropertyValue(owner.properties[name]))
+            for name in owner.get_dependent_properties([prop.name])
+            if name!=prop.name and name in owner.properties]
+
+
 class HistorySetPropertyItem(HistoryPropertyItem):
     # same as before, but tracks the flag that was checked/unchecked (self.flag_value, self.checked)
     def __init__(self, prop):
@@ -137,6 +145,30 @@ class HistorySetPropertyItem(HistoryPropertyItem):
         return (self.name, self.flag_value)
 
 
+class HistoryGroupItem(object):
+    "items that are un-/re-done together, e.g. from bulk editing of multiple widgets"
+    def __init__(self, items):
+        self.items = items
+
+    def get_key(self):
+        return None
+
+    def undo(self):
+        import edit_base
+        with edit_base.deferred_layout():
+            widgets = [item.undo() for item in reversed(self.items)]
+        return widgets[-1]
+
+    def redo(self):
+        import edit_base
+        with edit_base.deferred_layout():
+            widgets = [item.redo() for item in self.items]
+        return widgets[0]
+
+    def __repr__(self):
+        return "%s(%r)"%(self.__class__.__name__, self.items)
+
+
 class HistoryRemovedItem(HistoryItem):
     def __init__(self, widget):
         self.IS_SLOT = widget.IS_SLOT
@@ -343,6 +375,7 @@ class History(object):
         self.can_redo = bool(self.actions_redo)
         self.can_undo = bool(self.actions)
 
+    @tracing.traced("History.undo")
     def undo(self, focused_widget):
         if not self.actions:
             return wx.Bell()
@@ -351,6 +384,7 @@ class History(object):
         self.actions_redo.append(action)
         misc.set_focused_widget(widget)
 
+    @tracing.traced("History.redo")
     def redo(self, focused_widget):
         if not self.actions_redo:
             # XXX check whether it's the same
@@ -438,16 +472,24 @@ class History(object):
         if config.debugging: print("property_changing", prop)
         self._buffer = HistoryPropertyItem(prop)
         self._monitor = []  # list of (property, PropertyValue)
+        self._monitor_dependent_properties(prop)
 
     def set_property_changing(self, prop):
         # same as before, but this will track the clicked flag
         if config.debugging: print("set_property_changing", prop)
         self._buffer = HistorySetPropertyItem(prop)
         self._monitor = []  # list of (property, PropertyValue)
+        self._monitor_dependent_properties(prop)
+
+    def _monitor_dependent_properties(self, prop):
+        # monitor the properties declared in owner.PROPERTY_DEPENDENCIES
+        for p, value in get_dependent_values(prop):
+            self.monitor_property(p)
 
     def monitor_property(self, prop):
         # monitor dependent properties; these will be un-/re-done together with the main property
         if not self._buffer: return
+        if any(p is prop for p, value in self._monitor): return
         self._monitor.append( (prop, PropertyValue(prop)))
 
     def _finalize_item(self, stop=False):
@@ -499,6 +541,11 @@ class History(object):
         self._structure_item = None
 
     # sizers
+    def group_added(self, items):
+        "items have been applied in one transaction, e.g. by bulk_edit; they will be un-/re-done together"
+        if not items: return
+        self.add_item( HistoryGroupItem(items), can_repeat=False )
+
     def sizer_slots_added(self, sizer, index, count):
         # called from SizerBase.insert_slot and add_slot
         self.add_item( HistorySizerSlots(sizer, index, count), can_repeat=False )
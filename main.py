@@ -15,7 +15,7 @@ from xml.sax import SAXParseException
 
 # import project modules
 import application
-import common, config, compat, misc, history
+import common, config, compat, misc, history, tracing
 import new_properties as np
 import preferencesdialog, msgdialog, bugdialog, about
 import log
@@ -85,6 +85,8 @@ class wxGladePropertyPanel(wx.Panel):
         sizer.Add(self.heading, 0, wx.EXPAND, 0)
         self.notebook = wx.Notebook(self)
         self.notebook.Bind(wx.EVT_SIZE, self.on_notebook_size)
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+        self._pending_pages = {}  # page index -> (widget, panel, sizer, property names); filled on first activation
 
         sizer.Add(self.notebook, 1, wx.EXPAND, 0)
 
@@ -116,6 +118,7 @@ class wxGladePropertyPanel(wx.Panel):
             # just update
             return
         self.next_widget = widget
+        self._pending_pages.clear()
         if self.current_widget:
             # this might not be executed if there was an error during creation of the property editors
             for editor in self.current_widget.properties.values():
@@ -168,45 +171,38 @@ class wxGladePropertyPanel(wx.Panel):
 
         self.pagenames = pagenames = []
         self.sizers = []
+        self._pending_pages.clear()
         if not edit_widget: return
-        current_page = current_sizer = current_pagename = None
-        property_instance = None
+
+        # collect the pages and their properties
+        pages = []  # (page name, [property names])
+        properties = None
         for prop in edit_widget.PROPERTIES:
             if prop[0].isupper():
-                # end previous page
-                if current_page is not None:
-                    self.end_page(current_page, current_sizer, current_pagename)
-                    current_page = None
-
                 # start new page
-                current_pagename = prop
+                properties = None
                 if prop=="Layout" and not edit_widget._has_layout:continue
                 if prop=="Events" and edit_widget.events is None: continue
+                properties = []
+                pages.append( (prop, properties) )
+                pagenames.append(prop)
+            elif properties is not None:
+                properties.append(prop)
+
+        # only the editors of the selected page are created now; the others on first activation
+        index = pagenames.index(select_page) if select_page and select_page in pagenames else 0
+        for i, (pagename, properties) in enumerate(pages):
+            panel = self.start_page(pagename)
+            sizer = wx.BoxSizer(wx.VERTICAL)
+            self.sizers.append(sizer)
+            if i==index:
+                self.fill_page(edit_widget, panel, sizer, properties)
+            else:
+                self._pending_pages[i] = (edit_widget, panel, sizer, properties)
+            self.end_page(panel, sizer, pagename)
 
-                current_page = self.start_page(prop)
-                current_sizer = wx.BoxSizer(wx.VERTICAL)
-                self.sizers.append(current_sizer)
-
-                self.pagenames.append(prop)
-
-                continue
-
-            if current_pagename=="Layout" and not edit_widget._has_layout: continue
-
-            # a property or None
-            property_instance_ = edit_widget.properties.get(prop)
-            if property_instance_ is not None:
-                property_instance = property_instance_
-                property_instance.create_editor(current_page, current_sizer)
-
-        if current_page is not None:
-            self.end_page(current_page, current_sizer, current_pagename)
-
-        if select_page and select_page in pagenames:
-            index = pagenames.index(select_page)
+        if pages:
             self.notebook.SetSelection(index)
-        else:
-            self.notebook.SetSelection(0)
 
         self.notebook.Show()
 
@@ -221,8 +217,15 @@ class wxGladePropertyPanel(wx.Panel):
             panel.SetBackgroundColour(scrolled.GetBackgroundColour())
         return panel
 
-    def end_page(self, panel, sizer, header, select=False):
+    def fill_page(self, edit_widget, panel, sizer, properties):
+        # create the property editors
+        for name in properties:
+            property_instance = edit_widget.properties.get(name)
+            if property_instance is not None:
+                property_instance.create_editor(panel, sizer)
         sizer.AddSpacer(30)
+
+    def end_page(self, panel, sizer, header, select=False):
         panel.SetAutoLayout(1)
         panel.SetSizer(sizer)
         sizer.Layout()
@@ -232,6 +235,29 @@ class wxGladePropertyPanel(wx.Panel):
         self.notebook.AddPage(scrolled, _(header),select=select)
         self._set_page_size(scrolled)
 
+    def create_page(self, index):
+        # create the editors of a page that was not yet displayed
+        if index not in self._pending_pages: return
+        edit_widget, panel, sizer, properties = self._pending_pages.pop(index)
+        self.notebook.Freeze()
+        try:
+            self.fill_page(edit_widget, panel, sizer, properties)
+            sizer.Layout()
+            sizer.Fit(panel)
+            self._set_page_size(panel.GetParent())
+        finally:
+            self.notebook.Thaw()
+
+    def select_page(self, index):
+        # like ChangeSelection, but creates the editors
+        self.create_page(index)
+        self.notebook.ChangeSelection(index)
+
+    def on_page_changed(self, event):
+        if event.GetEventObject() is self.notebook:
+            self.create_page( event.GetSelection() )
+        event.Skip()
+
     def _set_page_size(self, scrolled):
         # set ScrolledWindow and Panel to available size; enable scrolling, if required
         # gets available size for notebook pages
@@ -573,6 +599,14 @@ class wxGladeFrame(wx.Frame):
           helpString="Repeat the last property modifications on another widget (multiple modifications, if applicable)")
         misc.bind_menu_item(self, item, lambda: common.history.repeat(misc.focused_widget))
 
+        item = append_menu_item(edit_menu, -1, _('Apply Properties to Multiple Widgets...'),
+          helpString="Copy properties of the selected widget to other widgets; can be un-done in one step")
+        misc.bind_menu_item(self, item, self.bulk_edit)
+
+        item = append_menu_item(edit_menu, -1, _('Find Widget...\tCtrl+F'),
+          helpString="Find a widget by name, class, label or event handler name and select it")
+        misc.bind_menu_item(self, item, self.find_widget)
+
         edit_menu.AppendSeparator() # ----------------------------------------------------------------------------------
 
         item = append_menu_item(edit_menu, -1, _('Template Manager...'))
@@ -851,7 +885,7 @@ class wxGladeFrame(wx.Frame):
                 return
             i = self.property_panel.pagenames.index(section)
             if self.property_panel.notebook.GetSelection() != i:
-                self.property_panel.notebook.ChangeSelection(i)
+                self.property_panel.select_page(i)
             else:
                 self.property_panel.notebook.SetFocus()
                 # try to set the focus if the widget has changed; this is not yet implemented for many property types
@@ -1294,6 +1328,14 @@ class wxGladeFrame(wx.Frame):
                 fn = os.path.basename(infilename).encode('ascii', 'replace')
                 bugdialog.Show(_('Import File "%s"') % fn, inst)
 
+    def bulk_edit(self):
+        import bulk_edit
+        bulk_edit.show_dialog()
+
+    def find_widget(self):
+        import search
+        search.show_dialog()
+
     def manage_templates(self):
         to_edit = template.manage_templates()
         if to_edit is not None and self.ask_save():
@@ -1482,6 +1524,10 @@ class wxGlade(wx.App):
             self.SetAssertMode(0)
 
         common.init_preferences()
+        if config.preferences.profile and not tracing.enabled:
+            trace_file = os.path.join(config.appdata_path, "wxglade_trace.json")
+            logging.info(_("Profiling data will be written to %s"), trace_file)
+            tracing.write_at_exit(trace_file)
 
         self.locale = wx.Locale(wx.LANGUAGE_DEFAULT)  # avoid PyAssertionErrors
         #compat.wx_ArtProviderPush(wxGladeArtProvider())
@@ -7,7 +7,7 @@ Miscellaneous stuff, used in many parts of wxGlade
 @license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import common, config, compat
+import common, config, compat, tracing, bitmap_cache
 import logging, os, re, time
 import wx
 
@@ -55,9 +55,11 @@ def set_focused_widget(widget, force=False, delayed=False):
         common.shell.txt_path.SetValue( widget and widget.get_path() or "" )
 
     focused_time = time.time()
-    if widget and widget.widget:
-        # ensure that it is visible and selection is displayed, if applicable
+    if widget:
+        # ensure that it is visible; on a notebook page that was not displayed yet, this will create the widget
         show_widget(widget)
+    if widget and widget.widget:
+        # ensure that selection is displayed, if applicable
         widget.update_view(selected=True)
         # set focus in Design window to move away from certain widgets
         if set_focus and hasattr(widget.widget, "HasFocus") and not widget.widget.HasFocus():
@@ -71,6 +73,7 @@ def _set_focused_widget(widget, force=False):
     set_focused_widget(widget, force)
 
 
+@tracing.traced("misc.rebuild_tree")
 def rebuild_tree(widget=None, recursive=True, focus=True, freeze=False):
     # re-build tree control for the widget and it's children; set focus to it; called after creation or modification
     common.root.saved = False
@@ -81,14 +84,13 @@ def rebuild_tree(widget=None, recursive=True, focus=True, freeze=False):
 
 def show_widget(widget):
     # ensure that notebook pages are selected such that widget is visible
-    if not widget.widget: return
     while True:
         if not widget.parent: break  # Application.node is None
         parent = widget.parent
         if parent.__class__.__name__=="EditNotebook":
             # a widget under a wxNotebook without a panel: select page
             if parent.widget and widget in parent.children:
-                parent.widget.SetSelection( parent.children.index(widget) )
+                parent.select_page( parent.children.index(widget) )
 
         widget = parent  # go up one level
 
@@ -670,6 +672,11 @@ def design_title(title):
 
 
 def get_xpm_bitmap(path):
+    "returns the bitmap from the file, which may be inside a ZIP archive; shared bitmaps are cached by bitmap_cache"
+    return bitmap_cache.get_bitmap(path, loader=_load_xpm_bitmap)
+
+
+def _load_xpm_bitmap(path):
     bmp = wx.NullBitmap
     if not os.path.exists(path):
         if '.zip' in path:
@@ -13,6 +13,7 @@ import common, config, compat, logging, misc
 from collections import OrderedDict
 import re, os
 import wx
+import wx.grid
 
 if wx.Platform != '__WXMSW__':
     import wx.lib.stattext
@@ -56,6 +57,10 @@ misc.flush_functions.append(flush_current_property)
 
 class Property(object):
     "Base class for property editors"
+    # the state that every instance has; everything else is stored in __dict__ on demand, i.e. the class attributes
+    # below are shared defaults: e.g. 'blocked' or editor controls are only stored per instance when they are set;
+    # the instance dict is created on the first such assignment only, e.g. by set_active() or by create_editor()
+    __slots__ = ("value", "default_value", "owner", "name", "attributename", "__dict__")
     deactivated = None # None: can not be deactivated; otherwise bool value
     auto_activated = False # if True, it can be deactivated, but not by the user
     readonly = False
@@ -66,19 +71,18 @@ class Property(object):
     HAS_DATA = True
     min_version = None  # can be overwritten in instances; currently only used by BitmapProperty
     _error = _warning = _checked = None  # used by TextProperty and derived classes
+    previous_value = None  # only set during call of self.owner.properties_changed
+    blocked = False  # can be set to True by the owner, depending on another property value; value will still be written
+    controls = None
+    editing = False
 
     def __init__(self, value, default_value=_DefaultArgument, name=None):#, write_always=False):
         self.value = value
-        self.previous_value = None  # only set during call of self.owner.properties_changed
         # when the property is assigned to an instance property, these will be set:
         self.owner = None
         self.name = name
         self.attributename = None
-        # this can be set to True by the owner, depending on another property value; value will still be written to XML
-        self.blocked = False
         self.default_value = default_value
-        self.controls = None
-        self.editing = False
 
     def set_owner(self, owner, attributename=None):
         self.owner = owner
@@ -356,19 +360,23 @@ class Property(object):
 
 # these classes are not really used, as they don't have an editor:
 class PropertyA(Property):
+    __slots__ = ()
     # can be activated/deactivated; active by default
     deactivated = False
 
 class PropertyD(Property):
+    __slots__ = ()
     # can be activated/deactivated; deactivated by default
     deactivated = True
 
 class PropertyRO(Property):
+    __slots__ = ()
     # can be activated/deactivated; deactivated by default
     readonly = True
 
 
 class SpinProperty(Property):
+    __slots__ = ("val_range", "immediate")
     # int
     CONTROLNAMES = ["enabler", "spin"]
     def __init__(self, value, val_range=(0,1000), immediate=False, default_value=_DefaultArgument, name=None):
@@ -483,12 +491,15 @@ class SpinProperty(Property):
             #Property.write(self, outfile, tabs)
 
 class SpinPropertyA(SpinProperty):
+    __slots__ = ()
     deactivated = False
 class SpinPropertyD(SpinProperty):
+    __slots__ = ()
     deactivated = True
 
 
 class SpinDoubleProperty(SpinProperty):
+    __slots__ = ()
     # float
     deactivated = False
     def _set_converter(self, value):
@@ -527,8 +538,10 @@ class SpinDoubleProperty(SpinProperty):
 
 
 class SpinDoublePropertyA(SpinDoubleProperty):
+    __slots__ = ()
     deactivated = False
 class SpinDoublePropertyD(SpinDoubleProperty):
+    __slots__ = ()
     deactivated = True
 
 
@@ -537,6 +550,7 @@ def _is_gridbag(sizer):
 
 
 class LayoutProportionProperty(SpinProperty):
+    __slots__ = ()
     def __init__(self, value):
         SpinProperty.__init__(self, value, name="option", immediate=True)
 
@@ -562,6 +576,7 @@ class LayoutProportionProperty(SpinProperty):
 
 
 class LayoutSpanProperty(Property):
+    __slots__ = ("immediate",)
     TOOLTIP = "cell spanning for GridBagSizer items: rows, columns\nOnly editable if the adjacent cells are empty."
     # (int,int)
     CONTROLNAMES = ["rowspin","colspin"]
@@ -661,6 +676,7 @@ class LayoutSpanProperty(Property):
 
 
 class CheckBoxProperty(Property):
+    __slots__ = ()
     # bool
     CONTROLNAMES = ["checkbox"]
 
@@ -708,6 +724,7 @@ class CheckBoxProperty(Property):
 
 
 class InvCheckBoxProperty(CheckBoxProperty):
+    __slots__ = ()
     # display is inverted; used for application.overwrite
     def _display_value(self):
         self.checkbox.SetValue( not bool(self.value) )
@@ -719,6 +736,7 @@ class InvCheckBoxProperty(CheckBoxProperty):
 
 
 class RadioProperty(Property):
+    __slots__ = ("values", "aliases", "labels", "tooltips", "columns")
     # choice
     CONTROLNAMES = ["options"]
 
@@ -775,6 +793,7 @@ class RadioProperty(Property):
 
 
 class IntRadioProperty(RadioProperty):
+    __slots__ = ()
     #def set(self, value, activate=False, deactivate=False):
     #    RadioProperty.set(self, int(value), activate, deactivate)
     def _set_converter(self, value):
@@ -782,6 +801,7 @@ class IntRadioProperty(RadioProperty):
 
 
 class _CheckListProperty(Property):
+    __slots__ = ("_names", "_values", "value_set", "enabler", "_choices", "_ignore_names", "_one_required")
     # common base class for Flags and WidgetStyleFlags; keeps self.value_set as a set of strings
     CONTROLNAMES = ["enabler", "_choices"]
     EXCLUDES = EXCLUDES2 = None  # EXCLUDES2 will be set dynamically
@@ -1080,6 +1100,7 @@ class _CheckListProperty(Property):
 
 
 class ManagedFlags(_CheckListProperty):
+    __slots__ = ("styles", "style_defs")
     # for ManagedBase.flags; e.g. wxEXPAND, wxALIGN_RIGHT,...,wxALL,
     # XXX handle combinations and exclusions
     # XXX support wxRESERVE_SPACE_EVEN_IF_HIDDEN for 3.x
@@ -1150,6 +1171,7 @@ class ManagedFlags(_CheckListProperty):
 
 
 class WidgetStyleProperty(_CheckListProperty):
+    __slots__ = ("_value",)
     # for widget style flags; XXX handle combinations and exclusions
     def __init__(self, value=0):
         # the value will be set later in set_owner()
@@ -1278,6 +1300,7 @@ class ExpandoTextCtrl(wx.lib.expando.ExpandoTextCtrl):
 
 
 class TextProperty(Property):
+    __slots__ = ("multiline", "text", "strip", "fixed_height")
     # text
     _HORIZONTAL_LAYOUT = True # label, checkbox, text in the same line; otherwise text will be in the second line
     CONTROLNAMES = ["enabler", "text"]
@@ -1580,11 +1603,14 @@ class TextProperty(Property):
 
 
 class TextPropertyA(TextProperty):
+    __slots__ = ()
     deactivated = False
 class TextPropertyD(TextProperty):
+    __slots__ = ()
     deactivated = True
 
 class TextPropertyRO(TextProperty):
+    __slots__ = ()
     readonly = True
 
 
@@ -1592,6 +1618,7 @@ class TextPropertyRO(TextProperty):
 # some text properties with validation:
 
 class FloatPropertyA(TextPropertyA):
+    __slots__ = ("val_range",)
     # used as replacement for SpinDoubleProperty if SpinCtrlDouble is not available
     validation_re = re.compile( _leading + _float + _trailing )  # match a float
     def __init__(self, value, val_range=None, immediate=False, default_value=_DefaultArgument, name=None):
@@ -1632,16 +1659,28 @@ class FloatPropertyA(TextPropertyA):
 
 
 class FloatPropertyD(FloatPropertyA):
+    __slots__ = ()
     deactivated = True
 
 
 class NameProperty(TextProperty):
+    __slots__ = ()
     #validation_re  = re.compile(r'^[a-zA-Z_]+[\w-]*(\[\w*\])*$')  # Python 3 only, including non-ASCII characters
     validation_re  = re.compile(r'^[a-zA-Z_]+[a-zA-Z0-9_-]*$')  # Python 2 also; for lisp a hyphen - is allowed
 
+    def set(self, value, activate=None, deactivate=None, notify=False):
+        TextProperty.set(self, value, activate, deactivate, notify)
+        # keep the index of toplevel names up to date; see EditRoot.add_item
+        if common.root is not None and self.owner in common.root.toplevel_name_index:
+            common.root.toplevel_name_index.set(self.owner, self.value)
+
     def _check_name_uniqueness(self, name):
         # check whether the name is unique
         if self.owner.IS_TOPLEVEL:
+            if self.owner.parent.IS_ROOT:
+                for child in self.owner.parent.toplevel_name_index.get(name):
+                    if child is not self.owner and child.name==name: return False
+                return True
             for child in self.owner.parent.children:
                 if child is self.owner: continue
                 if child.name==name: return False
@@ -1673,16 +1712,19 @@ class NameProperty(TextProperty):
 
 
 class InstanceClassPropertyD(TextProperty):
+    __slots__ = ()
     deactivated = True
     validation_re = re.compile(r'^[a-zA-Z_]+[\w:.0-9-]*$')
 
 
 class BaseClassesPropertyD(TextProperty):
+    __slots__ = ()
     deactivated = True
     validation_re = re.compile(r'^[a-zA-Z_]+[\w:.0-9-\,]*$')
 
 
 class ClassProperty(TextProperty):
+    __slots__ = ()
     validation_re = re.compile(r'^[a-zA-Z_]+[\w:.0-9-]*$')
     _UNIQUENESS_MSG1 = "Name not unique; code will only be created for one window/widget."
     _UNIQUENESS_MSG2 = ("Name not unique; imported class may be overwritten, as\n"
@@ -1692,34 +1734,31 @@ class ClassProperty(TextProperty):
         """Check whether the class name is unique, as otherwise the source code would be overwritten.
         Returns string message if not unique, None else."""
         if klass==self.owner.WX_CLASS: return None
-        if "." in klass:
-            leaf = klass.rsplit(".",1)[-1]
-        else:
-            leaf = None
-
-        # shortcut: check sibilings first
-        siblings = self.owner.parent.get_all_children()
-        for node in siblings:
+        # the index may contain nodes with temporary class names (see set_temp), so the values are checked again
+        for node in common.root.class_index.get(klass):
             if node is self.owner or not node.check_prop("class"): continue
             if node.klass==klass:
                 return self._UNIQUENESS_MSG1
-            if leaf and "." in node.klass and leaf==node.klass.rsplit(".",1)[-1]:
-                return self._UNIQUENESS_MSG2
-
-        # check recursively, starting from root
-        def check(children):
-            for c in children:
-                if c is None or c.IS_SLOT: continue
-                if c.children:
-                    result = check(c.children)
-                    if result: return result
-                if c is self.owner or not c.check_prop("class"): continue
-                if c.klass==klass:
-                    return self._UNIQUENESS_MSG1
-                if leaf and "." in c.klass and leaf==c.klass.rsplit(".",1)[-1]:
+        if "." in klass:
+            leaf = klass.rsplit(".",1)[-1]
+            for node in common.root.class_leaf_index.get(leaf):
+                if node is self.owner or not node.check_prop("class"): continue
+                if "." in node.klass and leaf==node.klass.rsplit(".",1)[-1]:
                     return self._UNIQUENESS_MSG2
-            return None
-        return check(common.root.children)
+        return None
+
+    def set_owner(self, owner, attributename=None):
+        TextProperty.set_owner(self, owner, attributename)
+        self._update_index()
+
+    def set(self, value, activate=None, deactivate=None, notify=False):
+        TextProperty.set(self, value, activate, deactivate, notify)
+        self._update_index()
+
+    def _update_index(self):
+        # the raw value is indexed, as activation may be modified directly; see _check_class_uniqueness
+        if common.root is not None and self.owner is not None:
+            common.root.update_class_index(self.owner, self.value or None)
 
     def _check(self, klass, ctrl=None):
         msg = self._check_class_uniqueness(klass)
@@ -1727,10 +1766,12 @@ class ClassProperty(TextProperty):
 
 
 class ClassPropertyD(ClassProperty):
+    __slots__ = ()
     deactivated = True
 
 
 class IntPairPropertyD(TextPropertyD):
+    __slots__ = ()
     # the value is still a string, but it's guaranteed to have the right format
     validation_re = re.compile(_leading + _ge_0 + _comma + _ge_0 + _trailing )  # match a pair of positive integers
     normalization = "%s, %s" # for normalization % valiation_re.match(...).groups()
@@ -1757,6 +1798,7 @@ class IntPairPropertyD(TextPropertyD):
 
 
 class SizePropertyD(IntPairPropertyD):
+    __slots__ = ()
     d = r"(\s*[dD]?)" # the trailig d for "dialog units"
     validation_re = re.compile( _leading + _ge_m1 + _comma + _ge_m1 + d + _trailing, re.IGNORECASE )
     del d
@@ -1802,6 +1844,7 @@ class SizePropertyD(IntPairPropertyD):
 
 
 class IntRangePropertyA(IntPairPropertyD):
+    __slots__ = ("notnull",)
     deactivated = False
     validation_re = re.compile( _leading + _int + _comma + _int + _trailing )  # match pair of integers
     normalization = "%s, %s"
@@ -1834,6 +1877,7 @@ class IntRangePropertyA(IntPairPropertyD):
 
 
 class FloatRangePropertyA(IntRangePropertyA):
+    __slots__ = ()
     validation_re = re.compile( _leading + _float + _comma + _float + _trailing )  # match pair of floats
 
     def _convert_from_text(self, value):
@@ -1854,6 +1898,7 @@ del _leading, _ge_m1, _g_0, _ge_0, _comma, _trailing, _float, _int
 ########################################################################################################################
 
 class ComboBoxProperty(TextProperty):
+    __slots__ = ("choices",)
     _CB_STYLE = wx.CB_DROPDOWN
     def __init__(self, value="", choices=[], strip=False, default_value=_DefaultArgument, name=None):
         self.choices = choices
@@ -1900,12 +1945,15 @@ class ComboBoxProperty(TextProperty):
 
 
 class ComboBoxPropertyA(ComboBoxProperty):
+    __slots__ = ()
     deactivated = False
 class ComboBoxPropertyD(ComboBoxProperty):
+    __slots__ = ()
     deactivated = True
 
 
 class ListBoxProperty(ComboBoxProperty):
+    __slots__ = ()
     _CB_STYLE = wx.CB_DROPDOWN | wx.CB_READONLY
 
     def _on_text_click(self, event):
@@ -1931,13 +1979,16 @@ class ListBoxProperty(ComboBoxProperty):
         #return combo
 
 class ListBoxPropertyA(ListBoxProperty):
+    __slots__ = ()
     deactivated = False
 class ListBoxPropertyD(ListBoxProperty):
+    __slots__ = ()
     deactivated = True
 
 
 
 class DialogProperty(TextProperty):
+    __slots__ = ("dialog", "button")
     # for now, this is only a base class for FileName, Color and FontProperty
     CONTROLNAMES = ["enabler", "text"]#, "button"]
     def __init__(self, value="", multiline=False, strip=True, default_value=_DefaultArgument, name=None):
@@ -2017,8 +2068,10 @@ class DialogProperty(TextProperty):
 
 
 class DialogPropertyD(DialogProperty):
+    __slots__ = ()
     deactivated = True
 class DialogPropertyA(DialogProperty):
+    __slots__ = ()
     deactivated = False
 
 
@@ -2042,6 +2095,7 @@ class _FileDialog:
 
 
 class FileNameProperty(DialogProperty):
+    __slots__ = ("style",)
     # these can be set on an instance
     message = _("Choose a file")
     wildcard = _("All files|*")
@@ -2092,10 +2146,12 @@ class FileNameProperty(DialogProperty):
 
 
 class FileNamePropertyD(FileNameProperty):
+    __slots__ = ()
     deactivated = True
 
 
 class BitmapProperty(FileNameProperty):
+    __slots__ = ("_size",)
     def __init__(self, value="", name=None, min_version=None):
         self._size = None  # will be set when a bitmap is loaded
         style = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
@@ -2131,6 +2187,7 @@ class BitmapProperty(FileNameProperty):
 
 
 class BitmapPropertyD(BitmapProperty):
+    __slots__ = ()
     deactivated = True
     def __init__(self, value="", name=None, min_version=None):
         self._size = self._warning = self._error = self._checked = None
@@ -2140,6 +2197,7 @@ class BitmapPropertyD(BitmapProperty):
 
 
 class ColorProperty(DialogProperty):
+    __slots__ = ()
     STRIP = True
     str_to_colors = {
         'wxSYS_COLOUR_SCROLLBAR': wx.SYS_COLOUR_SCROLLBAR,
@@ -2254,9 +2312,11 @@ class ColorProperty(DialogProperty):
 
 
 class ColorPropertyD(ColorProperty):
+    __slots__ = ()
     deactivated = True
 
 class FontProperty(DialogProperty):
+    __slots__ = ()
     # keep this in sync with wxGladeFontDialog
     font_families_to = {'default': wx.FONTFAMILY_DEFAULT,
                         'decorative': wx.FONTFAMILY_DECORATIVE, 'roman': wx.FONTFAMILY_ROMAN,
@@ -2325,10 +2385,86 @@ class FontProperty(DialogProperty):
 
 
 class FontPropertyD(FontProperty):
+    __slots__ = ()
     deactivated = True
 
 
 
+class _GridPropertyTable(wx.grid.GridTableBase):
+    """Virtual table for the GridProperty editor: cell values are read from the property when they are displayed,
+    such that large values don't need to be copied into the grid."""
+    def __init__(self, prop):
+        wx.grid.GridTableBase.__init__(self)
+        self.prop = prop
+        self.pending = {}  # (row, col) -> string; entered into the grid, but not yet processed by the property
+
+    def _get_values(self):
+        prop = self.prop
+        return prop.editing_values if prop.editing_values is not None else prop.value
+
+    def _get_value(self, row, col):
+        values = self._get_values()
+        if row < len(values):
+            value = values[row]
+            if value is None: return ""
+        else:
+            value = self.prop.default_row  # the empty row to add entries
+        return compat.unicode(value[col]) if col < len(value) else ""
+
+    # interface for wx.grid.Grid
+    def GetNumberRows(self):
+        ret = len(self._get_values())
+        if self.prop.can_add and self.prop.immediate: ret += 1
+        return ret
+
+    def GetNumberCols(self):
+        return len(self.prop.col_defs)
+
+    def IsEmptyCell(self, row, col):
+        return not self.GetValue(row, col)
+
+    def GetValue(self, row, col):
+        if (row, col) in self.pending: return self.pending[(row, col)]
+        return self._get_value(row, col)
+
+    def SetValue(self, row, col, value):
+        # called when the user has entered a value; will be processed by the property's event handler
+        if value == self._get_value(row, col):
+            self.pending.pop( (row, col), None )
+        else:
+            self.pending[(row, col)] = value
+
+    def GetColLabelValue(self, col):
+        return self.prop.col_defs[col][0]
+
+    def GetRowLabelValue(self, row):
+        indices = getattr(self.prop, "indices", None)
+        if not self.prop.with_index or indices is None or row >= len(indices): return ""
+        return indices[row]
+
+    # notification of the grid after the values have been modified
+    def _send(self, *args):
+        self.GetView().ProcessTableMessage( wx.grid.GridTableMessage(self, *args) )
+
+    def rows_inserted(self, pos, count=1):
+        self.pending.clear()
+        self._send(wx.grid.GRIDTABLE_NOTIFY_ROWS_INSERTED, pos, count)
+
+    def rows_deleted(self, pos, count=1):
+        self.pending.clear()
+        self._send(wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, pos, count)
+
+    def update_rows(self):
+        "append or delete rows at the end, such that the grid's number of rows matches the values"
+        rows = self.GetNumberRows()
+        current = self.GetView().GetNumberRows()
+        if rows > current:
+            self._send(wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED, rows - current)
+        elif rows < current:
+            self._send(wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, rows, current - rows)
+
+
+
 class GridProperty(Property):
     """Property whose values are modified through a wxGrid table.
 
@@ -2342,6 +2478,8 @@ class GridProperty(Property):
     col_sizes:       List of column widths
     with_index:      if True, the owner's method 'set_%s'%self.attributename will be called with new value and indices
     """
+    __slots__ = ("default_row", "with_index", "col_defs", "immediate", "can_add", "can_remove", "can_insert",
+                 "can_remove_last", "cur_row", "cur_col", "editing_values", "grid", "table", "_last_focus", "col_sizes")
     STRING, INT, FLOAT, BOOL = 0, 1, 2, 3
     # List of functions to set the column format:
     col_format = [lambda g, c: None,
@@ -2380,7 +2518,7 @@ class GridProperty(Property):
             self.col_sizes = col_sizes
         self.cur_row = self.cur_col = 0
         self.editing_values = None # before pressing Apply; stored here because the editor grid might be deleted
-        self.grid = None
+        self.grid = self.table = None
         self._last_focus = None
         self._initialize_indices()
 
@@ -2480,16 +2618,14 @@ class GridProperty(Property):
                 editor.Bind(wx.EVT_CHAR_HOOK, self.on_char_editor)
                 editor.Bind(wx.EVT_TEXT, self.on_text_editor)
 
-        # the grid #####################################################################################################
+        # the grid; values are provided by a virtual table ##############################################################
         self.grid = wx.grid.Grid(parent, -1)
         self.grid.Name = self.name
-        rowcount = len(self.value)
-        if self.can_add and self.immediate: rowcount += 1
-        self.grid.CreateGrid( rowcount, len(self.col_defs) )
+        self.table = _GridPropertyTable(self)
+        self.grid.SetTable(self.table, True)
         self.grid.SetMargins(0, 0)
 
         for i, (label,datatype) in enumerate(self.col_defs):
-            self.grid.SetColLabelValue(i, label)
             GridProperty.col_format[datatype](self.grid, i)
 
         # set row/col sizes
@@ -2528,6 +2664,9 @@ class GridProperty(Property):
         self._width_delta = None
         self._last_focus = None
 
+    def destroy_editor(self):
+        Property.destroy_editor(self)
+        self.table = None
 
     def activate_controls(self):
         # take care of the optional, accessibility related widgets
@@ -2818,28 +2957,10 @@ class GridProperty(Property):
         if start_editing: self.editing = True
         if not self.editing or not self.grid: return
 
-        # values is a list of lists with the values of the cells
-        value = self.editing_values if self.editing_values is not None else self.value
-        rows_new = len(value)
-        if self.can_add and self.immediate: rows_new += 1
-
-        # add or remove rows
-        rows = self.grid.GetNumberRows()
-        if rows < rows_new:
-            self.grid.AppendRows(rows_new - rows)
-        elif rows != rows_new:
-            self.grid.DeleteRows(rows_new, rows - rows_new)
-
-        # update content
-        self._changing_value = True
-        for i,row in enumerate(value):
-            for j, col in enumerate(row or []):
-                self.grid.SetCellValue(i, j, compat.unicode(col))
-        if self.can_add and self.immediate:
-            for j, col in enumerate(self.default_row):
-                self.grid.SetCellValue(rows_new-1, j, compat.unicode(col))
-
-        self._changing_value = False
+        # the grid reads the values from the table; only the number of rows needs to be updated
+        self.table.pending.clear()
+        self.table.update_rows()
+        self.grid.ForceRefresh()
 
         # update state of the remove button and the row label
         self._update_apply_button()
@@ -2948,9 +3069,15 @@ class GridProperty(Property):
         self.indices = [str(i) for i in range(len(self.value))]
 
     def _update_indices(self):
+        # the labels are read from the table
         if not self.grid or not self.with_index: return
-        for i, index in enumerate(self.indices):
-            self.grid.SetRowLabelValue(i, index)
+        self.grid.GetGridRowLabelWindow().Refresh()
+
+    def _refresh_row(self, row):
+        # discard the values entered into the grid and display the values from the property instead
+        for col in range(len(self.col_defs)):
+            self.table.pending.pop( (row, col), None )
+        self.grid.ForceRefresh()
 
     # grid event handlers ##############################################################################################
     def on_cell_changing(self, event):
@@ -2975,6 +3102,7 @@ class GridProperty(Property):
         if not self._validate(row, col, value):
             return event.Veto()                               # after that, the cell will be set to the old value again
         self._on_value_edited(row, col, value)                # this can add a row
+        self._refresh_row(row)
         event.Skip()
         self._update_editors()
 
@@ -2988,13 +3116,11 @@ class GridProperty(Property):
             return False
 
         if self.UPPERCASE_COLS:
-            value_ = value
+            # the modified value will be displayed from the table
             if self.UPPERCASE_COLS[col] is True:
                 value = value.upper()
             elif self.UPPERCASE_COLS[col] is False:
                 value = value.lower()
-            if value != value_:
-                self.grid.SetCellValue(row, col, value)
 
         if self.immediate or (not self.can_add and not self.can_insert and not self.can_remove):
             common.history.property_changing(self)
@@ -3064,9 +3190,7 @@ class GridProperty(Property):
             return False
 
         if self._on_value_edited(self.cur_row, col, value, set_index=set_index, delay=False):
-            value = self._ensure_editing_copy()[self.cur_row][col]
-            self.grid.SetCellValue(self.cur_row, col, compat.unicode(value))
-            #self.grid.Refresh()
+            self._refresh_row(self.cur_row)
             ret = True
 
         return ret
@@ -3193,11 +3317,7 @@ class GridProperty(Property):
     def _add_grid_row(self, row, set_index=False):
         # called via CallAfter from add_row; either when "Add" is required or when the user has edited the last row
         if not self.grid: return
-        self.grid.AppendRows()
-        # fill the grid with default values; these are not in self.value unless the user edits them
-        last_row = self.grid.NumberRows-1
-        for col, value in enumerate( self._get_default_row(row) ):
-            self.grid.SetCellValue(last_row, col, compat.unicode(value))
+        self.table.update_rows()
         if set_index:
             self._set_index(row)
 
@@ -3231,8 +3351,8 @@ class GridProperty(Property):
             common.history.property_changing(self)
 
         if values:
-            self.grid.DeleteRows(self.cur_row)
             del values[row]
+            self.table.rows_deleted(row)
             if self.with_index:
                 del self.indices[self.cur_row]
             if self.cur_row>=len(values) and self.cur_row>0:
@@ -3257,10 +3377,6 @@ class GridProperty(Property):
 
     def insert_row(self, set_focus=True, highlight=False):
         self.on_focus()
-        self.grid.InsertRows(self.cur_row)
-        self.grid.MakeCellVisible(self.cur_row, 0)
-        self.grid.ForceRefresh()
-
         values = self._ensure_editing_copy()
         new_row_values = self._get_default_row(self.cur_row)
 
@@ -3271,8 +3387,9 @@ class GridProperty(Property):
         if self.cur_row==-1: self.cur_row=0
         if self.with_index:
             self.indices.insert(self.cur_row, "")
-        for col, value in enumerate( values[self.cur_row] ):
-            self.grid.SetCellValue(self.cur_row, col, compat.unicode(value))
+        self.table.rows_inserted(self.cur_row)
+        self.grid.MakeCellVisible(self.cur_row, 0)
+        self.grid.ForceRefresh()
         self._update_remove_button()
         self._update_apply_button()
         self._update_indices()
@@ -3331,6 +3448,7 @@ class GridProperty(Property):
 
 
 class CodeProperty(TextProperty):
+    __slots__ = ()
     _HORIZONTAL_LAYOUT = False
     _PROPORTION = 3
 
@@ -3351,6 +3469,7 @@ class CodeProperty(TextProperty):
 
 
 class ExtraPropertiesProperty(GridProperty):
+    __slots__ = ()
     LABEL = 'Extra properties for this widget'
     TOOLTIP = ('You can use this property to add some extra custom properties to this widget.\n\n'
                'For each property "prop" with value "val", wxGlade will generate a'
@@ -3378,6 +3497,7 @@ class ExtraPropertiesProperty(GridProperty):
 
 
 class ActionButtonProperty(Property):
+    __slots__ = ("callback", "label")
     # just a button to start an action
     CONTROLNAMES = ["button"]
     background_color = None
@@ -3420,6 +3540,7 @@ class ActionButtonProperty(Property):
 
 
 class DisplayProperty(TextProperty):
+    __slots__ = ()
     #TOOLTIP = None
 
     def __init__(self, value):
@@ -3460,14 +3581,87 @@ def insert_after(PROPERTIES, after, *add):
 
 ########################################################################################################################
 
+class _PropertyValue(object):
+    """Data descriptor for fast access to property values, e.g. owner.label instead of owner.properties["label"].get();
+    installed on the owner class by PropertyOwner.add_property when a property is added for the first time"""
+    __slots__ = ("attname",)
+
+    def __init__(self, attname):
+        self.attname = attname
+
+    def __get__(self, obj, objtype=None):
+        if obj is None: return self
+        prop = obj.properties.get(self.attname)
+        if prop is not None:
+            # return the value (either the user-provided or the default value)
+            return prop.get()
+        # an instance of the same class without this property
+        try:
+            return obj.__dict__[self.attname]
+        except KeyError:
+            raise AttributeError("%r object has no attribute %r" %(obj.__class__, self.attname))
+
+    def __set__(self, obj, value):
+        if config.debugging:
+            if self.attname in obj.properties:
+                raise ValueError("implementation error: property about to be overwritten")
+            if isinstance(value, Property):
+                raise ValueError("implementation error: properties are to be added by PropertyOwner.add_property")
+        obj.__dict__[self.attname] = value
+
+    def __delete__(self, obj):
+        try:
+            del obj.__dict__[self.attname]
+        except KeyError:
+            raise AttributeError(self.attname)
+
+
+_dependency_graphs = {}  # class -> (graph, order); see _get_dependency_graph
+
+def _get_dependency_graph(cls):
+    """returns the merged PROPERTY_DEPENDENCIES of cls and its base classes and a dict name -> topological position;
+    raises ValueError on circular dependencies"""
+    ret = _dependency_graphs.get(cls)
+    if ret is not None: return ret
+    graph = {}
+    for base in reversed(cls.__mro__):
+        for name, dependents in base.__dict__.get("PROPERTY_DEPENDENCIES", {}).items():
+            graph.setdefault(name, [])
+            for dependent in dependents:
+                if not dependent in graph[name]: graph[name].append(dependent)
+    # Kahn's algorithm; sorted for a deterministic order
+    in_degree = dict( (name, 0) for name in graph )
+    for dependents in graph.values():
+        for dependent in dependents:
+            in_degree[dependent] = in_degree.get(dependent, 0) + 1
+    ready = sorted(name for name, degree in in_degree.items() if not degree)
+    order = {}
+    while ready:
+        name = ready.pop(0)
+        order[name] = len(order)
+        for dependent in graph.get(name, ()):
+            in_degree[dependent] -= 1
+            if not in_degree[dependent]: ready.append(dependent)
+    if len(order)!=len(in_degree):
+        raise ValueError( "implementation error: circular PROPERTY_DEPENDENCIES in %s"%cls.__name__ )
+    ret = _dependency_graphs[cls] = (graph, order)
+    return ret
+
+
 class PropertyOwner(object):
+    # declarative dependencies: property name -> names of properties to be updated when it is modified;
+    # e.g. {"range": ["value"]}: when "range" is modified, properties_changed will be called with "value" as well and
+    # History.property_changing will record the value of "value" for undo; merged with those of the base classes
+    PROPERTY_DEPENDENCIES = {}
+    _pending_changes = None  # while properties_changed is running: modifications from nested calls
+
     def __init__(self):
         # property handling
         self.properties = {}
         self.property_names = []
     # property handling ################################################################################################
-    def add_property(self, prop, attname):
-        # link the property to the owner
+    def add_property(self, attname, prop):
+        "link the property to the owner, e.g. self.add_property( 'label', TextProperty(...) ); returns prop"
         self.properties[attname] = prop
         if prop.name is not None:
             # allow also access via property name like 'class', but only via the properties dict
@@ -3476,18 +3670,17 @@ class PropertyOwner(object):
         else:
             self.property_names.append(attname)
         prop.set_owner(self, attname)
+        # install a descriptor on the class, unless the name is used by a class attribute or method
+        cls = self.__class__
+        if not hasattr(cls, attname):
+            setattr(cls, attname, _PropertyValue(attname))
+        return prop
     def __getattr__(self, attr):
+        # only called for names without _PropertyValue descriptor, e.g. 'class'
         if attr in self.properties:
             # return the value (either the user-provided or the default value)
             return self.properties[attr].get()
         raise AttributeError("%r object has no attribute %r" %(self.__class__, attr))
-    def __setattr__(self, name, value):
-        if isinstance(value, Property):
-            self.add_property(value, name)
-            return
-        if name!="properties" and name in self.properties and config.debugging:
-            raise ValueError("implementation error: property about to be overwritten")
-        object.__setattr__(self, name, value)
     def copy_properties(self, other, properties, notify=True):
         "copy named properties from other"
         # with short cut for properties with 'values_set'
@@ -3515,10 +3708,50 @@ class PropertyOwner(object):
         # action method(s); check dependent properties and update widget
         pass
 
+    def get_dependent_properties(self, names):
+        "returns names and all properties depending on them, without duplicates and in topological order"
+        graph, order = _get_dependency_graph(self.__class__)
+        names = list(names)
+        ret = []
+        seen = set()
+        stack = names[::-1]
+        while stack:
+            name = stack.pop()
+            if name in seen: continue
+            seen.add(name)
+            if not name in self.properties and not name in names: continue
+            ret.append(name)
+            stack.extend( reversed(graph.get(name, ())) )
+        if len(ret)>1 and graph:
+            position = dict( (name, i) for i, name in enumerate(ret) )
+            ret.sort( key=lambda name: (order.get(name, -1), position[name]) )
+        return ret
+
     def properties_changed(self, modified):
         # in derived classes, actions might be triggered depending on 'actions'
+        # modified is extended by the dependent properties; None means all properties
+        # a nested call on the same owner, e.g. from _properties_changed, is queued and returns an empty set;
+        # its actions are collected and returned by the running call, so callers act on them only once
+        if modified is not None:
+            modified = self.get_dependent_properties(modified)
+        if self._pending_changes is not None:
+            # nested call, e.g. from _properties_changed: handle in the running pass, to trigger actions only once
+            self._pending_changes.append(modified)
+            return set()
         actions = set()
-        self._properties_changed(modified, actions)
+        self._pending_changes = []
+        try:
+            self._properties_changed(modified, actions)
+            while self._pending_changes:
+                pending = self._pending_changes
+                self._pending_changes = []
+                if None in pending:
+                    modified = None
+                else:
+                    modified = self.get_dependent_properties( sum(pending, []) )
+                self._properties_changed(modified, actions)
+        finally:
+            self._pending_changes = None
         return actions
 
     def get_properties(self, without=set()):
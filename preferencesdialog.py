@@ -91,6 +91,7 @@ class wxGladePreferences(wxGladePreferencesUI):
             self.autosave.SetValue(self.preferences.autosave)
             self.autosave_delay.SetValue(self.preferences.autosave_delay)
             self.show_completion.SetValue(self.preferences.show_completion)
+            self.profile.SetValue(self.preferences.profile)
             self.write_timestamp.SetValue(self.preferences.write_timestamp)
             self.write_generated_from.SetValue( self.preferences.write_generated_from )
             self._fix_spin_ctrls()
@@ -155,6 +156,7 @@ class wxGladePreferences(wxGladePreferencesUI):
         prefs['autosave'] = self.autosave.GetValue()
         prefs['autosave_delay'] = self.autosave_delay.GetValue()
         prefs['show_completion'] = self.show_completion.GetValue()
+        prefs['profile'] = self.profile.GetValue()
 
         prefs['write_timestamp'] = self.write_timestamp.GetValue()
         prefs['write_generated_from'] = self.write_generated_from.GetValue()
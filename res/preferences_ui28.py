@@ -53,6 +53,9 @@ class wxGladePreferencesUI(wx.Dialog):
         self.show_completion.SetValue(1)
         sizer_3.Add(self.show_completion, 0, wx.ALL | wx.EXPAND, 5)
 
+        self.profile = wx.CheckBox(self.notebook_1_pane_1, wx.ID_ANY, _("Record profiling data (written to wxglade_trace.json on exit)"))
+        sizer_3.Add(self.profile, 0, wx.ALL | wx.EXPAND, 5)
+
         sizer_4 = wx.FlexGridSizer(3, 2, 0, 0)
         sizer_3.Add(sizer_4, 0, wx.EXPAND, 3)
 
@@ -0,0 +1,229 @@
+"""\
+Project search: find widgets by name, class, label or event handler name.
+
+The index is kept by the Application and updated incrementally: nodes are marked as modified when they are created
+or when one of the indexed properties has changed; their terms are updated with the next query.
+Removed nodes are dropped immediately.
+
+For each field, the terms are kept in a sorted list for exact and prefix matches and in a map of their substrings of
+up to NGRAM characters for substring matches, such that a query does not need to check all terms.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import bisect, heapq
+import wx
+
+import common, compat, misc
+
+
+# the fields of the index and the properties they are taken from
+FIELDS = ("name", "class", "label", "handler")
+INDEXED_PROPERTIES = {"name", "class", "label", "title", "events"}
+NGRAM = 3  # the substrings of the terms up to this length are indexed
+
+
+def _get_ngrams(term):
+    return set( term[i:i+n] for n in range(1, NGRAM+1) for i in range(len(term)-n+1) )
+
+
+class SearchIndex(object):
+    "maps the lower case terms of each field to the nodes using them"
+    def __init__(self):
+        self._terms = dict( (field, {}) for field in FIELDS )  # field -> term -> set of nodes
+        self._sorted = dict( (field, []) for field in FIELDS )  # field -> sorted list of terms
+        self._ngrams = dict( (field, {}) for field in FIELDS )  # field -> substring of up to NGRAM chars -> terms
+        self._node_terms = {}  # node -> list of (field, term)
+        self._dirty = set()    # nodes to be (re-)indexed with the next query
+
+    def add(self, node):
+        self._dirty.add(node)
+
+    def update(self, node, modified=None):
+        "to be called from properties_changed; modified is a list of property names or None for all"
+        if modified is None or INDEXED_PROPERTIES.intersection(modified):
+            self._dirty.add(node)
+
+    def remove(self, node):
+        self._dirty.discard(node)
+        self._unindex(node)
+
+    def clear(self):
+        for field in FIELDS:
+            self._terms[field].clear()
+            del self._sorted[field][:]
+            self._ngrams[field].clear()
+        self._node_terms.clear()
+        self._dirty.clear()
+
+    def _get_terms(self, node):
+        # returns a list of (field, term)
+        ret = []
+        if node.IS_SLOT: return ret
+        if node.IS_NAMED and node.name: ret.append( ("name", node.name) )
+        ret.append( ("class", node.WX_CLASS) )
+        klass = node.properties.get("class")
+        if klass is not None and klass.value and klass.value!=node.WX_CLASS: ret.append( ("class", klass.value) )
+        for name in ("label", "title"):
+            prop = node.properties.get(name)
+            if prop is not None and prop.value and isinstance(prop.value, compat.basestring):
+                ret.append( ("label", prop.value) )
+        events = node.properties.get("events")
+        if events is not None:
+            for row in events.value or []:
+                if len(row)>1 and row[1]: ret.append( ("handler", row[1]) )
+        return [(field, term.lower()) for field, term in ret]
+
+    def _add_term(self, field, term):
+        bisect.insort(self._sorted[field], term)
+        ngrams = self._ngrams[field]
+        for ngram in _get_ngrams(term):
+            ngrams.setdefault(ngram, set()).add(term)
+
+    def _remove_term(self, field, term):
+        terms = self._sorted[field]
+        del terms[bisect.bisect_left(terms, term)]
+        ngrams = self._ngrams[field]
+        for ngram in _get_ngrams(term):
+            ngram_terms = ngrams[ngram]
+            ngram_terms.discard(term)
+            if not ngram_terms: del ngrams[ngram]
+
+    def _index(self, node):
+        terms = self._node_terms[node] = self._get_terms(node)
+        for field, term in terms:
+            nodes = self._terms[field].get(term)
+            if nodes is None:
+                nodes = self._terms[field][term] = set()
+                self._add_term(field, term)
+            nodes.add(node)
+
+    def _unindex(self, node):
+        for field, term in self._node_terms.pop(node, ()):
+            nodes = self._terms[field].get(term)
+            if nodes is None: continue
+            nodes.discard(node)
+            if not nodes:
+                del self._terms[field][term]
+                self._remove_term(field, term)
+
+    def _flush(self):
+        dirty = self._dirty
+        self._dirty = set()
+        for node in dirty:
+            self._unindex(node)
+            self._index(node)
+
+    def _find_substrings(self, word, field):
+        # returns the terms containing word, using the n-gram map
+        ngrams = self._ngrams[field]
+        if len(word)<=NGRAM: return ngrams.get(word, ())
+        candidates = [ngrams.get(word[i:i+NGRAM]) for i in range(len(word)-NGRAM+1)]
+        if not all(candidates): return ()
+        candidates.sort(key=len)
+        return [term for term in set.intersection(*candidates) if word in term]
+
+    def _match_word(self, word, fields):
+        # returns a dict node -> rank; 0 for exact match, 1 for prefix, 2 for substring
+        ret = {}
+        for field in fields:
+            terms = self._terms[field]
+            # exact and prefix matches are a range of the sorted terms
+            sorted_terms = self._sorted[field]
+            i = bisect.bisect_left(sorted_terms, word)
+            while i<len(sorted_terms) and sorted_terms[i].startswith(word):
+                term = sorted_terms[i]
+                rank = 0 if term==word else 1
+                for node in terms[term]:
+                    if ret.get(node, 3)>rank: ret[node] = rank
+                i += 1
+            for term in self._find_substrings(word, field):
+                if term.startswith(word): continue
+                for node in terms[term]:
+                    if node not in ret: ret[node] = 2
+        return ret
+
+    def find(self, query, limit=None):
+        """Returns a list of nodes matching all words of the query, best matches first.
+        A word may be restricted to a field, e.g. 'class:wxButton', 'label:OK' or 'handler:on_'."""
+        self._flush()
+        result = None
+        for word in query.lower().split():
+            fields = FIELDS
+            if ":" in word:
+                field, word_ = word.split(":", 1)
+                if field in self._terms:
+                    fields = (field,)
+                    word = word_
+            if not word: continue
+            matches = self._match_word(word, fields)
+            if result is None:
+                result = matches
+            else:
+                result = dict( (node, max(rank, matches[node])) for node, rank in result.items() if node in matches )
+            if not result: return []
+        if not result: return []
+        key = lambda node: (result[node], node.name or "")
+        if limit is not None: return heapq.nsmallest(limit, result, key=key)
+        return sorted(result, key=key)
+
+
+def find(query, limit=None):
+    "returns the nodes of the current project matching query"
+    if common.root is None: return []
+    return common.root.search_index.find(query, limit)
+
+
+class QuickOpenDialog(wx.Dialog):
+    "Enter a search string and select one of the matching widgets"
+    LIMIT = 200
+
+    def __init__(self):
+        wx.Dialog.__init__(self, common.main, -1, _("Find Widget"), style=wx.DEFAULT_DIALOG_STYLE|wx.RESIZE_BORDER)
+        self.nodes = []
+        szr = wx.BoxSizer(wx.VERTICAL)
+        self.text = wx.TextCtrl(self, -1, style=wx.TE_PROCESS_ENTER)
+        compat.SetToolTip( self.text,
+                           _("Name, class, label or event handler; restrict to a field with e.g. 'class:wxButton'") )
+        szr.Add(self.text, 0, wx.ALL|wx.EXPAND, 4)
+        self.matches = wx.ListBox(self, -1, size=(500, 300), style=wx.LB_SINGLE)
+        szr.Add(self.matches, 1, wx.ALL|wx.EXPAND, 4)
+        self.SetSizer(szr)
+        szr.Fit(self)
+
+        self.text.Bind(wx.EVT_TEXT, self.on_text)
+        self.text.Bind(wx.EVT_TEXT_ENTER, self.on_select)
+        self.text.Bind(wx.EVT_KEY_DOWN, self.on_key)
+        self.matches.Bind(wx.EVT_LISTBOX_DCLICK, self.on_select)
+        self.text.SetFocus()
+
+    def on_text(self, event):
+        self.nodes = find(self.text.GetValue(), self.LIMIT)
+        self.matches.Set( ["%s  (%s)  %s"%(node.name, node.WX_CLASS, node.get_path()) for node in self.nodes] )
+        if self.nodes: self.matches.SetSelection(0)
+
+    def on_key(self, event):
+        # Up / Down in the text control change the selected match
+        key = event.GetKeyCode()
+        if key in (wx.WXK_UP, wx.WXK_DOWN) and self.nodes:
+            selection = self.matches.GetSelection() + (1 if key==wx.WXK_DOWN else -1)
+            self.matches.SetSelection( max(0, min(selection, len(self.nodes)-1)) )
+            return
+        event.Skip()
+
+    def on_select(self, event):
+        selection = self.matches.GetSelection()
+        if selection==wx.NOT_FOUND: return wx.Bell()
+        self.node = self.nodes[selection]
+        self.EndModal(wx.ID_OK)
+
+
+def show_dialog():
+    "entry point from the Edit menu"
+    dialog = QuickOpenDialog()
+    try:
+        if dialog.ShowModal() != wx.ID_OK: return
+        node = dialog.node
+    finally:
+        dialog.Destroy()
+    misc.set_focused_widget(node)
@@ -23,5 +23,140 @@ class TestCodegen(WXGladeCLITest):
     def test_Issue502_codegen(self):
         self.generate('Issue502_codegen_fail', included=["perl"])
 
+    def test_codegen_dry_run(self):
+        "Test that a dry run reports changes without writing files"
+        infilename = self._get_inputfile_path('CalendarCtrl.wxg')
+        generated_filename = self._get_outputfile_path('CalendarCtrl_dry_run.py')
+        if os.path.exists(generated_filename): os.remove(generated_filename)
+
+        # file does not exist yet: would be changed, but must not be created
+        self.assertFalse( wxglade.command_line_code_generation(infilename, "python", generated_filename, dry_run=True) )
+        self.assertFalse( os.path.exists(generated_filename) )
+
+        # file is up to date
+        wxglade.command_line_code_generation(infilename, "python", generated_filename)
+        self.assertTrue( wxglade.command_line_code_generation(infilename, "python", generated_filename, dry_run=True) )
+
+        # file was modified: would change; the diff contains the removed line
+        with open(generated_filename, "a") as f:
+            f.write("# modified\n")
+        mtime = os.stat(generated_filename).st_mtime
+        results = common.root.generate_code(out_path=generated_filename, dry_run=True)
+        self.assertEqual( len(results), 1 )
+        filename, changed, diff = results[0]
+        self.assertEqual(filename, generated_filename)
+        self.assertTrue(changed)
+        self.assertTrue( "-# modified\n" in diff )
+        self.assertEqual( mtime, os.stat(generated_filename).st_mtime )
+
+    def test_codegen_class_cache(self):
+        "Test that code generated from cached class fragments is identical"
+        import config, shutil, tempfile
+        infilename = self._get_inputfile_path('AllWidgets_30.wxg')
+        generated_filename = self._get_outputfile_path('AllWidgets_30_class_cache.py')
+        wxglade.command_line_code_generation(infilename, "python", generated_filename)
+        def read():
+            with open(generated_filename, "rb") as f:
+                return [line for line in f.readlines() if not b"generated by wxGlade" in line]
+        expected = read()
+        cache_dir = tempfile.mkdtemp()
+        try:
+            config.codegen_cache_dir = cache_dir
+            for i in range(2):  # first run fills the cache, second run uses it
+                os.remove(generated_filename)
+                wxglade.command_line_code_generation(infilename, "python", generated_filename)
+                self.assertEqual( read(), expected )
+            self.assertTrue( os.listdir(cache_dir) )
+        finally:
+            config.codegen_cache_dir = ""
+            shutil.rmtree(cache_dir)
+
+    def test_codegen_verify(self):
+        "Test verification of the generated code"
+        from codegen.verify import verify_files
+        infilename = self._get_inputfile_path('CalendarCtrl.wxg')
+        for language, ext in (("python", ".py"), ("XRC", ".xrc")):
+            generated_filename = self._get_outputfile_path('CalendarCtrl_verify' + ext)
+            self.assertTrue( wxglade.command_line_code_generation(infilename, language, generated_filename,
+                                                                  verify=True) )
+            # a dry run is verified without writing the file
+            os.remove(generated_filename)
+            wxglade.command_line_code_generation(infilename, language, generated_filename, dry_run=True, verify=True)
+            self.assertFalse( os.path.exists(generated_filename) )
+
+        # errors are reported with the line number
+        broken = self._get_outputfile_path('verify_broken.py')
+        results = verify_files( [broken], {broken: [b"import os\n", b"def f(:\n"]} )
+        self.assertEqual( results[0][:2], (broken, "failed") )
+        self.assertTrue( results[0][2].startswith("line 2:") )
+
+        # multiple Perl files: the modules are found in the directory of the main file
+        infilename = self._get_inputfile_path('PlOgg2.wxg')
+        generated_dir = self._get_outputfile_path('PlOgg2_verify')
+        self.assertTrue( wxglade.command_line_code_generation(infilename, "perl", generated_dir, dry_run=True,
+                                                              verify=True) )
+        from codegen import verify
+        perl = verify._find_program("perl")
+        if not perl: return
+        main = os.path.join(generated_dir, "app.pl")
+        module = os.path.join(generated_dir, "MyAppFrame.pm")
+        contents = {main: [b"use MyAppFrame;\n", b"MyAppFrame::f();\n"],
+                    module: [b"package MyAppFrame;\n", b"sub f { return 1; }\n", b"1;\n"]}
+        saved = dict(verify._tools)
+        verify._tools["perl"] = [perl, "-c"]  # without wxPerl
+        try:
+            results = verify_files( [main, module], contents )
+        finally:
+            verify._tools.clear()
+            verify._tools.update(saved)
+        self.assertEqual( [result[:2] for result in results], [(main, "OK"), (module, "OK")] )
+
+    def test_codegen_verify_relative_names(self):
+        "Test that files with relative names keep their names in the temporary directory"
+        from codegen import verify
+        gpp = verify._find_program("g++")
+        if not gpp: self.skipTest("g++ not available")
+        contents = {"out.h":   [b"int f();\n"],
+                    "out.cpp": [b'#include "out.h"\n', b"int f() { return 1; }\n"]}
+        saved = dict(verify._tools)
+        verify._tools["g++"] = [gpp, "-fsyntax-only", "-x", "c++"]  # without wx-config
+        try:
+            results = verify.verify_files( list(contents), contents )
+        finally:
+            verify._tools.clear()
+            verify._tools.update(saved)
+        self.assertEqual( [result[:2] for result in results], [("out.cpp", "OK")] )
+
+
+    def test_codegen_in_memory(self):
+        "Test code generation into memory, without file system access"
+        infilename = self._get_inputfile_path('PyOgg1.wxg')
+        out_path = os.path.join("nonexisting_directory", "PyOgg1.py")
+        files = wxglade.generate_code_in_memory(infilename, "python", out_path)
+        self.assertEqual( list(files.keys()), [out_path] )
+        self.assertFalse( os.path.exists("nonexisting_directory") )
+        content = files[out_path]
+        self.assertTrue( "class PyOgg1_MyDialog(" in content )
+
+        # keep user code: the previous content is passed as string
+        previous = content.replace("class PyOgg1_MyDialog(", "# user code\n\nclass PyOgg1_MyDialog(", 1)
+        files = wxglade.generate_code_in_memory(infilename, "python", out_path, {out_path: previous})
+        self.assertTrue( "# user code\n" in files[out_path] )
+        self.assertFalse( os.path.exists("nonexisting_directory") )
+
+        # XML string instead of file name
+        with open(infilename, "r") as f:
+            xml = f.read()
+        files = wxglade.generate_code_in_memory(xml, "python", out_path)
+        self.assertEqual( files[out_path], content )
+
+        # the same checks as for code generation from the GUI
+        common.root.properties["top_window"].set("")
+        common.root.properties["name"].set("app", activate=True)
+        with self.assertRaises(ValueError) as context:
+            wxglade.generate_code_in_memory(common.root, "python", out_path)
+        self.assertTrue( "select a top window" in str(context.exception) )
+
+
 if __name__ == '__main__':
     unittest.main(exit=False)
@@ -260,6 +260,52 @@ class TestCodeGen(WXGladeCLITest):
                 '%s: Unexpected result for line "%s":\n   got: "%s"\nexpect: "%s"' % (lang, line, result.groups(), expected)
                 )
 
+    def test_SourceFileContent_cache(self):
+        "Test that an unchanged existing source file is parsed only once per modification"
+        import codegen.py_codegen
+
+        class CountingSourceFileContent(codegen.py_codegen.SourceFileContent):
+            parsed = 0
+            def build_untouched_content(self):
+                CountingSourceFileContent.parsed += 1
+                codegen.py_codegen.SourceFileContent.build_untouched_content(self)
+
+        filename = self._get_outputfile_path('SourceFileContent_cache.py')
+        with open(filename, "w") as f:
+            f.write( "class MyFrame(wx.Frame):\n"
+                     "    def __init__(self, *args, **kwds):\n"
+                     "        # begin wxGlade: MyFrame.__init__\n"
+                     "        pass\n"
+                     "        # end wxGlade\n\n"
+                     "    def on_button(self, event):  # wxGlade: MyFrame.<event_handler>\n"
+                     "        pass\n\n"
+                     "# end of class MyFrame\n" )
+
+        writer = common.code_writers['python']
+        writer.nonce = '12G34'
+        first = CountingSourceFileContent(filename, writer)
+        self.assertTrue(first.OK)
+        self.assertEqual(CountingSourceFileContent.parsed, 1)
+        self.assertTrue('<12G34wxGlade replace MyFrame __init__>' in first.content)
+
+        # unchanged file: the cached result is used, with the tags adapted to the new nonce
+        writer.nonce = '56G78'
+        second = CountingSourceFileContent(filename, writer)
+        self.assertEqual(CountingSourceFileContent.parsed, 1)
+        self.assertTrue('<56G78wxGlade replace MyFrame __init__>' in second.content)
+        self.assertEqual(second.classes, set(["MyFrame"]))
+        self.assertEqual(second.event_handlers, {"MyFrame": set(["on_button"])})
+        # modifications of the content must not modify the cache
+        second.replace('<56G78wxGlade replace MyFrame __init__>', [])
+        third = CountingSourceFileContent(filename, writer)
+        self.assertTrue('<56G78wxGlade replace MyFrame __init__>' in third.content)
+
+        # modified file: parse again
+        with open(filename, "a") as f:
+            f.write("\n# a comment\n")
+        CountingSourceFileContent(filename, writer)
+        self.assertEqual(CountingSourceFileContent.parsed, 2)
+
     def test_content_notfound(self):
         """\
         Test replacement of not found blocks with a warning message
@@ -1139,6 +1185,102 @@ class TestCodeGen(WXGladeCLITest):
                 self.assertEqual( expected_class, klass,
                                   '%s: Unexpected class got: "%s" expect: "%s"' % (lang, expected_class, klass) )
 
+    @unittest.skipIf(not hasattr(os, "symlink") or os.name=="nt", "POSIX only")
+    def test_save_file_stream(self):
+        "Test that streamed code keeps the permissions of the file and is written through symbolic links"
+        import stat, shutil, tempfile
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            target = os.path.join(tmp_dir, "target.py")
+            link = os.path.join(tmp_dir, "link.py")
+            with open(target, "wb") as f:
+                f.write(b"old\n")
+            os.chmod(target, 0o750)
+            os.symlink(target, link)
+            common.save_file( link, iter([b"new\n"]), "codegen" )
+            self.assertTrue( os.path.islink(link) )
+            with open(target, "rb") as f:
+                self.assertEqual( f.read(), b"new\n" )
+            self.assertEqual( stat.S_IMODE(os.stat(target).st_mode), 0o750 )
+            self.assertEqual( [name for name in os.listdir(tmp_dir) if name.endswith(".wxglade~")], [] )
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_tracing(self):
+        "Test that loading and code generation are recorded if tracing is enabled"
+        import tracing, wxglade
+        infilename = self._get_inputfile_path('CalendarCtrl.wxg')
+        generated_filename = self._get_outputfile_path('CalendarCtrl_tracing.py')
+        tracing.reset()
+        tracing.enable()
+        try:
+            wxglade.command_line_code_generation(infilename, "python", generated_filename)
+        finally:
+            tracing.enable(False)
+        table = "".join( tracing.get_table() )
+        for name in ("load EditDialog", "codegen.add_object", "codegen.finalize_class", "codegen.save_file"):
+            self.assertTrue(name in table)
+        events = tracing.get_chrome_trace()["traceEvents"]
+        self.assertTrue( events and all(event["ph"]=="X" for event in events) )
+        tracing.reset()
+
+    def test_tracing_parse_error(self):
+        "Test that the spans of objects are closed if the file can't be parsed"
+        import application, tracing, wxglade
+        common.init_preferences()
+        common.root = application.Application()
+        with open(self._get_inputfile_path('CalendarCtrl.wxg'), "r") as f:
+            lines = f.readlines()
+        tracing.enable()
+        try:
+            # truncated inside an object
+            self.assertFalse( wxglade._guiless_open_app(lines[:len(lines)//2]) )
+            self.assertEqual( tracing.get_depth(), 0 )
+        finally:
+            tracing.enable(False)
+            tracing.reset()
+
+    def test_flag_bits(self):
+        "Test that flagbits.FlagBits gives the same results as process_styles() and combine_styles()"
+        import copy, random
+        import flagbits, gui_mixins
+
+        class Styles(gui_mixins.StylesMixin):
+            style_defs = None
+        class Codegen(object):
+            for_version = (3,0)
+
+        # test the generic styles and the merged style definitions of each widget, as _get_widget_styles_defs()
+        defs_list = [("generic_styles", config.widget_config['generic_styles'])]
+        for klass, widget_config in sorted(config.widget_config.items()):
+            if klass=="generic_styles" or not isinstance(widget_config, dict) or not "style_defs" in widget_config:
+                continue
+            style_defs = copy.deepcopy(config.widget_config['generic_styles'])
+            style_defs.update(widget_config['style_defs'])
+            defs_list.append( (klass, style_defs) )
+        # a synthetic rename chain A -> B -> C
+        defs_list.append( ("chain", {"A": {"rename_to": "B"}, "B": {"rename_to": "C"}, "C": {}}) )
+
+        rnd = random.Random(0)
+        styles = Styles()
+        styles.codegen = Codegen()
+        for klass, style_defs in defs_list:
+            styles.style_defs = style_defs
+            names = sorted(style_defs)
+            bits = flagbits.get_flag_bits(style_defs)
+            flag_sets = [set([name]) for name in names]
+            flag_sets += [set(names[i:i+2]) for i in range(len(names)-1)]
+            flag_sets += [set(rnd.sample(names, min(len(names), rnd.randint(2,6)))) for i in range(100)]
+            for for_version in ((2,8), (3,0)):
+                Codegen.for_version = for_version
+                for flags in flag_sets:
+                    expected = styles.combine_styles( styles.process_styles(set(flags)) )
+                    result = bits.decode( bits.combine( bits.process(bits.encode(flags), for_version) ) )
+                    self.assertEqual( result, expected, "%s %s %s"%(klass, for_version, sorted(flags)) )
+            if klass=="chain":
+                self.assertEqual( styles.process_styles(set(["A","B"])), set(["C"]) )
+                self.assertEqual( bits.decode( bits.process(bits.encode(["A","B"]), None) ), set(["C"]) )
+
 if __name__ == '__main__':
     import unittest
     unittest.main(exit=False)
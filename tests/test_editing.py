@@ -145,6 +145,242 @@ class TestEditing(WXGladeGUITest):
         widget = app.find_widget_from_path("app/frame/notebook_1/window_1/window_1_pane_1/grid_sizer_1/button_3")
         widget.properties["span"].set((2,2), notify=True)
 
+    def test_bulk_edit(self):
+        "Set a property on multiple widgets; one history item un-does all modifications"
+        import bulk_edit
+        infilename = self._get_casefile_path('Test_Editing.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        common.app_tree.show_toplevel( None, common.root.children[0] )
+        self._process_wx_events()
+        buttons = [w for w in bulk_edit.get_all_widgets() if w.WX_CLASS=="wxButton"]
+        self.assertTrue( len(buttons)>=3 )
+        borders = [button.border for button in buttons]
+
+        count = bulk_edit.set_properties(buttons, {"border": 7})
+        self.assertEqual( count, len([b for b in borders if b!=7]) )
+        self.assertEqual( [button.border for button in buttons], [7]*len(buttons) )
+
+        # copy from one widget to the others
+        buttons[0].properties["border"].set(3)
+        bulk_edit.copy_properties(buttons[0], ["border"], buttons)
+        self.assertEqual( [button.border for button in buttons], [3]*len(buttons) )
+
+        common.history.undo(None)
+        self.assertEqual( [button.border for button in buttons[1:]], [7]*(len(buttons)-1) )
+        common.history.undo(None)
+        self.assertEqual( [button.border for button in buttons[1:]], borders[1:] )
+
+        # handlers that check previous_value for user input: GridBagSizer adds slots for new rows
+        sizer = [w for w in bulk_edit.get_all_widgets() if w.WX_CLASS=="wxGridBagSizer"][0]
+        rows, cols = sizer.rows, sizer.cols
+        self.assertEqual( len(sizer.children), rows*cols )
+        self.assertEqual( bulk_edit.set_properties([sizer], {"rows": rows+1}), 1 )
+        self.assertEqual( len(sizer.children), (rows+1)*cols )
+        self.assertEqual( sizer.properties["rows"].previous_value, None )
+        # unchanged values are not counted
+        self.assertEqual( bulk_edit.set_properties([sizer], {"rows": rows+1}), 0 )
+
+    def test_property_dependencies(self):
+        "Dependent properties are updated in the same pass and un-done together with the modified property"
+        import bulk_edit
+        import new_properties as np
+
+        class Owner(np.PropertyOwner):
+            PROPERTY_DEPENDENCIES = {"a": ["b"], "b": ["c"]}
+            def __init__(self):
+                np.PropertyOwner.__init__(self)
+                for name in "abcd":
+                    self.add_property( name, np.Property(0) )
+                self.passes = []
+                self.nested_actions = []
+            def _properties_changed(self, modified, actions):
+                self.passes.append(modified)
+                if modified and "a" in modified: actions.add("refresh")
+                if modified and "d" in modified:
+                    # nested call: queued and handled by the running call, which returns all actions
+                    self.nested_actions.append( self.properties_changed(["a"]) )
+                    actions.add("layout")
+
+        owner = Owner()
+        self.assertEqual( owner.get_dependent_properties(["a"]), ["a", "b", "c"] )
+        self.assertEqual( owner.get_dependent_properties(["c", "a"]), ["a", "b", "c"] )
+        self.assertEqual( owner.properties_changed(["a"]), {"refresh"} )
+        self.assertEqual( owner.passes, [["a", "b", "c"]] )
+
+        owner.passes = []
+        self.assertEqual( owner.properties_changed(["d"]), {"refresh", "layout"} )
+        self.assertEqual( owner.passes, [["d"], ["a", "b", "c"]] )
+        self.assertEqual( owner.nested_actions, [set()] )
+        self.assertEqual( owner._pending_changes, None )
+
+        # SpinCtrl: the value is adjusted to the range; un-do restores both
+        infilename = self._get_casefile_path('AllWidgets_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        self._process_wx_events()
+        spin = [w for w in bulk_edit.get_all_widgets() if w.WX_CLASS=="wxSpinCtrl"][0]
+        spin.properties["value"].set(80)
+        spin.properties_changed(["value"])
+        spin.properties["range"].on_value_edited("0, 50")
+        self.assertEqual( spin.value, 50 )
+        common.history.undo(None)
+        self.assertEqual( spin.properties["range"].get_tuple(), (0, 100) )
+        self.assertEqual( spin.value, 80 )
+        common.history.redo(None)
+        self.assertEqual( spin.properties["range"].get_tuple(), (0, 50) )
+        self.assertEqual( spin.value, 50 )
+
+    def test_property_values(self):
+        "Property values are accessed through per-class descriptors, also after un-do and re-do"
+        import config, history
+        import new_properties as np
+        infilename = self._get_casefile_path('Test_Editing.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        self._process_wx_events()
+        path = "app/frame/notebook_1/window_1/window_1_pane_1/grid_sizer_1/button_3"
+        button = common.root.find_widget_from_path(path)
+        self.assertFalse( "__setattr__" in np.PropertyOwner.__dict__ )
+        self.assertTrue( isinstance(type(button).label, np._PropertyValue) )
+        self.assertEqual( button.label, button.properties["label"].get() )
+        self.assertEqual( button.klass, button.properties["class"].get() )
+
+        prop = button.properties["label"]
+        old = button.label
+        item = history.HistoryPropertyItem(prop)
+        prop.set("new label")
+        button.properties_changed(["label"])
+        item.finalize([])
+        self.assertEqual( button.label, "new label" )
+        item.undo()
+        self.assertEqual( button.label, old )
+        item.redo()
+        self.assertEqual( button.label, "new label" )
+
+        # plain attributes are stored in the instance dict; properties are not to be overwritten
+        button.some_attribute = 1
+        self.assertEqual( button.__dict__["some_attribute"], 1 )
+        debugging = config.debugging
+        config.debugging = True
+        try:
+            with self.assertRaises(ValueError):
+                button.label = "no property"
+        finally:
+            config.debugging = debugging
+        del button.some_attribute
+
+    def test_property_memory(self):
+        "Most properties of a loaded project don't need an instance dict; see Property.__slots__"
+        import gc, sys, bulk_edit
+        infilename = self._get_casefile_path('AllWidgets_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        self._process_wx_events()
+
+        def is_slotted(cls):
+            return all("__slots__" in c.__dict__ for c in cls.__mro__ if c is not object)
+
+        def has_instance_dict(prop):
+            # accessing prop.__dict__ would create the dict
+            slot_values = [getattr(prop, name, None) for c in type(prop).__mro__
+                           for name in c.__dict__.get("__slots__", ()) if name!="__dict__"]
+            return any( type(r) is dict and not any(r is v for v in slot_values) for r in gc.get_referents(prop) )
+
+        props = [p for w in bulk_edit.get_all_widgets() for p in w.properties.values() if is_slotted(type(p))]
+        self.assertTrue( len(props)>1000 )
+        with_dict = [p for p in props if has_instance_dict(p)]
+        size = sum(sys.getsizeof(p) for p in props) + sum(sys.getsizeof(p.__dict__) for p in with_dict)
+        sys.stdout.write( "%d properties, %d with instance dict, %d bytes\n"%(len(props), len(with_dict), size) )
+        self.assertTrue( len(with_dict) < len(props)//4 )
+
+
+    def test_find(self):
+        "Test the search index: incremental updates and queries restricted to fields"
+        import search
+        infilename = self._get_inputfile_path('AllWidgets_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        nodes = search.find("button_1")
+        self.assertEqual( nodes[0].name, "button_1" )  # exact match first
+        self.assertTrue( all("button_1" in node.name for node in nodes) )
+        self.assertEqual( [node.name for node in search.find("handler:OnNotebookPageChanged")], ["notebook_1"] )
+        self.assertTrue( all(node.WX_CLASS=="wxButton" for node in search.find("class:wxButton")) )
+
+        # rename and remove
+        button = nodes[0]
+        button.properties["name"].set("renamed_button")
+        button.properties_changed(["name"])
+        self.assertEqual( search.find("renamed_button"), [button] )
+        self.assertFalse( button in search.find("button_1") )
+        button.recursive_remove(0)
+        self.assertEqual( search.find("renamed_button"), [] )
+
+    def test_find_widget_from_path(self):
+        "Test that paths are resolved again after renaming, un-do, re-do and removing"
+        import config, search, history
+        infilename = self._get_inputfile_path('AllWidgets_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        button = search.find("button_1")[0]
+        path = button.get_path()
+        self.assertTrue( common.root.find_widget_from_path(path) is button )
+        self.assertTrue( common.root.find_widget_from_path(path) is button )  # from the index
+
+        def rename(node, name):
+            prop = node.properties["name"]
+            item = history.HistoryPropertyItem(prop)
+            prop.set(name)
+            node.properties_changed(["name"])
+            item.finalize([])
+            return item
+
+        # rename the button and its toplevel; un-do and re-do; in debugging mode, the name index is checked
+        debugging = config.debugging
+        config.debugging = True
+        try:
+            for node, name in ((button, "renamed_button"), (button.toplevel_parent, "renamed_top")):
+                item = rename(node, name)
+                self.assertEqual( common.root.find_widget_from_path(path), None )
+                new_path = button.get_path()
+                self.assertTrue( common.root.find_widget_from_path(new_path) is button )
+                item.undo()
+                self.assertTrue( common.root.find_widget_from_path(path) is button )
+                self.assertEqual( common.root.find_widget_from_path(new_path), None )
+                item.redo()
+                self.assertEqual( common.root.find_widget_from_path(path), None )
+                self.assertTrue( common.root.find_widget_from_path(new_path) is button )
+                path = new_path
+        finally:
+            config.debugging = debugging
+
+        button.recursive_remove(0)
+        self.assertEqual( common.root.find_widget_from_path(new_path), None )
+
+    def test_undo_toplevel_rename(self):
+        "Test that the name and class indices are updated by un-do and re-do"
+        import history
+        infilename = self._get_inputfile_path('toplevels_no_size.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        frame = common.root.find_widget_from_path("app/frame")
+        dialog = common.root.find_widget_from_path("app/dialog")
+
+        for name, value in (("name", "renamed_top"), ("class", "RenamedFrame")):
+            prop = frame.properties[name]
+            item = history.HistoryPropertyItem(prop)
+            prop.set(value)
+            frame.properties_changed([name])
+            item.finalize([])
+
+            item.undo()
+            self.assertEqual( frame.name, "frame" )
+            self.assertEqual( frame.klass, "MyFrame" )
+            self.assertFalse( dialog.properties["name"]._check_name_uniqueness("frame") )
+            self.assertTrue( dialog.properties["name"]._check_name_uniqueness("renamed_top") )
+            self.assertEqual( list(common.root.class_index.get("MyFrame")), [frame] )
+            self.assertTrue( common.root.find_widget_from_path("app/frame") is frame )
+
+            item.redo()
+            self.assertEqual( prop.value, value )
+            self.assertEqual( list(common.root.toplevel_name_index.get(frame.name)), [frame] )
+            self.assertEqual( list(common.root.class_index.get(frame.klass)), [frame] )
+            self.assertTrue( common.root.find_widget_from_path("app/%s"%frame.name) is frame )
+            item.undo()
+
 
 if __name__ == '__main__':
     unittest.main(exit=False)
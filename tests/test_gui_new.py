@@ -545,6 +545,267 @@ class TestGui(WXGladeGUITest):
         common.main._save_app(generated_filename)
         self._compare_files(compare_filename, generated_filename)
 
+    def _open_all_widgets(self, show=True):
+        # load AllWidgets_30.wxg and optionally show the frame with notebook_1
+        import bulk_edit
+        infilename = self._get_casefile_path('AllWidgets_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        self._process_wx_events()
+        widgets = bulk_edit.get_all_widgets()
+        if show:
+            notebook = [w for w in widgets if w.WX_CLASS=="wxNotebook" and w.name=="notebook_1"][0]
+            common.app_tree.show_toplevel( None, notebook.toplevel_parent )  # this expands the tree nodes
+            self._process_wx_events()
+        return widgets
+
+    def _edit_properties(self, widget, page):
+        # select widget and display the property editors on page; edit_properties is otherwise called delayed
+        import misc
+        misc.set_focused_widget(widget)
+        common.property_panel.edit_properties(widget)
+        common.main.show_props_window(page)
+        self._process_wx_events()
+
+    def test_grid_property_table(self):
+        "Test the virtual table of the GridProperty editor: insert, edit and remove rows, apply and un-do"
+        widgets = self._open_all_widgets()
+        list_box = [w for w in widgets if w.WX_CLASS=="wxListBox"][0]
+        prop = list_box.properties["choices"]
+        value = [row[:] for row in prop.value]
+        self.assertTrue( len(value)>=2 )
+        self._edit_properties(list_box, "Widget")
+        grid, table = prop.grid, prop.table
+        self.assertTrue( grid is not None and table is not None )
+        self.assertEqual( grid.GetNumberRows(), len(value) )
+        self.assertEqual( [table.GetValue(i, 0) for i in range(len(value))], [row[0] for row in value] )
+
+        # insert a row before the first one
+        prop.cur_row = 0
+        prop.insert_row(set_focus=False)
+        self.assertEqual( grid.GetNumberRows(), len(value)+1 )
+        self.assertEqual( table.GetValue(0, 0), "" )
+        self.assertEqual( table.GetValue(1, 0), value[0][0] )
+
+        # values entered into the grid are displayed until the row is refreshed from the property
+        table.SetValue(0, 0, "typed")
+        self.assertEqual( table.GetValue(0, 0), "typed" )
+        self.assertTrue( prop._on_value_edited(0, 0, "new choice") )
+        prop._refresh_row(0)
+        self.assertEqual( table.GetValue(0, 0), "new choice" )
+        self.assertEqual( prop.value, value )  # not yet applied
+
+        # remove the last row
+        prop.cur_row = len(value)
+        prop.remove_row(set_focus=False)
+        self.assertEqual( grid.GetNumberRows(), len(value) )
+        self.assertEqual( table.GetValue(len(value)-1, 0), value[-2][0] )
+
+        # apply; un-do and re-do update the grid
+        prop.apply()
+        expected = [["new choice"]] + value[:-1]
+        self.assertEqual( prop.value, expected )
+        common.history.undo(None)
+        self._process_wx_events()
+        self.assertEqual( prop.value, value )
+        self.assertEqual( grid.GetNumberRows(), len(value) )
+        self.assertEqual( table.GetValue(0, 0), value[0][0] )
+        common.history.redo(None)
+        self._process_wx_events()
+        self.assertEqual( prop.value, expected )
+        self.assertEqual( table.GetValue(0, 0), "new choice" )
+
+    def test_tree_populate_on_demand(self):
+        "Test that tree items below collapsed nodes are created when the node is expanded or a widget is selected"
+        import misc
+        widgets = self._open_all_widgets(show=False)
+        tree = common.app_tree
+        notebook = [w for w in widgets if w.WX_CLASS=="wxNotebook" and w.name=="notebook_1"][0]
+        list_box = [w for w in widgets if w.WX_CLASS=="wxListBox"][0]
+        self.assertTrue( list_box.item is None )
+
+        # expand the lowest ancestor of the notebook that has an item: items for its children are created
+        editor = notebook
+        while editor.item is None:
+            editor = editor.parent
+        self.assertTrue( tree.ItemHasChildren(editor.item) )
+        self.assertEqual( tree.GetChildrenCount(editor.item, False), 0 )
+        tree.Expand(editor.item)
+        self._process_wx_events()
+        children = editor.get_all_children()
+        self.assertEqual( tree.GetChildrenCount(editor.item, False), len(children) )
+        self.assertTrue( all(child.item is not None for child in children) )
+
+        # selecting a widget creates the items of its ancestors
+        misc.set_focused_widget(list_box)
+        self._process_wx_events()
+        self.assertTrue( list_box.item is not None )
+        self.assertTrue( tree.GetSelection()==list_box.item )
+        parent = list_box.parent
+        while parent is not editor:
+            self.assertEqual( tree.GetChildrenCount(parent.item, False), len(parent.get_all_children()) )
+            parent = parent.parent
+
+    def test_notebook_deferred_pages(self):
+        "Test that the widgets on hidden notebook pages are created when the page is selected"
+        import misc
+        widgets = self._open_all_widgets()
+        notebook = [w for w in widgets if w.WX_CLASS=="wxNotebook" and w.name=="notebook_1"][0]
+        self.assertEqual( notebook.widget.GetSelection(), 0 )
+        pages = notebook.children
+        self.assertTrue( all(page.widget is not None for page in pages) )  # required for AddPage
+        self.assertTrue( all(child.widget is not None for child in pages[0].get_all_children()) )
+        deferred = [page for page in pages[1:] if page in notebook._deferred_pages]
+        self.assertTrue( len(deferred)>=2 )
+        for page in deferred:
+            self.assertTrue( all(child.widget is None for child in page.get_all_children()) )
+
+        # select a page by the notebook control
+        page = deferred[0]
+        notebook.widget.SetSelection( pages.index(page) )
+        self._process_wx_events()
+        self.assertFalse( page in notebook._deferred_pages )
+        self.assertTrue( all(child.widget is not None for child in page.get_all_children()) )
+
+        # focus a widget on a deferred page
+        page = deferred[-1]
+        widget = page.get_all_children()[0]
+        misc.set_focused_widget(widget)
+        self._process_wx_events()
+        self.assertEqual( notebook.widget.GetSelection(), pages.index(page) )
+        self.assertFalse( page in notebook._deferred_pages )
+        self.assertTrue( widget.widget is not None )
+
+    def test_property_panel_pages(self):
+        "Test that the property editors of a page are created when the page is selected"
+        widgets = self._open_all_widgets()
+        list_box = [w for w in widgets if w.WX_CLASS=="wxListBox"][0]
+        panel = common.property_panel
+        self._edit_properties(list_box, "Common")
+        # create the editors again; now with the Common page selected
+        panel.set_widget(list_box, force=True)
+        panel.edit_properties(list_box)
+        self.assertEqual( panel.pagenames[panel.notebook.GetSelection()], "Common" )
+        index = panel.pagenames.index("Widget")
+        self.assertTrue( index in panel._pending_pages )
+        self.assertTrue( list_box.properties["choices"].grid is None )
+        common.main.show_props_window("Widget")
+        self.assertFalse( index in panel._pending_pages )
+        self.assertEqual( panel.notebook.GetSelection(), index )
+        self.assertTrue( list_box.properties["choices"].grid is not None )
+
+    def test_bitmap_cache(self):
+        "Test that bitmap_cache re-loads modified files and evicts the least recently used bitmaps"
+        import bitmap_cache
+        loaded = []
+        def loader(path):
+            loaded.append(path)
+            return wx.Bitmap(16, 16)
+
+        paths = []
+        for i in range(4):
+            path = self._get_outputfile_path("bitmap_cache_%d.png"%i)
+            with open(path, "wb") as f: f.write(b"dummy")
+            paths.append( os.path.abspath(path) )
+
+        max_pixels = bitmap_cache.MAX_PIXELS
+        bitmap_cache.clear()
+        try:
+            bitmap = bitmap_cache.get_bitmap(paths[0], loader=loader)
+            self.assertTrue( bitmap_cache.get_bitmap(paths[0], loader=loader) is bitmap )
+            self.assertEqual( loaded, paths[:1] )
+            scaled = bitmap_cache.get_bitmap(paths[0], (8,8), loader=loader)
+            self.assertEqual( tuple(scaled.GetSize()), (8,8) )
+            self.assertEqual( len(loaded), 2 )
+
+            # a modified file is loaded again
+            mtime = os.path.getmtime(paths[0]) + 10
+            os.utime(paths[0], (mtime, mtime))
+            self.assertFalse( bitmap_cache.get_bitmap(paths[0], loader=loader) is bitmap )
+            self.assertEqual( len(loaded), 3 )
+
+            # missing files are not cached
+            missing = self._get_outputfile_path("bitmap_cache_missing.png")
+            bitmap_cache.get_bitmap(missing, loader=loader)
+            bitmap_cache.get_bitmap(missing, loader=loader)
+            self.assertEqual( len(loaded), 5 )
+
+            # the least recently used bitmaps are evicted
+            bitmap_cache.clear()
+            bitmap_cache.MAX_PIXELS = 3*16*16
+            del loaded[:]
+            for path in paths[:3]:
+                bitmap_cache.get_bitmap(path, loader=loader)
+            bitmap_cache.get_bitmap(paths[0], loader=loader)  # now paths[1] is the least recently used one
+            bitmap_cache.get_bitmap(paths[3], loader=loader)
+            self.assertEqual( loaded, paths )
+            self.assertEqual( len(bitmap_cache._cache), 3 )
+            self.assertEqual( bitmap_cache._pixels, 3*16*16 )
+            bitmap_cache.get_bitmap(paths[0], loader=loader)
+            bitmap_cache.get_bitmap(paths[1], loader=loader)
+            self.assertEqual( loaded, paths + paths[1:2] )
+        finally:
+            bitmap_cache.MAX_PIXELS = max_pixels
+            bitmap_cache.clear()
+
+    def _find_widgets_by_pos(self, w, x,y):
+        # the recursive hit test that was used before edit_windows.HitIndex
+        if w.HasMultiplePages():
+            page = w.GetPage(w.GetSelection())
+            x0,y0,width,height = w.GetRect()
+            return self._find_widgets_by_pos(page, x-x0,y-y0)
+        ret = []
+        if w.IsTopLevel():
+            x0,y0,width,height = w.GetClientRect()
+        else:
+            x0,y0,width,height = w.GetRect()
+        if x0 <= x <= x0+width and y0 <= y <= y0+height:
+            ret.append(w)
+        x -= x0
+        y -= y0
+        for c in w.GetChildren():
+            x0,y0,width,height = c.GetRect()
+            if x0 <= x <= x0+width and y0 <= y <= y0+height:
+                ret.append(c)
+            if isinstance(c, wx.ScrolledWindow):
+                ret += self._find_widgets_by_pos(c, x-x0,y-y0)
+            else:
+                ret += self._find_widgets_by_pos(c, x,y)
+        return ret
+
+    def _find_editor(self, widget, node):
+        if node.widget is None: return None
+        if widget is node.widget: return node
+        button = getattr(node, "_btn", None)
+        if button is not None and widget is button: return node
+        if hasattr(node.widget, "GetStaticBox") and widget is node.widget.GetStaticBox(): return node
+        for child in node.children or []:
+            if child is None: continue
+            found = self._find_editor(widget, child)
+            if found is not None: return found
+        return None
+
+    def test_hit_index(self):
+        "Test that HitIndex finds the same editors as the recursive hit test"
+        widgets = self._open_all_widgets()
+        notebook = [w for w in widgets if w.WX_CLASS=="wxNotebook" and w.name=="notebook_1"][0]
+        toplevel = notebook.toplevel_parent
+        width, height = toplevel.widget.GetClientSize()
+        for index in (0, 3):
+            notebook.select_page(index)
+            self._process_wx_events()
+            toplevel.invalidate_hit_index()
+            found = set()
+            for x in range(-5, width+5, 5):
+                for y in range(-5, height+5, 5):
+                    candidates = self._find_widgets_by_pos(toplevel.widget, x,y)
+                    expected = None
+                    while candidates and expected is None:
+                        expected = self._find_editor(candidates.pop(-1), toplevel)
+                    editor = toplevel.find_editor_by_pos(x,y)
+                    self.assertTrue( editor is expected, "%s,%s: %s instead of %s"%(x, y, editor, expected) )
+                    found.add(editor)
+            self.assertTrue( len(found)>5 )
+
     def stop(self):
         print("XXX")  # nothing to do
 
@@ -0,0 +1,147 @@
+"""
+Lightweight span tracing to find out where time is spent when loading, generating code and saving.
+
+Spans may be nested; for each span name, the number of calls, the total and the self time (i.e. without nested spans)
+are recorded. Tracing is enabled with the command line option --profile or with the preference 'profile'.
+The results can be written as flat table or in Chrome trace format (see chrome://tracing or https://ui.perfetto.dev).
+
+Usage:
+    with tracing.span("name"):
+        ...
+
+    @tracing.traced("name")
+    def function(...):
+        ...
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import atexit, functools, json, os, sys, threading, time
+
+
+enabled = False
+MAX_EVENTS = 1000000  # keep memory usage bounded; statistics will be recorded for all spans
+
+_clock = getattr(time, "perf_counter", time.time)
+_local = threading.local()
+_events = []  # for the trace: tuples (name, start, duration, thread id)
+_stats = {}   # name -> [calls, total time, self time]
+
+
+def enable(on=True):
+    global enabled
+    enabled = on
+
+
+def reset():
+    del _events[:]
+    _stats.clear()
+
+
+def _get_stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def begin(name):
+    "start a span; each call must be followed by a call to end()"
+    if not enabled: return
+    _get_stack().append( [name, _clock(), 0.0] )  # name, start, time of nested spans
+
+
+def end():
+    "end the span started last"
+    if not enabled: return
+    stack = _get_stack()
+    if not stack: return
+    name, start, nested = stack.pop()
+    duration = _clock() - start
+    if stack:
+        stack[-1][2] += duration
+    stat = _stats.get(name)
+    if stat is None:
+        stat = _stats[name] = [0, 0.0, 0.0]
+    stat[0] += 1
+    if not any(frame[0] == name for frame in stack):
+        stat[1] += duration  # for recursive calls, count the outermost only
+    stat[2] += duration - nested
+    if len(_events) < MAX_EVENTS:
+        _events.append( (name, start, duration, threading.current_thread().ident) )
+
+
+def get_depth():
+    "returns the number of open spans of the current thread; see unwind()"
+    return len(_get_stack())
+
+
+def unwind(depth):
+    "drop the spans that were started after get_depth() returned depth and not ended, e.g. after an exception"
+    del _get_stack()[depth:]
+
+
+class span(object):
+    "context manager for a span"
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        begin(self.name)
+
+    def __exit__(self, *args):
+        end()
+
+
+def traced(name):
+    "decorator to record each call of a function or method as span"
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            begin(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end()
+        return wrapper
+    return decorator
+
+
+def write_at_exit(filename):
+    "enable tracing and write the results to filename when the program exits; see write()"
+    enable()
+    atexit.register(write, filename)
+
+
+def get_table():
+    "returns the statistics as list of lines, sorted by self time"
+    ret = ["%-50s %10s %12s %12s\n" % ("Span", "Calls", "Total [ms]", "Self [ms]")]
+    for name, (calls, total, self_time) in sorted( _stats.items(), key=lambda item: -item[1][2] ):
+        ret.append( "%-50s %10d %12.3f %12.3f\n" % (name, calls, total*1000, self_time*1000) )
+    return ret
+
+
+def get_chrome_trace():
+    "returns the recorded spans as dict in Chrome trace event format"
+    pid = os.getpid()
+    t0 = min(event[1] for event in _events) if _events else 0.0
+    events = [{"name": name, "ph": "X", "ts": (start-t0)*1e6, "dur": duration*1e6, "pid": pid, "tid": tid}
+              for name, start, duration, tid in _events]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write(filename):
+    """Write the results: to a file with extension .json in Chrome trace format, otherwise as flat table;
+    '-' will print the table to stdout"""
+    if filename == "-":
+        sys.stdout.write( "".join(get_table()) )
+    elif filename.lower().endswith(".json"):
+        with open(filename, "w") as outfile:
+            json.dump(get_chrome_trace(), outfile)
+    else:
+        with open(filename, "w") as outfile:
+            outfile.write( "".join(get_table()) )
@@ -56,6 +56,7 @@ class WidgetTree(wx.TreeCtrl):#, Tree):
         self.Bind(wx.EVT_KEY_DOWN, self.on_key_down_event)
         #self.Bind(wx.EVT_CHAR_HOOK, self.on_char)  # on wx 2.8 the event will not be delivered to the child
         self.Bind(wx.EVT_TREE_DELETE_ITEM, self.on_delete_item)
+        self.Bind(wx.EVT_TREE_ITEM_EXPANDING, self.on_expanding)
 
         if self.GetSelection().IsOk():
             # on some platforms, an item is pre-selected -> trigger an update
@@ -365,7 +366,7 @@ class WidgetTree(wx.TreeCtrl):#, Tree):
                 # on GTK the above bool may return True even if the item is being deleted
                 return None
 
-    def add2(self, child, parent, index, item=None):
+    def add2(self, child, parent, index, item=None, expand=True):
         "insert an item for child into the list of parent's items; optionally re-use old item"
         image = self.images.get( child._get_tree_image(), -1)
         label = child._get_tree_label()
@@ -379,7 +380,7 @@ class WidgetTree(wx.TreeCtrl):#, Tree):
             child.item = item
             self.refresh(child)
         self._SetItemData(item, child)
-        if self.auto_expand:
+        if expand and self.auto_expand:
             self.Expand(parent.item)
         if DEBUG:
             print("added item", utilities.hx(item), child, child.item)
@@ -410,17 +411,18 @@ class WidgetTree(wx.TreeCtrl):#, Tree):
         return items
 
     def _build_children(self, editor, item, recursive=True):
-        # XXX a better algorithm would be nice
-        # currently it's checked from the start and from the end how many are matching; all inbetween are replaced
+        # it's checked from the start and from the end how many are matching; all inbetween are replaced
+        # this is linear in the number of children, so wide sizers are no problem
         if DEBUG: print("_build_children", editor)
         children = editor.get_all_children()
         items = self._get_children_items(editor.item)
         if DEBUG: print("children", children)
         if DEBUG: print("items", items)
+        child_ids = set( id(child) for child in children )
         item_editors = []
         for child_item in items:
             child = self._GetItemData(child_item)
-            if child is not None and (not children or not child in children):
+            if child is not None and not id(child) in child_ids:
                 self._SetItemData(child_item, None)
                 if child.item is child_item:
                     if DEBUG: print("removed child.item", utilities.hx(child), utilities.hx(child.item))
@@ -450,29 +452,72 @@ class WidgetTree(wx.TreeCtrl):#, Tree):
             for n in range( len(children) - len(item_editors) ):
                 index = match_beginning + n
                 child = children[index]
-                item = self.add2(child, parent=editor, index=index)
-                items.insert(index, item)
+                if index==len(items):
+                    item = self.add2(child, parent=editor, index=None, expand=False)  # append: no index lookup
+                    items.append(item)
+                else:
+                    item = self.add2(child, parent=editor, index=index, expand=False)
+                    items.insert(index, item)
+            if self.auto_expand:
+                self.Expand(editor.item)
         elif len(children) < len(item_editors):
             # remove items, right after match_beginning
-            for n in range( len(item_editors) - len(children) ):
-                index = match_beginning 
-                child_item = items[index]
+            count = len(item_editors) - len(children)
+            for child_item in items[match_beginning:match_beginning+count]:
                 self.Delete(child_item)
-                del items[match_beginning]
+            del items[match_beginning:match_beginning+count]
         if match_beginning+match_end<len(children):
             # length matches, re-use item in the middle
             for index in range(match_beginning, len(children)-match_end):
                 child = children[index]
-                item = self.add2(child, parent=editor, index=index, item=items[index])
-        
+                item = self.add2(child, parent=editor, index=index, item=items[index], expand=False)
+            if self.auto_expand:
+                self.Expand(editor.item)
+
+        if not children and self.ItemHasChildren(editor.item):
+            self.SetItemHasChildren(editor.item, False)  # there may have been children that were not displayed
+
         if not recursive:
             # update labels and images, called e.g. when notebook pages change
             for child in children:
                 self.refresh(child)
             return
         for child, item in zip(children, items):
+            if self._defer_children(child, item): continue
             self._build_children(child, item)
 
+    # populate collapsed nodes on demand ###############################################################################
+    def _defer_children(self, editor, item):
+        # while loading, the items for the children of collapsed nodes are created when the node is expanded
+        if self.auto_expand or self.IsExpanded(item) or self.GetChildrenCount(item, False): return False
+        if editor.get_all_children():
+            self.SetItemHasChildren(item, True)  # display expander
+        return True
+
+    def _populate(self, editor, item):
+        # create the items for the children; their children will be created on demand
+        auto_expand = self.auto_expand
+        self.auto_expand = False
+        try:
+            self._build_children(editor, item)
+        finally:
+            self.auto_expand = auto_expand
+
+    def on_expanding(self, event):
+        item = event.GetItem()
+        editor = self._GetItemData(item)
+        if editor is not None and not self.GetChildrenCount(item, False):
+            self._populate(editor, item)
+        event.Skip()
+
+    def ensure_item(self, editor):
+        "returns the item for editor; if the parent's children were not populated yet, this will be done now"
+        if editor.item is None and editor.parent is not None and self.ensure_item(editor.parent) is not None:
+            parent_item = editor.parent.item
+            if not self.GetChildrenCount(parent_item, False):
+                self._populate(editor.parent, parent_item)
+        return editor.item
+
     def build(self, editor=None, recursive=True, freeze=False):
         if DEBUG:
             print("="*80)
@@ -528,6 +573,7 @@ class WidgetTree(wx.TreeCtrl):#, Tree):
             self.SetItemImage(editor.item, image)
 
     def select_item(self, editor):
+        self.ensure_item(editor)
         self.skip_select = True
         self.SelectItem(editor.item)
         self.skip_select = False
@@ -555,7 +601,7 @@ class WidgetTree(wx.TreeCtrl):#, Tree):
 
     def set_current_widget(self, editor):
         # interface from common.set_focused_widget
-        if editor is None or editor is self.cur_widget or editor.item is None: return
+        if editor is None or editor is self.cur_widget or self.ensure_item(editor) is None: return
         self.skip_select = True
         self.SelectItem(editor.item)
         if not self.IsExpanded(editor.item) and (not hasattr(self, "HasFocus") or not self.HasFocus()):
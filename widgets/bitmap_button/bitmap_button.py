@@ -28,12 +28,12 @@ class EditBitmapButton(BitmapMixin, ManagedBase, EditStylesMixin):
         BitmapMixin.__init__(self)
 
         # initialise instance properties
-        self.bitmap          = np.BitmapProperty(bmp_file)
-        self.disabled_bitmap = np.BitmapPropertyD("")
-        self.pressed_bitmap  = np.BitmapPropertyD(min_version=(3,0))
-        self.current_bitmap  = np.BitmapPropertyD(min_version=(3,0))
-        self.focus_bitmap    = np.BitmapPropertyD(min_version=(3,0))
-        self.default         = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "bitmap",          np.BitmapProperty(bmp_file) )
+        self.add_property( "disabled_bitmap", np.BitmapPropertyD("") )
+        self.add_property( "pressed_bitmap",  np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "current_bitmap",  np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "focus_bitmap",    np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "default",         np.CheckBoxProperty(False, default_value=False) )
 
     def create_widget(self):
         bmp = self.get_preview_obj_bitmap()
@@ -24,6 +24,7 @@ class EditButton(BitmapMixin, ManagedBase, EditStylesMixin):
                    "bitmap", "disabled_bitmap", "pressed_bitmap", "current_bitmap", "focus_bitmap",
                    "default", "style", "bitmap_dir"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    PROPERTY_DEPENDENCIES = {"stockitem": ["id"]}  # for stock items, the id is wxID_...
 
     _PROPERTY_HELP = {"default":"This sets the button to be the default item for the toplevel window.\n"
                                 "(On Windows this is only supported for Dialogs.)",
@@ -40,19 +41,20 @@ class EditButton(BitmapMixin, ManagedBase, EditStylesMixin):
         BitmapMixin.__init__(self)
 
         # initialise instance properties
-        self.label     = np.TextProperty(label, default_value="", multiline="grow")
-        self.default   = np.CheckBoxProperty(False, default_value=False)
-        self.stockitem = np.ListBoxPropertyD(self.STOCKITEMS[0], choices=self.STOCKITEMS)
+        self.add_property( "label",     np.TextProperty(label, default_value="", multiline="grow") )
+        self.add_property( "default",   np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "stockitem", np.ListBoxPropertyD(self.STOCKITEMS[0], choices=self.STOCKITEMS) )
 
-        self.bitmap          = np.BitmapPropertyD(min_version=(3,0))
-        self.disabled_bitmap = np.BitmapPropertyD(min_version=(3,0))
-        self.pressed_bitmap  = np.BitmapPropertyD(min_version=(3,0))
-        self.current_bitmap  = np.BitmapPropertyD(min_version=(3,0))
-        self.focus_bitmap    = np.BitmapPropertyD(min_version=(3,0))
+        self.add_property( "bitmap",          np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "disabled_bitmap", np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "pressed_bitmap",  np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "current_bitmap",  np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "focus_bitmap",    np.BitmapPropertyD(min_version=(3,0)) )
 
         values = [wx.LEFT, wx.RIGHT, wx.TOP, wx.BOTTOM]
         aliases = ["wxLEFT", "wxRIGHT", "wxTOP", "wxBOTTOM"]
-        p = self.bitmap_dir = np.RadioProperty(wx.LEFT, values, columns=4, aliases=aliases, default_value=wx.LEFT)
+        p = np.RadioProperty(wx.LEFT, values, columns=4, aliases=aliases, default_value=wx.LEFT)
+        self.add_property( "bitmap_dir", p )
         p.min_version = (3,0)
         p.blocked = True
 
@@ -81,7 +83,6 @@ class EditButton(BitmapMixin, ManagedBase, EditStylesMixin):
             if self.properties["stockitem"].is_active():
                 self.properties["label"].set_blocked(True)
                 new_id = "wxID_" + self.stockitem
-                if common.history: common.history.monitor_property( self.properties["id"] )
                 self.properties["id"].set( new_id, deactivate=True )
                 #self.properties["id"].default_value = new_id  # avoid this value to be written to XML
 
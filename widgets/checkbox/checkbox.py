@@ -19,6 +19,7 @@ class EditCheckBox(ManagedBase, EditStylesMixin):
     WX_CLASS = "wxCheckBox"
     _PROPERTIES = ["Widget", "label", "checked", "style"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    PROPERTY_DEPENDENCIES = {"style": ["checked"]}  # the third state requires wxCHK_3STATE
     _PROPERTY_LABELS = {"checked":"wxCheckBox state"}
 
     # Convert the position of "checked" RadioProperty to wxCheckBoxState
@@ -30,12 +31,13 @@ class EditCheckBox(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.label = np.TextProperty(label, multiline="grow")
+        self.add_property( "label", np.TextProperty(label, multiline="grow") )
 
         # value: Checkbox state (0 = unchecked, 1 = checked, 2 = undetermined)
         values = [0,1,2]
         labels = [_('Unchecked'), _('Checked'), _('Undetermined')]
-        self.value = np.IntRadioProperty(0, values, labels, columns=3, default_value=0, name="checked") # rename to value?
+        # rename to value?
+        self.add_property( "value", np.IntRadioProperty(0, values, labels, columns=3, default_value=0, name="checked") )
 
     def create_widget(self):
         self.widget = wx.CheckBox(self.parent_window.widget, wx.ID_ANY, self.label, style=self.style)
@@ -53,7 +55,6 @@ class EditCheckBox(ManagedBase, EditStylesMixin):
             else:
                 checked_p.enable_item(2, False)
                 if checked_p.value == 2:
-                    if common.history: common.history.monitor_property( checked_p )
                     checked_p.set(0)
 
         if not modified or "checked" in modified:
@@ -21,13 +21,14 @@ class EditChoice(ManagedBase):
     WX_CLASS = "wxChoice"
     _PROPERTIES = ["Widget", "selection", "choices"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    PROPERTY_DEPENDENCIES = {"choices": ["selection"]}  # selection will be adjusted to the range
 
     def __init__(self, name, parent, index, choices):
         ManagedBase.__init__(self, name, parent, index)
 
         # initialise instance properties
-        self.selection = np.SpinProperty(0, val_range=(-1,len(choices)-1), immediate=True )
-        self.choices = ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] )
+        self.add_property( "selection", np.SpinProperty(0, val_range=(-1,len(choices)-1), immediate=True ) )
+        self.add_property( "choices", ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] ) )
 
     def create_widget(self):
         choices = [c[0] for c in self.choices]
@@ -58,7 +59,6 @@ class EditChoice(ManagedBase):
         if not modified or "selection" in modified or set_selection:
             set_selection = True
             if self.selection>max_selection:
-                if common.history: common.history.monitor_property( self.properties['selection'] )
                 self.properties['selection'].set(max_selection)
         if self.widget and set_selection and self.widget.GetSelection()!=self.selection:
             self.widget.SetSelection(self.selection)
@@ -21,6 +21,7 @@ class EditComboBox(ManagedBase, EditStylesMixin):
     WX_CLASS = "wxComboBox"
     _PROPERTIES = ["Widget", "style", "selection", "choices"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    PROPERTY_DEPENDENCIES = {"choices": ["selection"]}  # selection will be adjusted to the range
 
     recreate_on_style_change = True
 
@@ -29,8 +30,8 @@ class EditComboBox(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.selection = np.SpinProperty(-1, val_range=(-1,len(choices)-1), immediate=True )
-        self.choices = ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] )
+        self.add_property( "selection", np.SpinProperty(-1, val_range=(-1,len(choices)-1), immediate=True ) )
+        self.add_property( "choices", ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] ) )
 
     def create_widget(self):
         choices = [c[0] for c in self.choices]
@@ -63,7 +64,6 @@ class EditComboBox(ManagedBase, EditStylesMixin):
         if not modified or "selection" in modified or set_selection:
             set_selection = True
             if self.selection>max_selection:
-                if common.history: common.history.monitor_property( self.properties['selection'] )
                 self.properties['selection'].set(max_selection)
         if self.widget and set_selection and self.widget.GetSelection()!=self.selection:
             self.widget.SetSelection(self.selection)
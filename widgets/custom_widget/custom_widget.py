@@ -76,11 +76,12 @@ class CustomWidget(ManagedBase):
 
         # initialise instance properties
         cols      = [('Arguments', np.GridProperty.STRING)]
-        self.arguments   = ArgumentsProperty( [], cols )
-        self.custom_ctor = np.TextPropertyD("", name="custom_constructor", strip=True, default_value="")
+        self.add_property( "arguments",   ArgumentsProperty( [], cols ) )
+        self.add_property( "custom_ctor", np.TextPropertyD("", name="custom_constructor", strip=True,
+                                                           default_value="") )
 
-        self.show_design = np.CheckBoxProperty(False, default_value=False)
-        self.show_preview = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "show_design", np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "show_preview", np.CheckBoxProperty(False, default_value=False) )
         if not config.preferences.allow_custom_widgets:
             self.properties["show_design"].set_blocked()
             self.properties["show_preview"].set_blocked()
@@ -73,11 +73,11 @@ class EditDialog(BitmapMixin, TopLevelBase, EditStylesMixin):
         self.properties["style"].set(style)
 
         # initialise instance properties
-        self.icon        = np.BitmapPropertyD("")
-        self.affirmative = AffirmativePropertyD("", default_value="OK")
-        self.escape      = AffirmativePropertyD("", default_value="CANCEL")
-        self.centered    = np.CheckBoxProperty(False, default_value=False)
-        self.sizehints   = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "icon",        np.BitmapPropertyD("") )
+        self.add_property( "affirmative", AffirmativePropertyD("", default_value="OK") )
+        self.add_property( "escape",      AffirmativePropertyD("", default_value="CANCEL") )
+        self.add_property( "centered",    np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "sizehints",   np.CheckBoxProperty(False, default_value=False) )
 
     def create_widget(self):
         if self.parent:
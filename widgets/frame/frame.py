@@ -67,16 +67,16 @@ class EditFrame(BitmapMixin, TopLevelBase, EditStylesMixin):
         self.properties["style"].set(style)
 
         # initialise instance properties
-        self.icon      = np.BitmapPropertyD("")
-        self.centered  = np.CheckBoxProperty(False, default_value=False)
-        self.sizehints = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "icon",      np.BitmapPropertyD("") )
+        self.add_property( "centered",  np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "sizehints", np.CheckBoxProperty(False, default_value=False) )
 
-        self.menubar   = BarProperty("MenuBar")
-        self.toolbar   = BarProperty("ToolBar")
+        self.add_property( "menubar",   BarProperty("MenuBar") )
+        self.add_property( "toolbar",   BarProperty("ToolBar") )
         if "statusbar" in self.PROPERTIES:  # not for MDIChildFrame
-            self.statusbar = BarProperty("StatusBar")
+            self.add_property( "statusbar", BarProperty("StatusBar") )
 
-        self.min_size  = np.SizePropertyD( "-1, -1", default_value="-1, -1" )
+        self.add_property( "min_size",  np.SizePropertyD( "-1, -1", default_value="-1, -1" ) )
 
     def create_widget(self):
         parent = None
@@ -26,7 +26,7 @@ class EditGauge(ManagedBase, EditStylesMixin):
         if style: self.properties["style"].set(style)
 
         # initialise instance properties
-        self.range = np.SpinProperty(10, val_range=(0,10000000), immediate=True)
+        self.add_property( "range", np.SpinProperty(10, val_range=(0,10000000), immediate=True) )
 
     def create_widget(self):
         self.widget = wx.Gauge(self.parent_window.widget, wx.ID_ANY, self.range, style=self.style)
@@ -34,7 +34,7 @@ class EditGenericCalendarCtrl(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.default = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "default", np.CheckBoxProperty(False, default_value=False) )
 
     def create_widget(self):
         # TODO add all the other parameters for the GenericCalendarCtrl especially style=self.style and the initial date
@@ -155,35 +155,35 @@ class EditGrid(ManagedBase):
         ManagedBase.__init__(self, name, parent, index)
 
         # instance properties
-        self.create_grid = np.CheckBoxProperty(True)
+        self.add_property( "create_grid", np.CheckBoxProperty(True) )
         columns = [['A', -1], ['B', -1], ['C', -1]]
-        self.columns = GridColsProperty([])
+        self.add_property( "columns", GridColsProperty([]) )
         rows =  [[str(n+1),-1] for n in range(10)]
-        self.rows = GridRowsProperty( rows )
+        self.add_property( "rows", GridRowsProperty( rows ) )
         self.properties["rows_number"] = self.properties["rows"]  # backward compatibility
         #self.rows_number        = np.SpinProperty(10, immediate=True)
-        self.row_label_size     = np.SpinPropertyD(30, default_value=30, immediate=True)
-        self.col_label_size     = np.SpinPropertyD(30, default_value=30, immediate=True)
+        self.add_property( "row_label_size",     np.SpinPropertyD(30, default_value=30, immediate=True) )
+        self.add_property( "col_label_size",     np.SpinPropertyD(30, default_value=30, immediate=True) )
 
         if config.use_gui:
             font = self._build_from_font( compat.wx_SystemSettings_GetFont(wx.SYS_DEFAULT_GUI_FONT) )
             font[1] = 'default'
         else:
             font = (9, 'default', 'normal', 'normal', 0, 'Segoe UI')
-        self.label_font = np.FontPropertyD(tuple(font))
-        self.cell_font = np.FontPropertyD(tuple(font))
+        self.add_property( "label_font", np.FontPropertyD(tuple(font)) )
+        self.add_property( "cell_font", np.FontPropertyD(tuple(font)) )
 
-        self.lines_color        = np.ColorPropertyD('#000000', default_value='#000000')
-        self.label_bg_color     = np.ColorPropertyD('#C0C0C0', default_value='#C0C0C0')
+        self.add_property( "lines_color",        np.ColorPropertyD('#000000', default_value='#000000') )
+        self.add_property( "label_bg_color",     np.ColorPropertyD('#C0C0C0', default_value='#C0C0C0') )
 
-        self.enable_editing     = np.CheckBoxProperty(True)
-        self.enable_grid_lines  = np.CheckBoxProperty(True)
-        self.enable_col_resize  = np.CheckBoxProperty(True)
-        self.enable_row_resize  = np.CheckBoxProperty(True)
-        self.enable_grid_resize = np.CheckBoxProperty(True)
+        self.add_property( "enable_editing",     np.CheckBoxProperty(True) )
+        self.add_property( "enable_grid_lines",  np.CheckBoxProperty(True) )
+        self.add_property( "enable_col_resize",  np.CheckBoxProperty(True) )
+        self.add_property( "enable_row_resize",  np.CheckBoxProperty(True) )
+        self.add_property( "enable_grid_resize", np.CheckBoxProperty(True) )
 
-        self.selection_mode = np.RadioProperty(0, [0,1,2], ["Cells","Rows","Columns"], aliases=self._SELECTION_MODES,
-                                               columns=3)
+        self.add_property( "selection_mode", np.RadioProperty(0, [0,1,2], ["Cells","Rows","Columns"],
+                                                              aliases=self._SELECTION_MODES, columns=3) )
 
     def create_widget(self):
         self.widget = Grid(self.parent_window.widget, wx.ID_ANY)
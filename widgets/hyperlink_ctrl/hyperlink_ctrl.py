@@ -38,9 +38,9 @@ class EditHyperlinkCtrl(ManagedBase, EditStylesMixin):
         self.properties["style"]._one_required = ['wxHL_ALIGN_CENTRE', 'wxHL_ALIGN_LEFT', 'wxHL_ALIGN_RIGHT']
 
         # initialise instance properties
-        self.label = np.TextProperty(label, multiline="grow")
-        self.url   = np.TextProperty("")
-        self.attribute = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "label", np.TextProperty(label, multiline="grow") )
+        self.add_property( "url",   np.TextProperty("") )
+        self.add_property( "attribute", np.CheckBoxProperty(False, default_value=False) )
 
     def create_widget(self):
         style = self.style
@@ -24,8 +24,8 @@ class EditListBox(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.selection = np.SpinProperty(-1, val_range=len(choices)-1, immediate=True )
-        self.choices   = ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] )
+        self.add_property( "selection", np.SpinProperty(-1, val_range=len(choices)-1, immediate=True ) )
+        self.add_property( "choices",   ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] ) )
 
     def create_widget(self):
         choices = [c[0] for c in self.choices]
@@ -27,8 +27,8 @@ class EditListCtrl(ManagedBase, EditStylesMixin):
     def __init__(self, name, parent, index, style=wx.LC_REPORT | wx.BORDER_SUNKEN):
         ManagedBase.__init__(self, name, parent, index)
         EditStylesMixin.__init__(self, style)
-        self.columns = GridColsProperty([])
-        self.rows_number = np.SpinProperty(0, immediate=True, default_value=0)
+        self.add_property( "columns", GridColsProperty([]) )
+        self.add_property( "rows_number", np.SpinProperty(0, immediate=True, default_value=0) )
         self.properties["style"]._ignore_names = {"wxLC_VIRTUAL"}
         self.properties["style"]._one_required = ["wxLC_ICON", "wxLC_SMALL_ICON", "wxLC_LIST", "wxLC_REPORT"]
 
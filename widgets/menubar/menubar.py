@@ -594,7 +594,7 @@ class EditMenuBar(EditBase):#, PreviewMixin):
     def __init__(self, name, parent):
         EditBase.__init__(self, name, parent, "_menubar")
 
-        self.menus = MenuProperty()
+        self.add_property( "menus", MenuProperty() )
         self.window_id = None  # just a dummy for code generation
 
         self._mb = None  # the real menubar
@@ -743,7 +743,7 @@ class EditTopLevelMenuBar(EditMenuBar, PreviewMixin):
     def __init__(self, name, parent, class_):
         EditBase.__init__(self, name, parent, None, class_)
 
-        self.menus = MenuProperty()
+        self.add_property( "menus", MenuProperty() )
         self.window_id = None  # just a dummy for code generation
 
         self._mb = None  # the real menubar
@@ -108,11 +108,13 @@ class EditNotebook(ManagedBase, EditStylesMixin):
         self.pages = None  # on loading from XML, this will be used
         tabs = []  # list of page labels of this notebook
         tab_cols = [('Tab label', np.GridProperty.STRING)]
-        self.tabs = NotebookPagesProperty(tabs, tab_cols)
-        self.no_custom_class = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "tabs", NotebookPagesProperty(tabs, tab_cols) )
+        self.add_property( "no_custom_class", np.CheckBoxProperty(False, default_value=False) )
+        self._deferred_pages = set()  # pages where the widgets of the children will be created when they are shown
 
     def create_widget(self):
         self.widget = wx.Notebook( self.parent_window.widget, wx.ID_ANY, style=self.style )
+        self.widget.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
 
     def child_widgets_created(self, level):
         # at this time, all children should be available
@@ -127,6 +129,37 @@ class EditNotebook(ManagedBase, EditStylesMixin):
         misc.set_focused_widget(self)
         event.Skip()
 
+    # create the content of pages when they are displayed the first time ##############################################
+    def defer_child_widgets(self, child, level):
+        # when the notebook is created, only the content of the first page is created; the others are created on demand
+        if level==0 or not self.widget or not self.widget.GetPageCount(): return False
+        if not isinstance(child, panel.EditPanel): return False
+        self._deferred_pages.add(child)
+        return True
+
+    def create_page_widgets(self, index):
+        "create the widgets on page index, if this was deferred"
+        page = self.children[index] if 0 <= index < len(self.children) else None
+        if page is None or not page in self._deferred_pages: return
+        self._deferred_pages.remove(page)
+        if not page.widget: return
+        for child in page.get_all_children():
+            child.create()
+        # the page's size may affect the size of the notebook
+        if hasattr(self.parent, "set_item_best_size"):
+            self.parent.set_item_best_size( self, size=self.widget.GetBestSize() )
+        self.layout()
+
+    def select_page(self, index):
+        self.create_page_widgets(index)
+        if self.widget.GetSelection()!=index:
+            self.widget.SetSelection(index)
+
+    def on_page_changed(self, event):
+        if event.GetEventObject() is self.widget:  # not for nested notebooks
+            self.create_page_widgets( event.GetSelection() )
+        event.Skip()
+
     ####################################################################################################################
     def vs_insert_tab(self, index):
         "inserts or adds a page"
@@ -296,6 +329,7 @@ class EditNotebook(ManagedBase, EditStylesMixin):
 
     ####################################################################################################################
     def destroying_child_widget(self, child, index):
+        self._deferred_pages.discard(child)
         self.widget.RemovePage(index) # deletes the specified page, without deleting the associated window
 
     def child_widget_created(self, child, level):
@@ -327,6 +361,7 @@ class EditNotebook(ManagedBase, EditStylesMixin):
 
     ####################################################################################################################
     def destroy_widget(self, level, later=True):
+        self._deferred_pages.clear()
         if self.widget: self.widget.DeleteAllPages()
         ManagedBase.destroy_widget(self, level, later)
 
@@ -28,8 +28,8 @@ class PanelBase(EditStylesMixin):
         EditStylesMixin.__init__(self, style, 'wxPanel')
 
         # initialise properties
-        self.scrollable      = np.CheckBoxProperty(False, default_value=False)
-        self.scroll_rate = prop = np.IntPairPropertyD( "10, 10" )
+        self.add_property( "scrollable",      np.CheckBoxProperty(False, default_value=False) )
+        prop = self.add_property( "scroll_rate", np.IntPairPropertyD( "10, 10" ) )
         prop.set_blocked(True)
 
     def get_editor_name(self):
@@ -28,14 +28,14 @@ class EditRadioBox(ManagedBase):
         self.static_box = None
         
         # initialise instance properties
-        self.label     = np.TextProperty("", multiline="grow")
-        self.dimension = np.SpinProperty(major_dim)
-        self.selection = np.SpinProperty(0, val_range=(0,len(choices)-1), immediate=True )
-        self.choices   = ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] )
+        self.add_property( "label",     np.TextProperty("", multiline="grow") )
+        self.add_property( "dimension", np.SpinProperty(major_dim) )
+        self.add_property( "selection", np.SpinProperty(0, val_range=(0,len(choices)-1), immediate=True ) )
+        self.add_property( "choices",   ChoicesProperty( choices, [(_('Label'), np.GridProperty.STRING)] ) )
         style = style or wx.RA_SPECIFY_COLS
         styles = [wx.RA_SPECIFY_ROWS, wx.RA_SPECIFY_COLS]
         aliases = ["wxRA_SPECIFY_ROWS","wxRA_SPECIFY_COLS"]  # labels and aliases
-        self.style = np.RadioProperty(style, styles, aliases, aliases=aliases, columns=2)
+        self.add_property( "style", np.RadioProperty(style, styles, aliases, aliases=aliases, columns=2) )
 
         self.buttons = None  # list of wx.RadioButton
 
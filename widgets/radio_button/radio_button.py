@@ -27,8 +27,8 @@ class EditRadioButton(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.label   = np.TextProperty(label, multiline="grow")
-        self.clicked = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "label",   np.TextProperty(label, multiline="grow") )
+        self.add_property( "clicked", np.CheckBoxProperty(False, default_value=False) )
 
     def create_widget(self):
         self.widget = wxGladeRadioButton(self.parent_window.widget, wx.ID_ANY, self.label)
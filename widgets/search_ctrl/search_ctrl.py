@@ -29,11 +29,11 @@ class EditSearchCtrl(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialize instance properties
-        self.value = np.TextProperty("")
-        self.descriptive_text = np.TextPropertyD("Search", default_value="")
-        self.search_button = np.CheckBoxProperty(True, default_value=True)
-        self.cancel_button = np.CheckBoxProperty(True, default_value=True)
-        self.max_length = np.SpinPropertyD(80, val_range=(1,1000), default_value=-1)
+        self.add_property( "value", np.TextProperty("") )
+        self.add_property( "descriptive_text", np.TextPropertyD("Search", default_value="") )
+        self.add_property( "search_button", np.CheckBoxProperty(True, default_value=True) )
+        self.add_property( "cancel_button", np.CheckBoxProperty(True, default_value=True) )
+        self.add_property( "max_length", np.SpinPropertyD(80, val_range=(1,1000), default_value=-1) )
 
     def create_widget(self):
         value = self.value
@@ -24,8 +24,8 @@ class EditSpacer(ManagedBase):
         ManagedBase.__init__(self, 'spacer', parent, index)
 
         # initialise instance properties
-        self.width  = np.SpinProperty(width,  immediate=True)
-        self.height = np.SpinProperty(height, immediate=True)
+        self.add_property( "width",  np.SpinProperty(width,  immediate=True) )
+        self.add_property( "height", np.SpinProperty(height, immediate=True) )
 
     def create_widget(self):
         style = wx.SIMPLE_BORDER | wx.FULL_REPAINT_ON_RESIZE
@@ -21,6 +21,7 @@ class EditSpinButton(ManagedBase, EditStylesMixin):
     WX_CLASS = 'wxSpinButton'
     _PROPERTIES = ["Widget", "range", "value", "style"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    PROPERTY_DEPENDENCIES = {"range": ["value"]}  # value will be adjusted to the range
     recreate_on_style_change = True
 
     def __init__(self, name, parent, index, style='wxSP_VERTICAL'):
@@ -28,8 +29,8 @@ class EditSpinButton(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self, style)
 
         # initialise instance properties
-        self.range = np.IntRangePropertyA( "0, 100" )
-        self.value = np.SpinPropertyA(0, val_range=(0,100), immediate=True)
+        self.add_property( "range", np.IntRangePropertyA( "0, 100" ) )
+        self.add_property( "value", np.SpinPropertyA(0, val_range=(0,100), immediate=True) )
 
     def create_widget(self):
         self.widget = wx.SpinButton(self.parent_window.widget, wx.ID_ANY, style=self.style)
@@ -42,10 +43,9 @@ class EditSpinButton(ManagedBase, EditStylesMixin):
             self.widget.SetRange(mi, ma)
             self.properties["value"].set_range(mi,ma)
 
-        if not modified or "value" in modified or "range" in modified:
+        if not modified or "value" in modified:
             # check that value is inside range
             value_p = self.properties["value"]
-            if common.history: common.history.monitor_property( value_p )
             if value_p.is_active():
                 mi,ma = self.properties["range"].get_tuple()
                 value = value_p.get()
@@ -20,14 +20,15 @@ class EditSpinCtrl(ManagedBase, EditStylesMixin):
     WX_CLASS = 'wxSpinCtrl'
     _PROPERTIES = ["Widget", "range", "value", "style"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    PROPERTY_DEPENDENCIES = {"range": ["value"]}  # value will be adjusted to the range
 
     def __init__(self, name, parent, index):
         ManagedBase.__init__(self, name, parent, index)
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.range = np.IntRangePropertyA( "0, 100" )
-        self.value = np.SpinPropertyA(0, val_range=(0,100), immediate=True, default_value="")
+        self.add_property( "range", np.IntRangePropertyA( "0, 100" ) )
+        self.add_property( "value", np.SpinPropertyA(0, val_range=(0,100), immediate=True, default_value="") )
 
     def create_widget(self):
         mi,ma = self.properties["range"].get_tuple()
@@ -55,10 +56,9 @@ class EditSpinCtrl(ManagedBase, EditStylesMixin):
             self.widget.SetRange(mi, ma)
             self.properties["value"].set_range(mi,ma)
 
-        if not modified or "value" in modified or "range" in modified:
+        if not modified or "value" in modified:
             # check that value is inside range
             value_p = self.properties["value"]
-            if common.history: common.history.monitor_property( value_p )
             if value_p.is_active():
                 mi,ma = self.properties["range"].get_tuple()
                 value = value_p.get()
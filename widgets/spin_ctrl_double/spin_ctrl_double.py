@@ -20,6 +20,7 @@ class EditSpinCtrlDouble(ManagedBase, EditStylesMixin):
     WX_CLASS = 'wxSpinCtrlDouble'
     _PROPERTIES = ["Widget", "range", "value", "increment", "digits", "style"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    PROPERTY_DEPENDENCIES = {"range": ["value"]}  # value will be adjusted to the range
     _PROPERTY_HELP = { "digits": "Depending on your wx version you may need to set this explicitely.\n"
                                  "E.g. if it's undefined with wxPython >=4.1.1 you can only enter integers\n"
                                  "while on older versions you could enter any float number in this case.\n"
@@ -30,10 +31,11 @@ class EditSpinCtrlDouble(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.range = np.FloatRangePropertyA( "0.0, 100.0" )
-        self.value = np.SpinDoublePropertyA(0, val_range=(0.0,100.0), immediate=True, default_value="")
-        self.increment = np.SpinDoublePropertyD(1.0, val_range=(0.0,100.0), immediate=True, default_value=1.0)
-        self.digits = np.SpinPropertyA(2, val_range=(0,20), immediate=True)
+        self.add_property( "range", np.FloatRangePropertyA( "0.0, 100.0" ) )
+        self.add_property( "value", np.SpinDoublePropertyA(0, val_range=(0.0,100.0), immediate=True, default_value="") )
+        self.add_property( "increment", np.SpinDoublePropertyD(1.0, val_range=(0.0,100.0), immediate=True,
+                                                               default_value=1.0) )
+        self.add_property( "digits", np.SpinPropertyA(2, val_range=(0,20), immediate=True) )
 
     def create_widget(self):
         mi,ma = self.properties["range"].get_tuple()
@@ -72,10 +74,9 @@ class EditSpinCtrlDouble(ManagedBase, EditStylesMixin):
         if not modified or "digits" in modified and self.widget:
             self.widget.SetDigits(self.digits)
 
-        if not modified or "value" in modified or "range" in modified:
+        if not modified or "value" in modified:
             # check that value is inside range
             value_p = self.properties["value"]
-            if common.history: common.history.monitor_property( value_p )
             if value_p.is_active():
                 mi,ma = self.properties["range"].get_tuple()
                 value = value_p.get()
@@ -53,18 +53,19 @@ class EditSplitterWindow(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.no_custom_class = np.CheckBoxProperty(False, default_value=False)
-        self.sash_pos = np.SpinPropertyD(0, default_value="")
+        self.add_property( "no_custom_class", np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "sash_pos", np.SpinPropertyD(0, default_value="") )
         if hasattr(wx, "SpinCtrlDouble"):
-            self.sash_gravity = np.SpinDoublePropertyD(0.5, (0.0,1.0), default_value=0.0, immediate=True)
+            self.add_property( "sash_gravity", np.SpinDoublePropertyD(0.5, (0.0,1.0), default_value=0.0,
+                                                                      immediate=True) )
         else:
-            self.sash_gravity = np.FloatPropertyD(0.5, (0.0,1.0), default_value=0.0)
-        self.min_pane_size = np.SpinPropertyA(20)
+            self.add_property( "sash_gravity", np.FloatPropertyD(0.5, (0.0,1.0), default_value=0.0) )
+        self.add_property( "min_pane_size", np.SpinPropertyA(20) )
 
         # hidden properties: orientation string, window names window_1, window_2
-        self.orientation = np.Property(orientation)
-        self.window_1 = ChildWidgetNameProperty(0)
-        self.window_2 = ChildWidgetNameProperty(1)
+        self.add_property( "orientation", np.Property(orientation) )
+        self.add_property( "window_1", ChildWidgetNameProperty(0) )
+        self.add_property( "window_2", ChildWidgetNameProperty(1) )
 
     def _get_label(self, index):
         if self.orientation=="wxSPLIT_VERTICAL":
@@ -30,8 +30,8 @@ class EditStaticBitmap(BitmapMixin, ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.bitmap    = np.BitmapProperty(bmp_file)
-        self.attribute = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "bitmap",    np.BitmapProperty(bmp_file) )
+        self.add_property( "attribute", np.CheckBoxProperty(False, default_value=False) )
 
     def create_widget(self):
         bmp = self.get_preview_obj_bitmap()
@@ -27,7 +27,7 @@ class EditStaticLine(ManagedBase, EditStylesMixin):
         ManagedBase.__init__(self, name, parent, index)
         EditStylesMixin.__init__(self, style)
 
-        self.attribute = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "attribute", np.CheckBoxProperty(False, default_value=False) )
 
     def create_widget(self):
         self.widget = wx.StaticLine(self.parent_window.widget, wx.ID_ANY, style=self.style)
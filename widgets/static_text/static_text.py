@@ -29,9 +29,9 @@ class EditStaticText(ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance properties
-        self.label     = np.TextProperty(label, multiline="grow")
-        self.attribute = np.CheckBoxProperty(False, default_value=False)
-        self.wrap      = np.SpinPropertyD(100, val_range=(1,100000), immediate=True, default_value=-1)
+        self.add_property( "label",     np.TextProperty(label, multiline="grow") )
+        self.add_property( "attribute", np.CheckBoxProperty(False, default_value=False) )
+        self.add_property( "wrap",      np.SpinPropertyD(100, val_range=(1,100000), immediate=True, default_value=-1) )
 
     def create_widget(self):
         # up to 0.8 GenStaticText was used; it seems that nowadays StaticText handles mouse events on gtk as well
@@ -30,14 +30,14 @@ class EditToggleButton(BitmapMixin, ManagedBase, EditStylesMixin):
         EditStylesMixin.__init__(self)
 
         # initialise instance variable
-        self.label = np.TextProperty(label, multiline="grow")
-        self.value = np.CheckBoxProperty(False, default_value=False)
+        self.add_property( "label", np.TextProperty(label, multiline="grow") )
+        self.add_property( "value", np.CheckBoxProperty(False, default_value=False) )
         # bitmaps are only for >= 3.0
-        self.bitmap          = np.BitmapPropertyD(min_version=(3,0))
-        self.disabled_bitmap = np.BitmapPropertyD(min_version=(3,0))
-        self.pressed_bitmap  = np.BitmapPropertyD(min_version=(3,0))
-        self.current_bitmap  = np.BitmapPropertyD(min_version=(3,0))
-        self.focus_bitmap    = np.BitmapPropertyD(min_version=(3,0))
+        self.add_property( "bitmap",          np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "disabled_bitmap", np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "pressed_bitmap",  np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "current_bitmap",  np.BitmapPropertyD(min_version=(3,0)) )
+        self.add_property( "focus_bitmap",    np.BitmapPropertyD(min_version=(3,0)) )
 
     def create_widget(self):
         self.widget = wx.ToggleButton(self.parent_window.widget, wx.ID_ANY, self.label, style=self.style)
@@ -479,11 +479,11 @@ class EditToolBar(EditBase, PreviewMixin, EditStylesMixin, BitmapMixin):
         self.parent.properties["toolbar"].set(True, notify=False)
 
     def _init_properties(self):
-        self.tools = ToolsProperty()  # incl. the Edit button
-        self.bitmapsize = np.IntPairPropertyD('16, 15', default_value='16, 15')
-        self.margins    = np.IntPairPropertyD('0, 0',   default_value='0, 0')
-        self.packing    = np.SpinPropertyD(1, val_range=(0,100), default_value=1, immediate=True)
-        self.separation = np.SpinPropertyD(5, val_range=(0,100), default_value=5, immediate=True)
+        self.add_property( "tools", ToolsProperty() )  # incl. the Edit button
+        self.add_property( "bitmapsize", np.IntPairPropertyD('16, 15', default_value='16, 15') )
+        self.add_property( "margins",    np.IntPairPropertyD('0, 0',   default_value='0, 0') )
+        self.add_property( "packing",    np.SpinPropertyD(1, val_range=(0,100), default_value=1, immediate=True) )
+        self.add_property( "separation", np.SpinPropertyD(5, val_range=(0,100), default_value=5, immediate=True) )
 
         self.window_id = None  # just a dummy for code generation
 
@@ -666,7 +666,7 @@ class EditToolBar(EditBase, PreviewMixin, EditStylesMixin, BitmapMixin):
 
     def properties_changed(self, modified):
         actions = EditBase.properties_changed(self, modified)
-        # widget properties modified; trigger updates
+        # widget properties modified; trigger updates; for nested calls, actions is empty: the running call handles them
         if self.widget:
             if config.debugging: print("Actions", actions)
             if "recreate_parent" in actions:
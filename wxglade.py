@@ -44,7 +44,7 @@ def my_displayhook(value):
 sys.displayhook = my_displayhook
 
 
-import common, config, compat, log
+import common, config, compat, log, tracing
 
 
 def parse_command_line():
@@ -63,6 +63,7 @@ def parse_command_line():
                 "             <http://www.opensource.org/licenses/mit-license.php>") % config.get_version()
     usage = _("Usage: wxglade <WXG File>             start the wxGlade GUI\n"
               " or:   wxglade <Options> <WXG File>   generate code from command line\n"
+              " or:   wxglade --find <QUERY> <WXG File>  print widgets matching QUERY\n"
               " or:   wxglade --version              show programs version number and exit\n"
               " or:   wxglade -h|--help              show this help message and exit")
     parser = optparse.OptionParser( add_help_option=False, version=version, usage=usage )
@@ -77,6 +78,24 @@ def parse_command_line():
     parser.add_option("-c", "--use-config", dest="rc_file",
                             help=_("use specified wxgladerc config file instead of the default one") )
 
+    parser.add_option("--dry-run", dest="dry_run", action="store_true", default=False,
+                            help=_("(optional) don't write any files, just report which ones would change; "
+                                   "exit status is 1 if any file would change") )
+    parser.add_option("--diff", dest="diff", action="store_true", default=False,
+                            help=_("(optional) like --dry-run, but print a unified diff for each file") )
+    parser.add_option("--verify", dest="verify", action="store_true", default=False,
+                            help=_("(optional) check the generated code: compile Python, parse XRC and run 'perl -c' "
+                                   "or 'g++ -fsyntax-only' if available; exit status is 1 on errors") )
+    parser.add_option("--cache-dir", metavar="PATH", dest="cache_dir",
+                            help=_("(optional) directory to cache generated code of unchanged classes in; may be shared "
+                                   "between processes and machines; default: $WXGLADE_CODEGEN_CACHE") )
+    parser.add_option("--find", metavar="QUERY", dest="find",
+                            help=_("print the widgets matching QUERY, e.g. 'button' or 'class:wxButton handler:on_'; "
+                                   "exit status is 1 if there are no matches") )
+    parser.add_option("--profile", metavar="FILE", dest="profile",
+                            help=_("record timing of loading, code generation and saving; write it to FILE on exit: "
+                                   "in Chrome trace format for *.json, as table otherwise or to stdout for '-'") )
+
     options, args = parser.parse_args()
 
     # print epilog because OptionParser.epilog isn't available to Python 2.3
@@ -107,7 +126,17 @@ def parse_command_line():
     #     - one file            -> cmdline code generation
     #     - no / > one files    -> usage
     #  - no language            -> start gui
-    if options.language:
+    if (options.dry_run or options.diff or options.verify) and not options.language:
+        msg = _("Options --dry-run, --diff and --verify require option -g.\n")
+        logging.error(msg)
+        parser.print_help()
+        sys.exit(msg)
+    if options.find and options.language:
+        msg = _("Option --find can't be combined with option -g.\n")
+        logging.error(msg)
+        parser.print_help()
+        sys.exit(msg)
+    if options.language or options.find:
         if len(args) == 1:
             options.start_gui = False
         elif len(args) == 0:
@@ -126,6 +155,8 @@ def parse_command_line():
     # check output path
     if options.output:
         options.output = os.path.normpath(os.path.expanduser(options.output))
+    if options.cache_dir:
+        config.codegen_cache_dir = os.path.normpath(os.path.expanduser(options.cache_dir))
 
     return options
 
@@ -252,13 +283,42 @@ def _guiless_open_app(filename):
 
     
 
-def command_line_code_generation(filename, language, out_path=None):
+def _report_dry_run(results, diff=False):
+    "print the results of a dry run; returns True if any file would be changed"
+    changed_any = False
+    for filename, changed, lines in results:
+        changed_any = changed_any or changed
+        if diff:
+            if lines: sys.stdout.write( "".join(lines) )
+        else:
+            print( "%s: %s" % (filename, _("would change") if changed else _("unchanged")) )
+    return changed_any
+
+
+def _report_verification(results):
+    "print the results of codegen.verify.verify_files(); returns True if there were no errors"
+    ok = True
+    for filename, status, message in results:
+        if status == "failed":
+            ok = False
+            print( "%s: %s\n%s" % (filename, _("verification failed"), message) )
+        elif status == "skipped":
+            print( "%s: %s (%s)" % (filename, _("verification skipped"), message) )
+    print( _("%d of %d files verified successfully") % (len([r for r in results if r[1]=="OK"]), len(results)) )
+    return ok
+
+
+def command_line_code_generation(filename, language, out_path=None, dry_run=False, diff=False, verify=False):
     """Starts a code generator without starting the GUI.
 
     filename: Name of wxg file to generate code from
     language: Code generator language
-    out_path: output file / output directory"""
+    out_path: output file / output directory
+    dry_run:  don't write files, just print which files would change; exit status 1 if any
+    diff:     like dry_run, but print a unified diff for each file
+    verify:   check the generated code; exit status 1 on errors"""
     import application, tree
+    from codegen.verify import verify_files
     # Instead of instantiating a main.wxGlade() object, that is
     # derived from wx.App, we must do the equivalent work.  The
     # following lines are taken from main.wxGlade().OnInit() and
@@ -275,7 +335,20 @@ def command_line_code_generation(filename, language, out_path=None):
         if language not in common.code_writers:
             raise ValueError('Code writer for "%s" is not available.'%language)
         common.root.properties["language"].set(language)
-        common.root.generate_code(out_path=out_path)
+        if dry_run or diff:
+            results = common.root.generate_code(out_path=out_path, dry_run=True)
+            ok = results is not None and not _report_dry_run(results, diff)
+            if results is not None and verify:
+                writer = common.code_writers[language]
+                ok = _report_verification( verify_files(list(writer.generated_files), writer.generated_files) ) and ok
+            # code generation failed, code is not up to date or verification failed
+            if not config.testing: sys.exit(0 if ok else 1)
+            return ok
+        writer = common.root.generate_code(out_path=out_path)
+        if verify:
+            ok = writer is not None and _report_verification( verify_files(writer.output_files) )
+            if not config.testing: sys.exit(0 if ok else 1)
+            return ok
     #except errors.WxgBaseException as inst:
         #if config.debugging: raise
         #logging.error(inst)
@@ -290,6 +363,55 @@ def command_line_code_generation(filename, language, out_path=None):
         sys.exit(0)
 
 
+def command_line_find(filename, query):
+    """Load the project and print path and class of the widgets matching query, best matches first.
+    Exit status is 1 if there are no matches; when testing, the matching widgets are returned."""
+    import application, search
+    common.init_preferences()
+    common.root = application.Application()
+    if not _guiless_open_app(filename):
+        sys.exit(1)
+    nodes = search.find(query)
+    for node in nodes:
+        print( "%s\t%s" % (node.get_path(), node.WX_CLASS) )
+    if not config.testing:
+        sys.exit(0 if nodes else 1)
+    return nodes
+
+
+def generate_code_in_memory(project, language=None, out_path=None, previous_contents=None):
+    """Generate code without writing files and without any other file system access, e.g. for build tools.
+    wxGlade needs to be initialised via init_stage1(None) and init_stage2(False) first.
+
+    project:           name of a .wxg file, XML string or application.Application instance
+    language:          code generator language; default is the language stored in the project
+    out_path:          output file / output directory; default is the path stored in the project
+    previous_contents: dict file name -> previous content (string) for projects with 'Keep user code';
+                       use the file names as returned by a previous call; files that are not included are new
+
+    returns an OrderedDict file name -> generated content (string); raises ValueError on errors"""
+    import application
+    if isinstance(project, application.Application):
+        app = project
+    else:
+        if common.root is None:
+            common.root = application.Application()
+        if project.lstrip().startswith("<"):
+            project = [project]  # XML string
+        if not _guiless_open_app(project):
+            raise ValueError('Project could not be loaded; see log for details')
+        app = common.root
+
+    if language is not None and language != app.language:
+        if language not in common.code_writers:
+            raise ValueError('Code writer for "%s" is not available.'%language)
+        app.properties["language"].set(language)
+
+    # same checks and messages as for code generation from the GUI
+    writer = app._generate_code(out_path=out_path, previous_contents=previous_contents or {})
+    return writer.get_generated_files()
+
+
 def init_stage1(options):
     """Initialise paths for wxGlade (first stage)
     Initialisation is split because the test suite doesn't work with proper initialised paths."""
@@ -374,6 +496,9 @@ def run_main():
     # check command line parameters first
     options = parse_command_line()
 
+    if options.profile:
+        tracing.write_at_exit(options.profile)
+
     # initialise wxGlade (first stage and second stage)
     init_stage1(options)
     init_stage2(options.start_gui)
@@ -382,8 +507,11 @@ def run_main():
         # late import of main (imported wx) for using wxversion  in init_stage2()
         import main
         main.main(options.filename)
+    elif options.find:
+        command_line_find(options.filename, options.find)
     else:
-        command_line_code_generation( filename=options.filename, language=options.language, out_path=options.output )
+        command_line_code_generation( filename=options.filename, language=options.language, out_path=options.output,
+                                      dry_run=options.dry_run, diff=options.diff, verify=options.verify )
 
 if __name__ == "__main__":
     run_main()
@@ -15,7 +15,7 @@ from xml.sax.handler import ContentHandler
 
 import time
 
-import common, config
+import common, config, tracing
 
 
 class XmlParsingError(SAXException):
@@ -47,15 +47,25 @@ class XmlParser(ContentHandler):
         ## unicode file name" (http://bugs.python.org/issue11159).
         ## This bug causes a UnicodeEncodeError if the SAX XML parser wants to store an unicode filename internally.
         ## That's not a general file handling issue because the parameter source is an open file already.
-        self.parser.parse(source)
+        depth = tracing.get_depth()
+        try:
+            self.parser.parse(source)
+        except:
+            tracing.unwind(depth)  # spans of objects that were not closed
+            raise
 
     def parse_string(self, source):
-        if isinstance(source, list):
-            for line in source:
-                self.parser.feed(line)
-        else:
-            self.parser.feed(source)
-        self.parser.close()
+        depth = tracing.get_depth()
+        try:
+            if isinstance(source, list):
+                for line in source:
+                    self.parser.feed(line)
+            else:
+                self.parser.feed(source)
+            self.parser.close()
+        except:
+            tracing.unwind(depth)
+            raise
 
     def setDocumentLocator(self, locator):
         self.locator = locator
@@ -228,6 +238,8 @@ class XmlWidgetBuilder(XmlParser):
         if not self._appl_started:
             raise XmlParsingError(_("the root of the tree must be <application>"))
         if name == 'object':
+            # one span per object, including the children; closed in endElement
+            tracing.begin( "load %s"%(attrs.get("base") or attrs.get("class")) )
             top = self.top()
             if top: top.notify_owner()
             # create the object and push it on the appropriate stacks
@@ -258,16 +270,10 @@ class XmlWidgetBuilder(XmlParser):
             app.properties_changed( sorted(self._delayed_app_properties.keys()) )
             return
         if name == 'object':
-            # remove last object from Stack
-            obj = self._objects.pop()
-            obj.notify_owner()
-            if obj.IS_SIZERITEM or obj.IS_SLOT:
-                return
-            if obj.sizeritem and obj.obj.parent.IS_SIZER:
-                # XXX just check whether obj.obj has these properties
-                obj.obj.copy_properties( obj.sizeritem, ("option","flag","border","span") )
-                obj.obj.properties["flag"]._check_value()
-            obj.obj.on_load()
+            try:
+                self._end_object()
+            finally:
+                tracing.end()
         else:
             # end of a property or error
             prop = self._curr_prop
@@ -300,6 +306,18 @@ class XmlWidgetBuilder(XmlParser):
             except AttributeError:
                 pass
 
+    def _end_object(self):
+        # remove last object from Stack
+        obj = self._objects.pop()
+        obj.notify_owner()
+        if obj.IS_SIZERITEM or obj.IS_SLOT:
+            return
+        if obj.sizeritem and obj.obj.parent.IS_SIZER:
+            # XXX just check whether obj.obj has these properties
+            obj.obj.copy_properties( obj.sizeritem, ("option","flag","border","span") )
+            obj.obj.properties["flag"]._check_value()
+        obj.obj.on_load()
+
     def characters(self, data):
         if not data: return
         if self._curr_prop is None:
@@ -708,10 +726,10 @@ class Sizeritem(np.PropertyOwner):
     SIZER_PROPERTIES = ["proportion","span","border","flag"]
     def __init__(self):
         np.PropertyOwner.__init__(self)
-        self.proportion = np.LayoutProportionProperty(0)
-        self.span = np.LayoutSpanProperty((1,1))
-        self.border = np.SpinProperty(0)
-        self.flag = np.ManagedFlags(None, name="sizeritem_flags")
+        self.add_property( "proportion", np.LayoutProportionProperty(0) )
+        self.add_property( "span", np.LayoutSpanProperty((1,1)) )
+        self.add_property( "border", np.SpinProperty(0) )
+        self.add_property( "flag", np.ManagedFlags(None, name="sizeritem_flags") )
 
     def on_load(self, child=None):
         pass
\ No newline at end of file